@@ -0,0 +1,138 @@
+"""Throughput benchmark for the crawl analyzer on large synthetic crawls.
+
+Compares ``build_analysis`` with a copy of the original multi-pass implementation
+(``urlparse`` per link, per-keyword CTA scan, list-based tokenization). Run from the
+repository root::
+
+    python -m benchmarks.bench_analyzer --pages 200 --links 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from collections import Counter
+from urllib.parse import urljoin, urlparse, urlsplit
+
+from webcrawlagent.crawler.analyzer import CTA_KEYWORDS, build_analysis
+from webcrawlagent.crawler.extractor import CrawlResult, PageSnapshot
+
+ROOT = "https://bench.example.com"
+VOCABULARY = [
+    "platform", "pricing", "analytics", "customers", "integrations", "enterprise", "security",
+    "dashboard", "workflow", "automation", "reporting", "the", "and", "with", "your", "this",
+    "that", "from", "about", "teams", "data", "2025", "sign-up", "real-time", "insights",
+    "onboarding", "support", "features",
+]
+PATHS = [
+    "pricing", "features", "about", "blog/post", "contact", "demo", "docs/start", "careers",
+    "signup", "legal/terms", "products/alpha", "products/beta", "customers/case-study",
+    "book-a-call", "get-quote",
+]
+
+
+def synthetic_crawl(pages: int, links: int, words: int, seed: int = 7) -> CrawlResult:
+    """``pages`` pages with ``links`` links (about a quarter external) and ``words`` words each."""
+    rng = random.Random(seed)
+    snapshots = []
+    for index in range(pages):
+        page_url = f"{ROOT}/page/{index}"
+        hrefs = [
+            f"https://partner{rng.randrange(50)}.example.org/{rng.choice(PATHS)}"
+            if rng.random() < 0.25
+            else f"/{rng.choice(PATHS)}/{rng.randrange(1000)}?ref={index}"
+            for _ in range(links)
+        ]
+        absolute = [urljoin(page_url, href) for href in hrefs]
+        text = " ".join(rng.choice(VOCABULARY) for _ in range(words))
+        snapshots.append(
+            PageSnapshot(
+                url=page_url,
+                title=f"Page {index}",
+                description="",
+                headings=[f"Heading {index}"],
+                links=absolute,
+                text=text,
+                word_count=words,
+                token_estimate=words,
+                netlocs=[urlsplit(link).netloc for link in absolute],
+                word_counts=Counter(text.split(" ")),
+            )
+        )
+    return CrawlResult(root_url=ROOT, pages=snapshots)
+
+
+def legacy_analysis(result: CrawlResult) -> dict:
+    """The pre-accumulator analyzer's hot loops, kept for comparison."""
+    root_netloc = urlparse(result.root_url).netloc
+    internal = external = 0
+    keywords: Counter[str] = Counter()
+    ctas: set[str] = set()
+    for page in result.pages:
+        for link in page.links:
+            if urlparse(link).netloc == root_netloc:
+                internal += 1
+            else:
+                external += 1
+        tokens = [token.lower() for token in page.text.split()]
+        keywords.update([token for token in tokens if token.isalpha() and len(token) > 3])
+        for link in page.links:
+            lower = link.lower()
+            if any(keyword in lower for keyword in CTA_KEYWORDS):
+                ctas.add(link)
+    return {"internal": internal, "external": external, "ctas": len(ctas)}
+
+
+def bench(name: str, analyze, crawl: CrawlResult, rounds: int) -> dict:
+    analyze(crawl)  # warm-up
+    started = time.perf_counter()
+    for _ in range(rounds):
+        analyze(crawl)
+    elapsed = time.perf_counter() - started
+    links = sum(len(page.links) for page in crawl.pages) * rounds
+    return {
+        "analyzer": name,
+        "seconds": round(elapsed, 4),
+        "ms_per_crawl": round(elapsed / rounds * 1000, 2),
+        "links_per_second": round(links / elapsed),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the crawl analyzer")
+    parser.add_argument("--pages", type=int, default=200, help="Pages per synthetic crawl")
+    parser.add_argument("--links", type=int, default=100, help="Links per page")
+    parser.add_argument("--words", type=int, default=1500, help="Words of text per page")
+    parser.add_argument("--rounds", type=int, default=5, help="Analyses per implementation")
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable JSON")
+    args = parser.parse_args()
+
+    crawl = synthetic_crawl(args.pages, args.links, args.words)
+    analysis = build_analysis(crawl)
+    legacy = legacy_analysis(crawl)
+    assert (analysis.internal_links, analysis.external_links, len(analysis.ctas)) == (
+        legacy["internal"],
+        legacy["external"],
+        legacy["ctas"],
+    ), "analyzers disagree"
+    results = [
+        bench("legacy", legacy_analysis, crawl, args.rounds),
+        bench("accumulator", build_analysis, crawl, args.rounds),
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    total_links = args.pages * args.links
+    print(f"Crawl: {args.pages} pages, {total_links} links, {args.words} words/page")
+    for result in results:
+        print(
+            f"  {result['analyzer']:<12} {result['ms_per_crawl']:>9.2f} ms/crawl"
+            f" {result['links_per_second']:>12,} links/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""Offline end-to-end benchmark: crawl a local fixture site and summarize it with a stub LLM.
+
+Runs ``CrawlAgentService.run`` in-process, the CLI as subprocesses, or ``/api/analyze``
+through the ASGI app, against a generated site (``fixture_site``) and a Gemini/Grok
+stand-in (``stub_llm``). Reports pages/sec, per-stage p50/p95, peak RSS and LLM tokens.
+Run from the repository root::
+
+    python -m benchmarks.bench_e2e --target service --runs 6 --concurrency 2 --pages 40
+    python -m benchmarks.bench_e2e --env PIPELINE_ENABLED=false --out baseline.json
+
+Static pages are fetched over the HTTP tier (``FETCH_STRATEGY=http-first``) and the
+browser pool starts only when a page escalates, so the default ``--js-ratio 0`` runs
+without Chromium. With SPA-shell pages, or ``--env FETCH_STRATEGY=browser``, Chromium
+must be installed (``playwright install chromium``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+from benchmarks.fixture_site import FixtureServer, FixtureSite
+from benchmarks.stub_llm import StubLLMServer
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None  # type: ignore[assignment]
+
+STAGES = [
+    "site_meta_ms", "crawl_ms", "analysis_ms", "summary_ms", "report_ms", "report_render_ms",
+    "report_wait_ms",
+]
+
+
+@dataclass(slots=True)
+class RunRecord:
+    url: str
+    ok: bool
+    latency_ms: float
+    pages: int = 0
+    timings: dict[str, float] = field(default_factory=dict)
+    summary_stats: dict[str, Any] | None = None
+    error: str | None = None
+
+
+def bench_env(args: argparse.Namespace, site_url: str, llm_url: str, reports: str) -> dict:
+    """Settings for an offline run; ``--env`` overrides are applied last."""
+    env = {
+        "LLM_PROVIDER": args.provider,
+        "GEMINI_API_KEY": "stub",
+        "GEMINI_BASE_URL": f"{llm_url}/v1beta",
+        "GROK_API_KEY": "stub",
+        "GROK_BASE_URL": f"{llm_url}/v1",
+        "LLM_CACHE_ENABLED": "false",
+        "FETCH_STRATEGY": "http-first",
+        "CRAWL_DELAY_SECONDS": "0",
+        "CRAWL_MAX_PAGES": str(args.max_pages),
+        "CRAWL_CONCURRENCY": str(args.crawl_concurrency),
+        "CRAWL_HOST_CONCURRENCY": str(args.crawl_concurrency),
+        "REPORT_OUTPUT_DIR": reports,
+    }
+    for item in args.env:
+        key, _, value = item.partition("=")
+        env[key.strip()] = value
+    return env
+
+
+def run_urls(site_url: str, runs: int, same_url: bool) -> list[str]:
+    """Distinct URLs by default so the API's request coalescing doesn't merge runs."""
+    if same_url:
+        return [f"{site_url}/"] * runs
+    return [f"{site_url}/?run={index}" for index in range(runs)]
+
+
+async def run_service(urls: list[str], concurrency: int) -> list[RunRecord]:
+    from webcrawlagent.app.service import CrawlAgentService
+    from webcrawlagent.config import Settings
+
+    service = CrawlAgentService(Settings())
+    await service.start()
+    limit = asyncio.Semaphore(concurrency)
+
+    async def one(url: str) -> RunRecord:
+        async with limit:
+            started = time.perf_counter()
+            try:
+                result = await service.run(url)
+            except Exception as exc:  # recorded per run
+                return RunRecord(url, False, _elapsed_ms(started), error=repr(exc))
+            return RunRecord(
+                url,
+                True,
+                _elapsed_ms(started),
+                pages=len(result.crawl.pages),
+                timings=dict(result.timings),
+                summary_stats=asdict(result.summary_stats) if result.summary_stats else None,
+            )
+
+    try:
+        return await asyncio.gather(*(one(url) for url in urls))
+    finally:
+        await service.shutdown()
+
+
+async def run_api(urls: list[str], concurrency: int) -> list[RunRecord]:
+    import httpx
+
+    from webcrawlagent.app.dependencies import shutdown_service, startup_service
+    from webcrawlagent.main import create_app
+
+    # ASGITransport does not send lifespan events, so start the shared service by hand.
+    app = create_app()
+    await startup_service()
+    limit = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async def one(client: httpx.AsyncClient, url: str) -> RunRecord:
+        async with limit:
+            started = time.perf_counter()
+            try:
+                response = await client.post("/api/analyze", json={"url": url})
+            except Exception as exc:  # recorded per run
+                return RunRecord(url, False, _elapsed_ms(started), error=repr(exc))
+            latency = _elapsed_ms(started)
+            if response.status_code != 200:
+                return RunRecord(url, False, latency, error=f"HTTP {response.status_code}")
+            body = response.json()
+            return RunRecord(
+                url,
+                True,
+                latency,
+                pages=int(body["metrics"].get("total_pages", 0)),
+                timings=body.get("timings") or {},
+                summary_stats=body.get("summary_stats"),
+            )
+
+    try:
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=None
+        ) as client:
+            return await asyncio.gather(*(one(client, url) for url in urls))
+    finally:
+        await shutdown_service()
+
+
+async def run_cli(urls: list[str], concurrency: int) -> list[RunRecord]:
+    """One ``webcrawlagent.cli`` process per run; only wall time is observable."""
+    limit = asyncio.Semaphore(concurrency)
+
+    async def one(url: str) -> RunRecord:
+        async with limit:
+            started = time.perf_counter()
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-m",
+                "webcrawlagent.cli",
+                "--url",
+                url,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await process.communicate()
+            latency = _elapsed_ms(started)
+            if process.returncode:
+                lines = stderr.decode(errors="replace").strip().splitlines()
+                reason = next((line for line in reversed(lines) if "Error" in line), "")
+                return RunRecord(url, False, latency, error=f"exit {process.returncode}: {reason}")
+            return RunRecord(url, True, latency)
+
+    return await asyncio.gather(*(one(url) for url in urls))
+
+
+RUNNERS = {"service": run_service, "api": run_api, "cli": run_cli}
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return round(ordered[rank - 1], 1)
+
+
+def stage_table(records: list[RunRecord]) -> dict[str, dict[str, float]]:
+    samples: dict[str, list[float]] = {"total_ms": [record.latency_ms for record in records]}
+    for stage in STAGES:
+        values = [record.timings[stage] for record in records if stage in record.timings]
+        if values:
+            samples[stage] = values
+    for key in ("map_ms", "map_tail_ms", "reduce_ms"):
+        values = [
+            record.summary_stats[key]
+            for record in records
+            if record.summary_stats and key in record.summary_stats
+        ]
+        if values:
+            samples[f"llm_{key}"] = values
+    return {
+        name: {
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "max": round(max(values), 1),
+        }
+        for name, values in samples.items()
+    }
+
+
+def peak_rss_mb() -> dict[str, float | None]:
+    """High-water RSS of this process and of its reaped children (CLI runs, report workers)."""
+    if resource is None:
+        return {"self": None, "children": None}
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024  # bytes on macOS, KiB elsewhere
+    return {
+        "self": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale, 1),
+        "children": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / scale, 1),
+    }
+
+
+def app_tokens(records: list[RunRecord]) -> dict[str, int]:
+    totals = {"prompt": 0, "output": 0}
+    for record in records:
+        stats = record.summary_stats or {}
+        totals["prompt"] += stats.get("map_prompt_tokens", 0) + stats.get("reduce_prompt_tokens", 0)
+        totals["output"] += stats.get("map_output_tokens", 0) + stats.get("reduce_output_tokens", 0)
+    return totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Offline end-to-end benchmark")
+    parser.add_argument("--target", choices=sorted(RUNNERS), default="service")
+    parser.add_argument("--runs", type=int, default=4, help="Analyses to run")
+    parser.add_argument("--concurrency", type=int, default=1, help="Analyses in flight at once")
+    parser.add_argument("--same-url", action="store_true", help="Analyse one URL every run")
+    parser.add_argument("--pages", type=int, default=40, help="Pages in the fixture site")
+    parser.add_argument("--fanout", type=int, default=8, help="Links per fixture page")
+    parser.add_argument("--js-ratio", type=float, default=0.0, help="Share of SPA-shell pages")
+    parser.add_argument("--words", type=int, default=600, help="Words of text per page")
+    parser.add_argument("--page-delay", type=float, default=0.0, help="Seconds per page response")
+    parser.add_argument("--max-pages", type=int, default=20, help="CRAWL_MAX_PAGES per run")
+    parser.add_argument("--crawl-concurrency", type=int, default=4, help="CRAWL_CONCURRENCY")
+    parser.add_argument("--provider", choices=["gemini", "grok"], default="gemini")
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="Stub LLM seconds per call")
+    parser.add_argument("--llm-jitter", type=float, default=0.0, help="Extra random stub latency")
+    parser.add_argument(
+        "--env", action="append", default=[], metavar="KEY=VALUE", help="Extra setting override"
+    )
+    parser.add_argument("--out", help="Write the JSON results to this path")
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable JSON")
+    args = parser.parse_args()
+
+    site = FixtureSite(
+        pages=args.pages,
+        fanout=args.fanout,
+        js_ratio=args.js_ratio,
+        words=args.words,
+        delay=args.page_delay,
+    )
+    with (
+        FixtureServer(site) as fixture,
+        StubLLMServer(latency=args.llm_latency, jitter=args.llm_jitter) as llm,
+        tempfile.TemporaryDirectory() as reports,
+    ):
+        env = bench_env(args, fixture.url, llm.url, reports)
+        # Settings are read from the environment: in-process targets and CLI children alike.
+        os.environ.update(env)
+        urls = run_urls(fixture.url, args.runs, args.same_url)
+        started = time.perf_counter()
+        records = asyncio.run(RUNNERS[args.target](urls, args.concurrency))
+        wall = time.perf_counter() - started
+        stub_stats = llm.snapshot()
+        fixture_requests = fixture.requests
+
+    succeeded = [record for record in records if record.ok]
+    pages = sum(record.pages for record in succeeded)
+    results = {
+        "target": args.target,
+        "config": {key: value for key, value in vars(args).items() if key not in {"json", "out"}},
+        "env": env | {"REPORT_OUTPUT_DIR": "<tmp>"},
+        "runs": len(records),
+        "failures": len(records) - len(succeeded),
+        "wall_seconds": round(wall, 3),
+        "runs_per_second": round(len(succeeded) / wall, 3),
+        # The CLI target cannot see page counts, so fall back to fixture hits.
+        "pages_per_second": round((pages or fixture_requests) / wall, 2),
+        "stages": stage_table(succeeded) if succeeded else {},
+        "peak_rss_mb": peak_rss_mb(),
+        "llm_tokens": {"app_estimate": app_tokens(succeeded), "stub": stub_stats},
+        "fixture_requests": fixture_requests,
+        "errors": sorted({record.error for record in records if record.error}),
+    }
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(
+        f"{args.target}: {results['runs']} runs ({results['failures']} failed) in"
+        f" {results['wall_seconds']}s, {results['pages_per_second']} pages/s,"
+        f" {results['runs_per_second']} runs/s"
+    )
+    for stage, row in results["stages"].items():
+        print(
+            f"  {stage:<18} p50 {row['p50']:>9.1f}  p95 {row['p95']:>9.1f}"
+            f"  max {row['max']:>9.1f}"
+        )
+    rss = results["peak_rss_mb"]
+    print(f"  peak RSS MB: self {rss['self']}, children {rss['children']}")
+    print(
+        f"  LLM: {stub_stats['requests']} calls, {stub_stats['prompt_tokens']} prompt /"
+        f" {stub_stats['output_tokens']} output tokens"
+    )
+    for error in results["errors"]:
+        print(f"  error: {error}")
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Pages-per-second benchmark for the HTML parser backends.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_parsers --rounds 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from webcrawlagent.crawler.parsers import PARSERS, get_parser
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+BASE_URL = "https://bench.example.com/"
+
+
+def load_corpus(directory: Path = FIXTURES_DIR) -> dict[str, str]:
+    paths = sorted(directory.glob("*.html"))
+    return {path.name: path.read_text(encoding="utf-8") for path in paths}
+
+
+def bench_parser(name: str, corpus: dict[str, str], rounds: int) -> dict:
+    parser = get_parser(name)
+    for html in corpus.values():  # warm-up
+        parser.parse(html, BASE_URL)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for html in corpus.values():
+            parser.parse(html, BASE_URL)
+    elapsed = time.perf_counter() - started
+    pages = rounds * len(corpus)
+    sample = {file: parser.parse(html, BASE_URL) for file, html in corpus.items()}
+    return {
+        "parser": name,
+        "pages": pages,
+        "seconds": round(elapsed, 4),
+        "pages_per_second": round(pages / elapsed, 1),
+        "links": {file: len(content.links) for file, content in sample.items()},
+        "headings": {file: len(content.headings) for file, content in sample.items()},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends")
+    parser.add_argument("--rounds", type=int, default=20, help="Passes over the corpus")
+    parser.add_argument("--fixtures", type=Path, default=FIXTURES_DIR)
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable JSON")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.fixtures)
+    results = []
+    for name in PARSERS:
+        try:
+            results.append(bench_parser(name, corpus, args.rounds))
+        except RuntimeError as exc:  # optional backend not installed
+            results.append({"parser": name, "skipped": str(exc)})
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    size_kb = sum(len(html) for html in corpus.values()) / 1024
+    print(f"Corpus: {len(corpus)} fixtures, {size_kb:.0f} KiB, {args.rounds} rounds")
+    for result in results:
+        if "skipped" in result:
+            print(f"  {result['parser']:<11} skipped: {result['skipped']}")
+        else:
+            print(f"  {result['parser']:<11} {result['pages_per_second']:>9.1f} pages/s")
+
+
+if __name__ == "__main__":
+    main()
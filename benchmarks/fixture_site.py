@@ -0,0 +1,154 @@
+"""A generated website served from a local thread, for offline crawl benchmarks.
+
+Pages are deterministic for a given seed. ``js_ratio`` of them ship an empty SPA shell
+that only renders its content from a script, so the HTTP tier escalates them to the
+browser exactly like a client-rendered site. The site also serves ``robots.txt`` and
+``sitemap.xml``.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+from dataclasses import dataclass, field
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SECTIONS = [
+    "pricing", "features", "products", "customers", "about", "blog", "docs", "careers",
+    "contact", "solutions", "integrations", "security", "legal",
+]
+WORDS = [
+    "platform", "teams", "analytics", "workflow", "automation", "customers", "secure",
+    "pricing", "enterprise", "insights", "dashboard", "integrate", "reports", "scale",
+    "onboarding", "support", "the", "and", "with", "your", "for", "data", "faster", "cloud",
+]
+
+
+@dataclass(slots=True)
+class FixtureSite:
+    """``pages`` pages, each linking to ``fanout`` others and carrying ``words`` words.
+
+    Every page response is held back by ``delay`` seconds to mimic server latency.
+    """
+
+    pages: int = 50
+    fanout: int = 8
+    js_ratio: float = 0.0
+    words: int = 600
+    seed: int = 1
+    delay: float = 0.0
+    documents: dict[str, str] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        rng = random.Random(self.seed)
+        paths = ["/"] + [
+            f"/{SECTIONS[index % len(SECTIONS)]}/{index}" for index in range(1, self.pages)
+        ]
+        for index, path in enumerate(paths):
+            targets = rng.sample(paths, min(self.fanout, len(paths)))
+            links = "".join(
+                f'<li><a href="{target}">{escape(_label(target))}</a></li>' for target in targets
+            )
+            text = " ".join(rng.choice(WORDS) for _ in range(self.words))
+            title = f"{_label(path)} | Fixture Co"
+            if index and rng.random() < self.js_ratio:
+                self.documents[path] = _spa_page(title, links, text)
+            else:
+                self.documents[path] = _static_page(title, links, text)
+
+    def robots_txt(self) -> str:
+        return "User-agent: *\nDisallow: /legal/\n"
+
+    def sitemap_xml(self, origin: str) -> str:
+        entries = "".join(f"<url><loc>{origin}{path}</loc></url>" for path in self.documents)
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}</urlset>'
+        )
+
+
+class FixtureServer:
+    """Serves a ``FixtureSite`` on ``127.0.0.1`` from a daemon thread."""
+
+    def __init__(self, site: FixtureSite, port: int = 0):
+        self.site = site
+        self.requests = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), _handler_for(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> FixtureServer:
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> FixtureServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+
+def _handler_for(server: FixtureServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # http.server API
+            server.requests += 1
+            site = server.site
+            path = self.path.split("?", 1)[0].split("#", 1)[0]
+            if path == "/robots.txt":
+                self._send(200, site.robots_txt(), "text/plain")
+            elif path == "/sitemap.xml":
+                self._send(200, site.sitemap_xml(server.url), "application/xml")
+            elif path in site.documents:
+                if site.delay:
+                    threading.Event().wait(site.delay)
+                self._send(200, site.documents[path], "text/html; charset=utf-8")
+            else:
+                self._send(404, "not found", "text/plain")
+
+        def _send(self, status: int, body: str, content_type: str) -> None:
+            data = body.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    return Handler
+
+
+def _label(path: str) -> str:
+    return path.strip("/").replace("/", " ").title() or "Home"
+
+
+def _static_page(title: str, links: str, text: str) -> str:
+    return (
+        f"<!doctype html><html><head><title>{escape(title)}</title>"
+        f'<meta name="description" content="{escape(title)} overview"></head>'
+        f"<body><nav><ul>{links}</ul></nav><main><h1>{escape(title)}</h1>"
+        f"<h2>Overview</h2><p>{text}</p></main></body></html>"
+    )
+
+
+def _spa_page(title: str, links: str, text: str) -> str:
+    markup = f"<nav><ul>{links}</ul></nav><main><h1>{escape(title)}</h1><p>{text}</p></main>"
+    return (
+        f"<!doctype html><html><head><title>{escape(title)}</title></head>"
+        '<body><div id="root"></div>'
+        "<noscript>You need to enable JavaScript to run this app.</noscript>"
+        f"<script>document.getElementById('root').innerHTML = {json.dumps(markup)};</script>"
+        "</body></html>"
+    )
@@ -0,0 +1,170 @@
+"""A local stand-in for the Gemini and Grok endpoints used by the LLM clients.
+
+Point ``GEMINI_BASE_URL`` at ``<url>/v1beta`` or ``GROK_BASE_URL`` at ``<url>/v1``. The
+stub answers ``generateContent`` / ``streamGenerateContent`` (``alt=sse``) and
+``chat/completions`` (plain or ``stream: true``) with a JSON object built from the
+request's response schema, after ``latency`` seconds (plus up to ``jitter``). Streaming
+responses are split into ``chunks`` SSE events. Token counts use the same
+characters-per-token estimate as the app and are tallied in ``stats``.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+CHARS_PER_TOKEN = 4.0
+
+
+@dataclass(slots=True)
+class StubStats:
+    requests: int = 0
+    streamed: int = 0
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+
+
+class StubLLMServer:
+    """Serves fake Gemini/Grok responses on ``127.0.0.1`` from a daemon thread."""
+
+    def __init__(
+        self, latency: float = 0.5, jitter: float = 0.0, chunks: int = 8, port: int = 0
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.chunks = max(1, chunks)
+        self.stats = StubStats()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), _handler_for(self))
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> StubLLMServer:
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> StubLLMServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return asdict(self.stats)
+
+    def _record(self, prompt: str, output: str, *, streamed: bool) -> None:
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.streamed += streamed
+            self.stats.prompt_tokens += _tokens(prompt)
+            self.stats.output_tokens += _tokens(output)
+
+    def _wait(self) -> None:
+        delay = self.latency + random.uniform(0, self.jitter)
+        if delay > 0:
+            threading.Event().wait(delay)
+
+
+def _handler_for(server: StubLLMServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:  # http.server API
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length) or b"{}")
+            path = self.path.partition("?")[0]
+            if ":generateContent" in path or ":streamGenerateContent" in path:
+                prompt = body["contents"][0]["parts"][0]["text"]
+                schema = body.get("generationConfig", {}).get("responseSchema") or {}
+                stream = ":streamGenerateContent" in path
+                wrap = _gemini_chunk
+            elif path.endswith("/chat/completions"):
+                prompt = "\n".join(message["content"] for message in body.get("messages", []))
+                schema = body.get("response_format", {}).get("json_schema", {}).get("schema", {})
+                stream = bool(body.get("stream"))
+                wrap = _grok_delta if stream else _grok_message
+            else:
+                self._send_json(404, {"error": {"message": f"unknown path {path}"}})
+                return
+
+            output = json.dumps(_fake_object(schema))
+            server._record(prompt, output, streamed=stream)
+            server._wait()
+            if not stream:
+                self._send_json(200, wrap(output, prompt))
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            size = max(1, -(-len(output) // server.chunks))
+            for start in range(0, len(output), size):
+                event = wrap(output[start : start + size], prompt)
+                self.wfile.write(f"data: {json.dumps(event)}\n\n".encode())
+                self.wfile.flush()
+            if path.endswith("/chat/completions"):
+                self.wfile.write(b"data: [DONE]\n\n")
+            self.close_connection = True
+
+        def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+            data = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    return Handler
+
+
+def _fake_object(schema: dict[str, Any]) -> dict[str, Any]:
+    """A plausible value for every property of an object schema."""
+    result: dict[str, Any] = {}
+    for name, spec in (schema.get("properties") or {}).items():
+        if spec.get("type") == "array":
+            result[name] = [f"Stub {name} {index}" for index in range(1, 4)]
+        else:
+            result[name] = f"Stub {name} generated offline for benchmarking."
+    return result
+
+
+def _tokens(text: str) -> int:
+    return int(len(text) / CHARS_PER_TOKEN) + 1
+
+
+def _gemini_chunk(text: str, prompt: str) -> dict[str, Any]:
+    return {
+        "candidates": [{"content": {"role": "model", "parts": [{"text": text}]}}],
+        "usageMetadata": {
+            "promptTokenCount": _tokens(prompt),
+            "candidatesTokenCount": _tokens(text),
+        },
+    }
+
+
+def _grok_message(text: str, prompt: str) -> dict[str, Any]:
+    return {
+        "choices": [{"index": 0, "message": {"role": "assistant", "content": text}}],
+        "usage": {"prompt_tokens": _tokens(prompt), "completion_tokens": _tokens(text)},
+    }
+
+
+def _grok_delta(text: str, prompt: str) -> dict[str, Any]:
+    return {"choices": [{"index": 0, "delta": {"content": text}}]}
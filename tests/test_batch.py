@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+from pathlib import Path
+
+from webcrawlagent.app.service import ServiceResult
+from webcrawlagent.batch import completed_urls, read_urls, run_batch, url_key
+from webcrawlagent.cli import _open_sink
+from webcrawlagent.crawler.analyzer import AnalysisSummary
+from webcrawlagent.crawler.extractor import CrawlResult
+from webcrawlagent.report.models import SiteSummary
+
+
+class _Service:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def run(self, url: str, render_pdf: bool = True) -> ServiceResult:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if "broken" in url:
+            raise RuntimeError("boom")
+        return ServiceResult(
+            url=url,
+            crawl=CrawlResult(url, []),
+            analysis=AnalysisSummary(url, 0, 0, 0, [], [], [], []),
+            summary=SiteSummary("overview", [], [], []),
+            pdf_path=None,
+        )
+
+
+def test_read_urls_skips_comments_and_canonical_duplicates(tmp_path: Path):
+    source = tmp_path / "urls.txt"
+    source.write_text("https://a.test\n# note\n\nhttps://A.test/\nhttps://b.test/?utm_source=x\n")
+
+    assert read_urls(str(source)) == ["https://a.test", "https://b.test/?utm_source=x"]
+
+
+async def test_batch_writes_one_record_per_url_with_bounded_workers():
+    service = _Service()
+    sink = io.StringIO()
+    urls = [f"https://site{index}.test" for index in range(5)] + ["https://broken.test"]
+
+    stats = await run_batch(service, urls, sink, concurrency=2, render_pdf=False)
+
+    records = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert sorted(record["url"] for record in records) == sorted(urls)
+    assert {record["status"] for record in records} == {"ok", "error"}
+    assert (stats.succeeded, stats.failed) == (5, 1)
+    assert service.peak == 2
+
+
+def test_resume_ignores_failed_and_truncated_records(tmp_path: Path):
+    out = tmp_path / "results.jsonl"
+    out.write_text(
+        json.dumps({"url": "https://a.test/", "status": "ok"})
+        + "\n"
+        + json.dumps({"url": "https://b.test", "status": "error"})
+        + "\n"
+        + '{"url": "https://c.test", "status": "o'
+    )
+
+    assert completed_urls(out) == {url_key("https://a.test")}
+    assert completed_urls(tmp_path / "missing.jsonl") == set()
+
+
+def test_resumed_sink_starts_after_a_truncated_line(tmp_path: Path):
+    out = tmp_path / "results.jsonl"
+    out.write_text(json.dumps({"url": "https://a.test", "status": "ok"}) + '\n{"url": "https://b')
+
+    with _open_sink(str(out), append=True) as sink:
+        sink.write(json.dumps({"url": "https://b.test", "status": "ok"}) + "\n")
+
+    lines = out.read_text().splitlines()
+    assert len(lines) == 3
+    assert completed_urls(out) == {url_key("https://a.test"), url_key("https://b.test")}
+
+
+def test_resumed_sink_leaves_complete_files_alone(tmp_path: Path):
+    out = tmp_path / "results.jsonl"
+    out.write_text(json.dumps({"url": "https://a.test", "status": "ok"}) + "\n")
+
+    with _open_sink(str(out), append=True) as sink:
+        sink.write(json.dumps({"url": "https://b.test", "status": "ok"}) + "\n")
+
+    assert len(out.read_text().splitlines()) == 2
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import gc
+from types import SimpleNamespace
+
+from webcrawlagent.crawler.blocking import TYPICAL_BYTES, ResourceBlocker, ResourcePolicy
+
+
+class _Page:
+    pass
+
+
+def _request(url: str, resource_type: str, page: _Page | None) -> SimpleNamespace:
+    frame = SimpleNamespace(page=page) if page else None
+    return SimpleNamespace(url=url, resource_type=resource_type, frame=frame)
+
+
+def _blocker() -> ResourceBlocker:
+    return ResourceBlocker(ResourcePolicy(frozenset({"image"}), frozenset(), frozenset()))
+
+
+def test_blocked_requests_are_counted_per_page_as_an_estimate():
+    blocker = _blocker()
+    page = _Page()
+    assert blocker.check(_request("https://a.test/x.png", "image", page))
+    assert not blocker.check(_request("https://a.test/app.js", "script", page))
+
+    stats = blocker.pop(page)
+    assert stats.blocked_requests == 1
+    assert stats.estimated_bytes_saved == TYPICAL_BYTES["image"]
+    assert blocker.pop(page).blocked_requests == 0
+
+
+def test_unpopped_and_frameless_stats_are_not_retained():
+    blocker = _blocker()
+    assert blocker.check(_request("https://a.test/x.png", "image", None))
+    page = _Page()
+    blocker.check(_request("https://a.test/y.png", "image", page))
+    del page
+    gc.collect()
+    assert len(blocker._stats) == 0
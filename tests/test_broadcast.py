@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+
+from webcrawlagent.app.broadcast import Broadcaster
+
+
+async def _collect(broadcaster: Broadcaster, last_event_id: int = 0) -> list[tuple[int, dict]]:
+    return [(event.id, event.data) async for event in broadcaster.subscribe(last_event_id)]
+
+
+async def test_subscribers_replay_after_last_event_id():
+    broadcaster = Broadcaster(history=8)
+    for index in range(5):
+        broadcaster.publish({"n": index})
+    broadcaster.close()
+
+    events = await _collect(broadcaster, last_event_id=3)
+
+    assert events == [(4, {"n": 3}), (5, {"n": 4})]
+    assert [event_id for event_id, _ in await _collect(broadcaster)] == [1, 2, 3, 4, 5]
+
+
+async def test_unknown_last_event_id_replays_from_the_start():
+    broadcaster = Broadcaster(history=8)
+    broadcaster.publish({"n": 0})
+    broadcaster.close()
+
+    assert await _collect(broadcaster, last_event_id=42) == [(1, {"n": 0})]
+
+
+async def test_ring_buffer_drops_old_events_and_reports_lag():
+    broadcaster = Broadcaster(history=3)
+    for index in range(10):
+        broadcaster.publish({"n": index})
+    broadcaster.close()
+
+    events = await _collect(broadcaster, last_event_id=2)
+
+    assert len(broadcaster._events) == 3
+    assert events[0] == (7, {"type": "lagged", "missed": 5})
+    assert events[1:] == [(8, {"n": 7}), (9, {"n": 8}), (10, {"n": 9})]
+
+
+async def test_live_subscribers_all_receive_new_events():
+    broadcaster = Broadcaster(history=4)
+    readers = [asyncio.create_task(_collect(broadcaster)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    for index in range(6):
+        broadcaster.publish({"n": index})
+        await asyncio.sleep(0)
+    broadcaster.close()
+
+    for events in await asyncio.wait_for(asyncio.gather(*readers), timeout=1):
+        assert [data for _, data in events] == [{"n": index} for index in range(6)]
+
+
+async def test_slow_subscriber_skips_ahead_instead_of_buffering():
+    broadcaster = Broadcaster(history=2)
+    broadcaster.publish({"n": 0})
+    stream = broadcaster.subscribe()
+    assert (await anext(stream)).data == {"n": 0}
+
+    for index in range(1, 6):
+        broadcaster.publish({"n": index})
+    broadcaster.close()
+    rest = [(event.id, event.data) async for event in stream]
+
+    assert rest == [(4, {"type": "lagged", "missed": 3}), (5, {"n": 4}), (6, {"n": 5})]
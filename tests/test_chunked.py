@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from webcrawlagent.config import Settings
+from webcrawlagent.crawler.analyzer import build_analysis
+from webcrawlagent.crawler.extractor import CrawlResult, PageSnapshot
+from webcrawlagent.llm.chunked import SummaryPipeline, fit_notes
+from webcrawlagent.llm.exceptions import LLMUnavailableError
+from webcrawlagent.tokenizer import get_tokenizer
+
+
+class _Client:
+    model_name = "stub"
+
+    def __init__(self) -> None:
+        self.prompts: list[str] = []
+
+    async def generate_json(
+        self,
+        prompt: str,
+        schema: dict[str, Any],
+        *,
+        schema_name: str = "website_report",
+        on_partial: Any = None,
+    ) -> dict[str, Any]:
+        self.prompts.append(prompt)
+        if schema_name == "page_notes":
+            if "/broken" in prompt:
+                raise LLMUnavailableError("breaker open")
+            return {"summary": "notes", "key_points": ["point"]}
+        return {"overview": "site", "sections": [], "highlights": [], "recommendations": []}
+
+
+def _page(path: str, words: int = 1000) -> PageSnapshot:
+    return PageSnapshot(
+        url=f"https://site.test{path}",
+        title=path,
+        description="",
+        headings=[f"{path} heading"],
+        links=[],
+        text=" ".join(["word"] * words),
+        word_count=words,
+        token_estimate=words * 2,
+    )
+
+
+async def test_unavailable_map_chunk_falls_back_to_an_outline():
+    settings = Settings(SUMMARY_MODE="chunked", LLM_MAP_CHUNK_TOKENS=2000)
+    crawl = CrawlResult("https://site.test", [_page("/a"), _page("/broken"), _page("/c")])
+    client = _Client()
+    pipeline = SummaryPipeline(client, settings)
+    for page in crawl.pages:
+        pipeline.add(page)
+
+    summary, stats = await pipeline.finish(crawl, build_analysis(crawl))
+
+    assert summary.overview == "site"
+    assert stats.map_calls == 3
+    assert stats.map_failures == 1
+    assert "/broken heading" in client.prompts[-1]
+
+
+def test_fit_notes_keeps_the_reduce_input_within_budget():
+    tokenizer = get_tokenizer()
+    notes = [
+        {"pages": [f"https://site.test/{index}"], "summary": "short", "key_points": ["fact"] * 500}
+        for index in range(8)
+    ]
+
+    fitted = fit_notes(notes, 2000, tokenizer)
+
+    assert tokenizer.count(json.dumps(fitted)) <= 2000
+    assert all(note["summary"] == "short" and note["key_points"] for note in fitted)
+    assert len(notes[0]["key_points"]) == 500
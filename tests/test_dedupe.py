@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import random
+
+from webcrawlagent.crawler.dedupe import DuplicateIndex, simhash, similarity
+
+_VOCABULARY = [f"word{index}" for index in range(400)]
+
+
+def _article(seed: int, words: int = 400) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(_VOCABULARY) for _ in range(words))
+
+
+def test_near_duplicates_are_similar_and_distinct_pages_are_not():
+    article = _article(1)
+    tweaked = article.replace("word7 ", "WORD7 ") + " shared footer text"
+
+    assert simhash(article) == simhash(article.upper())
+    assert similarity(simhash(article), simhash(tweaked)) >= 0.9
+    assert similarity(simhash(article), simhash(_article(2))) < 0.8
+    assert simhash("") == 0
+
+
+def test_index_clusters_duplicates_under_the_first_page():
+    index = DuplicateIndex(threshold=0.9)
+    article = _article(3)
+
+    assert index.add("https://site.test/a", simhash(article)) is None
+    assert index.add("https://site.test/b", simhash(_article(4))) is None
+    assert index.add("https://site.test/a?ref=x", simhash(article + " ok")) == "https://site.test/a"
+    assert index.clusters == {"https://site.test/a": ["https://site.test/a?ref=x"]}
+
+
+def test_empty_pages_are_never_treated_as_duplicates():
+    index = DuplicateIndex(threshold=0.9)
+
+    assert index.add("https://site.test/blank", simhash("")) is None
+    assert index.add("https://site.test/also-blank", simhash("   ")) is None
+    assert index.clusters == {}
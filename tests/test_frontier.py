@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from webcrawlagent.crawler.frontier import Frontier, breadth_first_score
+from webcrawlagent.crawler.urls import canonicalize_url
+
+
+def _drain(frontier: Frontier) -> list[tuple[str, int]]:
+    popped = []
+    while (candidate := frontier.pop()) is not None:
+        popped.append((candidate.url, candidate.inlinks))
+    return popped
+
+
+def test_equivalent_urls_are_one_candidate_that_keeps_its_first_url():
+    frontier = Frontier(100)
+    frontier.push("https://site.test/docs/", depth=1)
+    frontier.push("https://SITE.test/docs", depth=1)
+    frontier.push("https://site.test/docs?utm_source=mail#intro", depth=2)
+
+    assert len(frontier) == 1
+    assert _drain(frontier) == [("https://site.test/docs/", 3)]
+
+
+def test_canonical_key_strips_tracking_but_keeps_real_query():
+    assert canonicalize_url("https://site.test/s?utm_campaign=x&q=1") == canonicalize_url(
+        "https://site.test/s?q=1"
+    )
+    assert canonicalize_url("https://site.test/s?q=1") != canonicalize_url(
+        "https://site.test/s?q=2"
+    )
+
+
+def test_popped_urls_are_never_yielded_again():
+    frontier = Frontier(100)
+    frontier.push("https://site.test/", depth=0)
+    assert frontier.pop() is not None
+
+    frontier.push("https://site.test", depth=1)
+
+    assert frontier.pop() is None
+
+
+def test_priority_order_prefers_valuable_pages_and_inlinks():
+    frontier = Frontier(100)
+    frontier.push("https://site.test/privacy", depth=1)
+    frontier.push("https://site.test/blog/post", depth=1)
+    frontier.push("https://site.test/pricing", depth=1)
+    frontier.push("https://site.test/", depth=0)
+    frontier.push("https://site.test/logo.png", depth=1)
+    for _ in range(3):
+        frontier.push("https://site.test/blog/post", depth=2)
+
+    order = [url for url, _ in _drain(frontier)]
+
+    assert order == [
+        "https://site.test/",
+        "https://site.test/pricing",
+        "https://site.test/blog/post",
+        "https://site.test/privacy",
+        "https://site.test/logo.png",
+    ]
+
+
+def test_breadth_first_scorer_keeps_discovery_order_within_a_depth():
+    frontier = Frontier(100, scorer=breadth_first_score)
+    for url, depth in [("/b", 2), ("/privacy", 1), ("/pricing", 1), ("/", 0)]:
+        frontier.push(f"https://site.test{url}", depth=depth)
+
+    assert [url for url, _ in _drain(frontier)] == [
+        "https://site.test/",
+        "https://site.test/privacy",
+        "https://site.test/pricing",
+        "https://site.test/b",
+    ]
+
+
+def test_prune_keeps_the_best_half_when_over_capacity():
+    frontier = Frontier(4)
+    frontier.push("https://site.test/pricing", depth=1)
+    frontier.push("https://site.test/features", depth=1)
+    frontier.push("https://site.test/terms", depth=1)
+    frontier.push("https://site.test/login", depth=1)
+    frontier.push("https://site.test/cookies", depth=1)
+
+    assert sorted(url for url, _ in _drain(frontier)) == [
+        "https://site.test/features",
+        "https://site.test/pricing",
+    ]
+
+
+def test_sitemap_priority_raises_the_score():
+    frontier = Frontier(100)
+    frontier.push("https://site.test/a", depth=1)
+    frontier.push("https://site.test/b", depth=1, sitemap_priority=1.0)
+
+    assert _drain(frontier)[0][0] == "https://site.test/b"
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from webcrawlagent.app.api import router
+from webcrawlagent.app.dependencies import get_job_manager
+from webcrawlagent.app.jobs import JobManager, QueueFullError
+from webcrawlagent.config import Settings
+
+
+class _Service:
+    """Stands in for ``CrawlAgentService``; each run blocks until ``release`` is set."""
+
+    def __init__(self) -> None:
+        self.runs: list[str] = []
+        self.release = asyncio.Event()
+
+    async def run(self, url, progress, partial):
+        self.runs.append(url)
+        await progress("crawling")
+        await self.release.wait()
+        return f"result for {url}"
+
+
+def _manager(service: _Service, **overrides) -> JobManager:
+    settings = Settings(**{"JOB_WORKERS": 1, "JOB_QUEUE_SIZE": 1, **overrides})
+    return JobManager(service, settings)
+
+
+async def test_equivalent_urls_share_one_job():
+    service = _Service()
+    jobs = _manager(service)
+    await jobs.start()
+
+    first, created = jobs.submit("https://Site.test/a?utm_source=mail")
+    second, joined = jobs.submit("https://site.test/a/")
+    service.release.set()
+
+    assert created and not joined
+    assert second is first
+    assert await first.wait() == "result for https://Site.test/a?utm_source=mail"
+    assert service.runs == ["https://Site.test/a?utm_source=mail"]
+    third, created_again = jobs.submit("https://site.test/a")
+    assert created_again and third is not first
+    await jobs.stop()
+
+
+async def test_full_queue_raises_instead_of_growing():
+    service = _Service()
+    jobs = _manager(service)
+    await jobs.start()
+    jobs.submit("https://site.test/running")
+    await asyncio.sleep(0)
+    jobs.submit("https://site.test/queued")
+
+    with pytest.raises(QueueFullError):
+        jobs.submit("https://site.test/rejected")
+    assert jobs.queued == 1
+    assert jobs.submit("https://site.test/queued")[1] is False
+    await jobs.stop()
+
+
+async def test_finished_jobs_are_pruned_past_retention():
+    service = _Service()
+    service.release.set()
+    jobs = _manager(service, JOB_QUEUE_SIZE=4, JOB_RETENTION=1)
+    await jobs.start()
+
+    submitted = [jobs.submit(f"https://site.test/{index}")[0] for index in range(3)]
+    for job in submitted:
+        await job.wait()
+
+    assert jobs.get(submitted[0].id) is None
+    assert jobs.get(submitted[1].id) is None
+    assert jobs.get(submitted[2].id) is submitted[2]
+    await jobs.stop()
+
+
+async def test_stop_fails_jobs_still_in_flight():
+    service = _Service()
+    jobs = _manager(service)
+    await jobs.start()
+    job, _ = jobs.submit("https://site.test/slow")
+    await asyncio.sleep(0)
+
+    await jobs.stop()
+
+    assert job.status == "failed"
+    assert job.events.closed
+    assert jobs.submit("https://site.test/slow")[1] is True
+
+
+async def test_api_answers_429_with_retry_after_when_the_queue_is_full():
+    service = _Service()
+    jobs = _manager(service, JOB_WORKERS=1, JOB_QUEUE_SIZE=1)
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_job_manager] = lambda: jobs
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://api.test") as client:
+        accepted = await client.post("/api/jobs", json={"url": "https://site.test/a"})
+        coalesced = await client.post("/api/jobs", json={"url": "https://site.test/a/"})
+        rejected = await client.post("/api/jobs", json={"url": "https://site.test/b"})
+
+    assert accepted.status_code == 202
+    assert coalesced.json()["coalesced"] is True
+    assert coalesced.json()["id"] == accepted.json()["id"]
+    assert rejected.status_code == 429
+    assert rejected.headers["Retry-After"] == "5"
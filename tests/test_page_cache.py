@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import httpx
+
+from webcrawlagent.config import Settings
+from webcrawlagent.crawler.cache import PageCache
+from webcrawlagent.crawler.extractor import PageSnapshot
+from webcrawlagent.crawler.fetcher import HttpFetcher
+from webcrawlagent.diskcache import SqliteLRUCache
+
+
+def _snapshot(url: str = "https://site.test/docs") -> PageSnapshot:
+    return PageSnapshot(
+        url=url,
+        title="Docs",
+        description="",
+        headings=["Docs"],
+        links=["https://site.test/pricing"],
+        text="Read the docs before you read the docs",
+        word_count=8,
+        token_estimate=0,
+    )
+
+
+def _cache(tmp_path: Path, handler=None, **overrides) -> PageCache:
+    settings = Settings(CRAWL_CACHE_DIR=tmp_path, **overrides)
+    revalidator = None
+    if handler is not None:
+        revalidator = HttpFetcher(settings)
+        revalidator._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return PageCache(settings, revalidator)
+
+
+async def test_round_trip_uses_normalized_key_and_rebuilds_derived_fields(tmp_path: Path):
+    cache = _cache(tmp_path)
+    await cache.put(_snapshot(), {"etag": '"v1"'})
+
+    cached = await cache.get("https://SITE.test/docs/#top")
+
+    assert cached is not None
+    assert cached.snapshot.text == _snapshot().text
+    assert cached.snapshot.word_counts["docs"] == 2
+    assert cached.snapshot.token_index and cached.snapshot.token_estimate > 0
+    assert cached.is_fresh(60)
+    assert await cache.get("https://site.test/other") is None
+    cache.close()
+
+
+async def test_stale_entry_is_revalidated_with_its_validators(tmp_path: Path):
+    seen: list[httpx.Headers] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers)
+        return httpx.Response(304)
+
+    cache = _cache(tmp_path, handler, CRAWL_CACHE_TTL=0)
+    validators = {"etag": '"v1"', "last-modified": "Tue, 01 Sep 2026 00:00:00 GMT"}
+    await cache.put(_snapshot(), validators)
+    cached = await cache.get("https://site.test/docs")
+    assert cached is not None and not cached.is_fresh(cache.ttl)
+
+    page = await cache.revalidate("https://site.test/docs", cached)
+
+    assert page is not None and page.not_modified
+    assert seen[0]["If-None-Match"] == '"v1"'
+    assert seen[0]["If-Modified-Since"] == validators["last-modified"]
+    await cache.refresh("https://site.test/docs")
+    refreshed = await cache.get("https://site.test/docs")
+    assert refreshed is not None and refreshed.stored_at > cached.stored_at
+    await cache.revalidator.aclose()
+    cache.close()
+
+
+async def test_entries_without_validators_are_not_revalidated(tmp_path: Path):
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("no request expected")
+
+    cache = _cache(tmp_path, handler)
+    await cache.put(_snapshot(), {})
+    cached = await cache.get("https://site.test/docs")
+
+    assert cached is not None
+    assert await cache.revalidate("https://site.test/docs", cached) is None
+    await cache.revalidator.aclose()
+    cache.close()
+
+
+def test_store_evicts_least_recently_used_entries(tmp_path: Path):
+    store = SqliteLRUCache(tmp_path / "lru.sqlite3", max_bytes=30)
+    store.set("a", b"x" * 10)
+    store.set("b", b"x" * 10)
+    store.set("c", b"x" * 10)
+    assert store.get("a") is not None
+
+    store.set("d", b"x" * 10)
+
+    assert store.get("b") is None
+    assert all(store.get(key) is not None for key in ("a", "c", "d"))
+    store.set("huge", b"x" * 31)
+    assert store.get("huge") is None
+    store.close()
+
+    reopened = SqliteLRUCache(tmp_path / "lru.sqlite3", max_bytes=30)
+    assert reopened._total == 30
+    reopened.close()
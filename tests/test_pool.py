@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from webcrawlagent.config import Settings
+from webcrawlagent.crawler.pool import BrowserPool
+from webcrawlagent.crawler.session import BrowserSession
+
+
+class _Browser:
+    def __init__(self, number: int):
+        self.number = number
+        self.alive = True
+
+
+class _Context:
+    def __init__(self, browser: _Browser):
+        self.browser = browser
+        self.closed = False
+
+
+class _FakeBackend:
+    """In-memory stand-in for a Playwright backend; browsers can be crashed at will."""
+
+    def __init__(self, launch_delay: float = 0.0):
+        self.launch_delay = launch_delay
+        self.launches = 0
+        self.fail_launches = 0
+        self.contexts: list[_Context] = []
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def launch(self) -> _Browser:
+        await asyncio.sleep(self.launch_delay)
+        if self.fail_launches:
+            self.fail_launches -= 1
+            raise RuntimeError("launch failed")
+        self.launches += 1
+        return _Browser(self.launches)
+
+    async def close_browser(self, browser: _Browser) -> None:
+        browser.alive = False
+
+    async def is_connected(self, browser: _Browser) -> bool:
+        return browser.alive
+
+    async def memory_mb(self, browser: _Browser) -> float | None:
+        return None
+
+    async def new_context(self, browser: _Browser, blocker: Any = None) -> _Context:
+        if not browser.alive:
+            raise RuntimeError("browser closed")
+        context = _Context(browser)
+        self.contexts.append(context)
+        return context
+
+    async def close_context(self, context: _Context) -> None:
+        context.closed = True
+
+    async def new_page(self, context: _Context) -> object:
+        await asyncio.sleep(0)
+        if context.closed or not context.browser.alive:
+            raise RuntimeError("target closed")
+        return object()
+
+    def unwrap(self, page: Any) -> Any:
+        return page
+
+
+def _pool(backend: _FakeBackend, size: int = 1, contexts: int = 4) -> BrowserPool:
+    settings = Settings(BROWSER_POOL_SIZE=size, BROWSER_POOL_CONTEXTS=contexts)
+    pool = BrowserPool(settings)
+    pool.backend = backend
+    return pool
+
+
+async def test_concurrent_pages_swap_a_crashed_pooled_browser_once():
+    backend = _FakeBackend()
+    pool = _pool(backend)
+    session = BrowserSession(pool.settings, pool=pool)
+    await session.__aenter__()
+    pool._browsers[0].browser.alive = False
+
+    pages = await asyncio.gather(*(session.new_page() for _ in range(4)))
+
+    assert len(pages) == 4
+    assert backend.launches == 2
+    assert [entry.active for entry in pool._browsers] == [1]
+    await session.__aexit__(None, None, None)
+    assert [entry.active for entry in pool._browsers] == [0]
+    await pool.stop()
+
+
+async def test_failed_relaunch_wakes_waiters_and_is_retried():
+    backend = _FakeBackend()
+    pool = _pool(backend, contexts=1)
+    lease = await pool.acquire()
+    waiter = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0)
+
+    lease.retiring = True
+    backend.fail_launches = 1
+    await pool.release(lease)
+
+    entry = await asyncio.wait_for(waiter, timeout=1)
+    assert entry.browser.alive
+    assert backend.launches == 2
+    await pool.release(entry)
+    await pool.stop()
+
+
+async def test_relaunch_does_not_block_leases_on_other_browsers():
+    backend = _FakeBackend()
+    pool = _pool(backend, size=2, contexts=1)
+    first = await pool.acquire()
+    backend.launch_delay = 0.5
+    first.retiring = True
+    release = asyncio.create_task(pool.release(first))
+    await asyncio.sleep(0.01)
+
+    second = await asyncio.wait_for(pool.acquire(), timeout=0.1)
+    assert second is not first
+    await release
+    await pool.release(second)
+    await pool.stop()
+
+
+async def test_acquire_raises_when_the_only_browser_cannot_relaunch():
+    backend = _FakeBackend()
+    pool = _pool(backend)
+    await pool.start()
+    pool._browsers[0].browser.alive = False
+    backend.fail_launches = 1
+
+    with pytest.raises(RuntimeError, match="launch failed"):
+        await pool.acquire()
+    assert pool._browsers[0].retiring
+    assert not pool._browsers[0].replacing
+    entry = await pool.acquire()
+    assert entry.browser.alive
+    await pool.release(entry)
+    await pool.stop()
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+
+from webcrawlagent.config import Settings
+from webcrawlagent.crawler.analyzer import AnalysisSummary
+from webcrawlagent.report.builder import PdfReportBuilder
+from webcrawlagent.report.models import ReportPayload, SiteSummary
+
+
+def _payload() -> ReportPayload:
+    return ReportPayload(
+        url="https://site.test",
+        summary=SiteSummary("overview", ["section"], ["highlight"], ["recommendation"]),
+        metrics=AnalysisSummary("https://site.test", 3, 1, 1, [], ["keyword"], [], []),
+    )
+
+
+@pytest.mark.parametrize("executor", ["inline", "thread"])
+async def test_build_async_renders_a_pdf(tmp_path: Path, executor: str):
+    builder = PdfReportBuilder(Settings(REPORT_EXECUTOR=executor, REPORT_OUTPUT_DIR=tmp_path))
+    payload = _payload()
+
+    path = await builder.build_async(payload)
+
+    assert path.read_bytes().startswith(b"%PDF")
+    assert payload.pdf_path == str(path)
+    assert payload.render_ms is not None
+    builder.close()
+
+
+async def test_dead_worker_falls_back_and_the_pool_is_replaced(tmp_path: Path):
+    builder = PdfReportBuilder(Settings(REPORT_EXECUTOR="process", REPORT_OUTPUT_DIR=tmp_path))
+    broken = builder._get_executor()
+    with pytest.raises(BrokenProcessPool):
+        broken.submit(os._exit, 1).result()
+
+    path = await builder.build_async(_payload())
+
+    assert path.read_bytes().startswith(b"%PDF")
+    assert builder._executor is None
+    replacement = builder._get_executor()
+    assert replacement is not broken
+    assert (await builder.build_async(_payload())).exists()
+    builder.close()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+
+import httpx
+
+from webcrawlagent.config import Settings
+from webcrawlagent.crawler.sitemeta import SiteMetaFetcher, _SitemapParser
+
+URLSET = '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+
+
+def _sitemap(count: int) -> bytes:
+    entries = "".join(
+        f"<url><loc>https://site.test/p/{index}</loc><priority>0.5</priority></url>"
+        for index in range(count)
+    )
+    return f"{URLSET}{entries}</urlset>".encode()
+
+
+def test_streaming_parser_keeps_no_finished_entries():
+    parser = _SitemapParser()
+    document = _sitemap(2000)
+    entries = []
+    widest = 0
+    for start in range(0, len(document), 512):
+        entries.extend(parser.feed(document[start : start + 512]))
+        widest = max(widest, len(parser._root or []))
+    entries.extend(parser.close())
+
+    assert len(entries) == 2000
+    assert entries[-1][0] == "url"
+    assert entries[-1][1].url == "https://site.test/p/1999"
+    assert widest <= 1
+
+
+def _fetcher(settings: Settings, handler) -> SiteMetaFetcher:
+    fetcher = SiteMetaFetcher(settings)
+    fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return fetcher
+
+
+async def test_concurrent_jobs_share_one_fetch_and_leave_no_lock_behind():
+    calls: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        await asyncio.sleep(0.02)
+        if request.url.path == "/sitemap.xml":
+            return httpx.Response(200, content=gzip.compress(_sitemap(3)))
+        return httpx.Response(404)
+
+    fetcher = _fetcher(Settings(SITE_META_TTL=60), handler)
+    metas = await asyncio.gather(*(fetcher.get("https://site.test/a") for _ in range(5)))
+
+    assert calls == ["/robots.txt", "/sitemap.xml"]
+    assert all(meta is metas[0] for meta in metas)
+    assert len(metas[0].sitemap) == 3
+    assert fetcher._locks == {} and fetcher._lock_users == {}
+    await fetcher.aclose()
+
+
+async def test_site_meta_cache_is_lru_bounded():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404)
+
+    fetcher = _fetcher(Settings(SITE_META_CACHE_SIZE=2, USE_SITEMAPS=False), handler)
+    for host in ("a", "b", "a", "c"):
+        await fetcher.get(f"https://{host}.test/")
+
+    assert list(fetcher._cache) == ["https://a.test", "https://c.test"]
+    await fetcher.aclose()
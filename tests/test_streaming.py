@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import httpx
+
+from webcrawlagent.config import Settings
+from webcrawlagent.llm.grok_client import GrokClient
+from webcrawlagent.llm.streaming import IncrementalJsonParser, collect_stream, sse_events
+
+DOCUMENT = json.dumps(
+    {
+        "overview": 'Site "A" été \\ done',
+        "sections": ["pricing", "docs"],
+        "highlights": [],
+        "nested": {"count": 2, "ok": True},
+    },
+    ensure_ascii=True,
+)
+
+
+def test_every_prefix_yields_a_valid_partial_or_nothing():
+    parser = IncrementalJsonParser()
+    final = json.loads(DOCUMENT)
+    snapshots: list[Any] = []
+    for char in "```json\n" + DOCUMENT + "\n```":
+        parser.feed(char)
+        snapshots.append(parser.snapshot())
+
+    assert parser.done
+    assert snapshots[-1] == final
+    for snapshot in filter(None, snapshots):
+        assert set(snapshot) <= set(final)
+        overview = snapshot.get("overview", "")
+        assert final["overview"].startswith(overview)
+
+
+def test_streaming_string_and_open_array_are_closed_in_snapshots():
+    parser = IncrementalJsonParser()
+    parser.feed('{"overview": "Half a sen')
+    assert parser.snapshot() == {"overview": "Half a sen"}
+
+    parser.feed('tence", "sections": ["one", "tw')
+    assert parser.snapshot() == {"overview": "Half a sentence", "sections": ["one", "tw"]}
+
+    parser.feed('o"], "highlights": [1')
+    assert parser.snapshot() == {
+        "overview": "Half a sentence",
+        "sections": ["one", "two"],
+        "highlights": [],
+    }
+
+
+def test_half_received_escapes_are_dropped_from_snapshots():
+    parser = IncrementalJsonParser()
+    parser.feed('{"overview": "caf\\u00')
+    assert parser.snapshot() == {"overview": "caf"}
+    parser.feed('e9 \\')
+    assert parser.snapshot() == {"overview": "café "}
+
+
+async def _lines(*lines: str):
+    for line in lines:
+        yield line
+
+
+async def test_sse_events_join_data_lines_and_stop_at_done():
+    lines = _lines(
+        "data: one", "", ": keep-alive", "data: two", "data: lines", "", "data: [DONE]", ""
+    )
+
+    assert [event async for event in sse_events(lines)] == ["one", "two\nlines"]
+
+
+async def test_collect_stream_reports_only_changed_partials():
+    partials: list[dict[str, Any]] = []
+
+    async def on_partial(snapshot: dict[str, Any]) -> None:
+        partials.append(snapshot)
+
+    async def deltas():
+        for delta in ('{"overview": "a', "", 'b", ', '"sections": [', "]}"):
+            yield delta
+
+    text = await collect_stream(deltas(), on_partial)
+
+    assert json.loads(text) == {"overview": "ab", "sections": []}
+    assert partials == [{"overview": "a"}, {"overview": "ab"}, {"overview": "ab", "sections": []}]
+
+
+async def test_grok_streams_sse_deltas_as_partials():
+    chunks = ['{"overview": "Stre', 'amed", "sections"', ': ["x"]}']
+    body = "".join(
+        f"data: {json.dumps({'choices': [{'delta': {'content': chunk}}]})}\n\n" for chunk in chunks
+    )
+    requests: list[dict[str, Any]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(json.loads(request.content))
+        return httpx.Response(200, text=body + "data: [DONE]\n\n")
+
+    client = GrokClient(Settings(GROK_API_KEY="test", LLM_MAX_RETRIES=0))
+    client._transport._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    partials: list[dict[str, Any]] = []
+
+    async def on_partial(snapshot: dict[str, Any]) -> None:
+        partials.append(snapshot)
+
+    result = await client.generate_json("prompt", {}, on_partial=on_partial)
+
+    assert requests[0]["stream"] is True
+    assert result == {"overview": "Streamed", "sections": ["x"]}
+    assert partials[0] == {"overview": "Stre"}
+    assert partials[-1] == result
+    await client.aclose()
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from webcrawlagent.crawler.throttle import HostThrottle, TokenBucket
+
+
+async def _start_times(throttle: HostThrottle, urls: list[str], hold: float = 0.0) -> list[float]:
+    began = time.monotonic()
+
+    async def fetch(url: str) -> float:
+        async with throttle.slot(url):
+            started = time.monotonic() - began
+            await asyncio.sleep(hold)
+            return started
+
+    return list(await asyncio.gather(*(fetch(url) for url in urls)))
+
+
+async def test_bucket_allows_a_burst_then_spaces_requests():
+    bucket = TokenBucket(rate=20, burst=3)
+    began = time.monotonic()
+    stamps = []
+    for _ in range(5):
+        await bucket.acquire()
+        stamps.append(time.monotonic() - began)
+
+    assert stamps[2] < 0.02
+    assert stamps[3] >= 0.04
+    assert 0.09 <= stamps[4] < 0.5
+
+
+async def test_zero_rate_bucket_never_waits():
+    bucket = TokenBucket(rate=0)
+    began = time.monotonic()
+    for _ in range(100):
+        await bucket.acquire()
+
+    assert time.monotonic() - began < 0.05
+
+
+async def test_host_concurrency_is_capped_per_host_not_globally():
+    throttle = HostThrottle(max_concurrency=2, delay=0)
+    urls = [f"https://a.test/{index}" for index in range(4)] + ["https://b.test/"]
+
+    starts = await _start_times(throttle, urls, hold=0.05)
+
+    assert max(starts[:2]) < 0.02
+    assert min(starts[2:4]) >= 0.05
+    assert starts[4] < 0.02
+
+
+async def test_delay_spaces_requests_to_one_host_only():
+    throttle = HostThrottle(max_concurrency=4, delay=0.05)
+    urls = ["https://a.test/1", "https://a.test/2", "https://a.test/3", "https://b.test/"]
+
+    starts = await _start_times(throttle, urls)
+
+    assert sorted(starts[:3])[1] >= 0.045
+    assert sorted(starts[:3])[2] >= 0.095
+    assert starts[3] < 0.02
+
+
+async def test_set_delay_overrides_one_host_without_bursting():
+    throttle = HostThrottle(max_concurrency=4, delay=0, burst=5)
+    throttle.set_delay("slow.test", 0.05)
+    urls = ["https://slow.test/1", "https://slow.test/2", "https://fast.test/1", "https://fast.test/2"]
+
+    starts = await _start_times(throttle, urls)
+
+    assert max(starts[:2]) >= 0.045
+    assert max(starts[2:]) < 0.02
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from webcrawlagent.config import Settings
+from webcrawlagent.llm.exceptions import LLMUnavailableError
+from webcrawlagent.llm.transport import LLMTransport
+
+
+def _transport(statuses: list[int]) -> tuple[LLMTransport, list[int]]:
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = statuses[min(len(calls), len(statuses) - 1)]
+        calls.append(status)
+        return httpx.Response(status, json={})
+
+    settings = Settings(
+        LLM_MAX_RETRIES=0, LLM_BREAKER_THRESHOLD=1, LLM_BREAKER_RESET_SECONDS=0.0
+    )
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return LLMTransport(settings, name="Test", timeout=5, client=client), calls
+
+
+async def test_bad_request_probe_does_not_wedge_half_open_breaker():
+    transport, calls = _transport([503, 400, 200])
+    with pytest.raises(LLMUnavailableError):
+        await transport.post("http://llm.test/", json={})
+    assert transport.breaker.state == "half-open"
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await transport.post("http://llm.test/", json={})
+
+    response = await transport.post("http://llm.test/", json={})
+    assert response.status_code == 200
+    assert calls == [503, 400, 200]
+    assert transport.breaker.state == "closed"
+    await transport.aclose()
+
+
+async def test_cancelled_probe_releases_half_open_breaker():
+    transport, _ = _transport([503])
+    with pytest.raises(LLMUnavailableError):
+        await transport.post("http://llm.test/", json={})
+
+    async def hang(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(10)
+        return httpx.Response(200)
+
+    transport._client = httpx.AsyncClient(transport=httpx.MockTransport(hang))
+    probe = asyncio.create_task(transport.post("http://llm.test/", json={}))
+    await asyncio.sleep(0.01)
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+    assert transport.breaker.allow()
+    await transport.aclose()
+
+
+def _slow_transport() -> tuple[LLMTransport, list[str]]:
+    events: list[str] = []
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        events.append("started")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+        return httpx.Response(200)
+
+    settings = Settings(LLM_MAX_RETRIES=0, LLM_HEDGE_ENABLED=True, LLM_HEDGE_MIN_SAMPLES=1)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(slow))
+    return LLMTransport(settings, name="Test", timeout=5, client=client), events
+
+
+@pytest.mark.parametrize("p95_seconds", [5.0, 0.01], ids=["before-hedge", "during-race"])
+async def test_cancelled_caller_cancels_every_hedged_copy(p95_seconds: float):
+    transport, events = _slow_transport()
+    transport.latency.record(p95_seconds)
+
+    request = asyncio.create_task(transport.post("http://llm.test/", json={}))
+    await asyncio.sleep(0.05)
+    request.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await request
+    assert events.count("cancelled") == events.count("started") >= 1
+    await transport.aclose()
@@ -1,21 +1,24 @@
 from __future__ import annotations
 
-import asyncio
 import json
 from dataclasses import asdict
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
 from fastapi.responses import FileResponse
 from pydantic import BaseModel, HttpUrl
 from sse_starlette.sse import EventSourceResponse
 
-from webcrawlagent.app.dependencies import get_service
-from webcrawlagent.app.service import CrawlAgentService, ServiceResult
+from webcrawlagent.app.dependencies import get_job_manager
+from webcrawlagent.app.jobs import Job, JobManager, QueueFullError
+from webcrawlagent.app.service import ServiceResult
 from webcrawlagent.config import get_settings
 
 router = APIRouter(prefix="/api", tags=["agent"])
 
+# Hint sent with 429 responses when the job queue is full.
+RETRY_AFTER_SECONDS = 5
+
 
 class AnalyzeRequest(BaseModel):
     url: HttpUrl
@@ -26,14 +29,30 @@ class AnalyzeResponse(BaseModel):
     summary: dict
     metrics: dict
     pdf_path: str
+    timings: dict = {}
+    summary_stats: dict | None = None
+    trace: dict | None = None
+
+
+class JobResponse(BaseModel):
+    id: str
+    url: str
+    status: str
+    coalesced: bool = False
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str | None = None
+    result: AnalyzeResponse | None = None
 
 
 @router.post("/analyze", response_model=AnalyzeResponse)
 async def analyze(
-    request: AnalyzeRequest, service: CrawlAgentService = Depends(get_service)  # noqa: B008
+    request: AnalyzeRequest, jobs: JobManager = Depends(get_job_manager)  # noqa: B008
 ):
+    job, _ = _submit(jobs, str(request.url))
     try:
-        result = await service.run(str(request.url))
+        result = await job.wait()
     except Exception as exc:  # pragma: no cover - network/LLM errors
         raise HTTPException(status_code=500, detail=str(exc)) from exc
     return _serialize_result(result)
@@ -42,35 +61,90 @@ async def analyze(
 @router.get("/stream")
 async def stream(
     url: HttpUrl = Query(..., description="Website to analyze"),  # noqa: B008
-    service: CrawlAgentService = Depends(get_service),  # noqa: B008
+    jobs: JobManager = Depends(get_job_manager),  # noqa: B008
+    last_event_id: str | None = Header(default=None),
+):
+    job, created = _submit(jobs, str(url))
+    # Event ids are per job, so a cursor only means something when rejoining the same one.
+    cursor = 0 if created else _event_cursor(last_event_id)
+    return EventSourceResponse(_job_events(job, created, cursor))
+
+
+@router.post("/jobs", response_model=JobResponse, status_code=202)
+async def create_job(
+    request: AnalyzeRequest, jobs: JobManager = Depends(get_job_manager)  # noqa: B008
 ):
-    async def event_generator():
-        queue: asyncio.Queue[dict] = asyncio.Queue()
+    job, created = _submit(jobs, str(request.url))
+    return _serialize_job(job, coalesced=not created)
+
 
-        async def progress(message: str):
-            await queue.put({"type": "status", "message": message})
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str, jobs: JobManager = Depends(get_job_manager)):  # noqa: B008
+    return _serialize_job(_lookup(jobs, job_id))
 
-        task = asyncio.create_task(service.run(str(url), progress))
 
-        while True:
-            if task.done() and queue.empty():
-                break
-            try:
-                event = await asyncio.wait_for(queue.get(), timeout=0.2)
-                yield {"event": "message", "data": json.dumps(event)}
-            except TimeoutError:
-                if task.done():
-                    break
+@router.get("/jobs/{job_id}/events")
+async def job_events(
+    job_id: str,
+    jobs: JobManager = Depends(get_job_manager),  # noqa: B008
+    last_event_id: str | None = Header(default=None),
+):
+    job = _lookup(jobs, job_id)
+    return EventSourceResponse(_job_events(job, cursor=_event_cursor(last_event_id)))
 
-        try:
-            result = await task
-        except Exception as exc:  # pragma: no cover
-            yield {"event": "message", "data": json.dumps({"type": "error", "message": str(exc)})}
-            return
-        summary_payload = {"type": "summary", **_serialize_result(result)}
-        yield {"event": "message", "data": json.dumps(summary_payload)}
 
-    return EventSourceResponse(event_generator())
+def _submit(jobs: JobManager, url: str) -> tuple[Job, bool]:
+    try:
+        return jobs.submit(url)
+    except QueueFullError as exc:
+        raise HTTPException(
+            status_code=429, detail=str(exc), headers={"Retry-After": str(RETRY_AFTER_SECONDS)}
+        ) from exc
+
+
+def _lookup(jobs: JobManager, job_id: str) -> Job:
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+def _event_cursor(last_event_id: str | None) -> int:
+    try:
+        return int(last_event_id) if last_event_id else 0
+    except ValueError:
+        return 0
+
+
+async def _job_events(job: Job, created: bool = True, cursor: int = 0):
+    intro = {"type": "job", "id": job.id, "status": job.status, "coalesced": not created}
+    yield {"event": "message", "data": json.dumps(intro)}
+    if not created and not job.finished:
+        joined = {"type": "status", "message": "Joining an analysis already in progress"}
+        yield {"event": "message", "data": json.dumps(joined)}
+    async for event in job.events.subscribe(cursor):
+        yield {"id": str(event.id), "event": "message", "data": json.dumps(event.data)}
+    try:
+        result = await job.wait()
+    except Exception as exc:  # pragma: no cover
+        yield {"event": "message", "data": json.dumps({"type": "error", "message": str(exc)})}
+        return
+    summary_payload = {"type": "summary", **_serialize_result(result)}
+    yield {"event": "message", "data": json.dumps(summary_payload)}
+
+
+def _serialize_job(job: Job, *, coalesced: bool = False) -> dict:
+    return {
+        "id": job.id,
+        "url": job.url,
+        "status": job.status,
+        "coalesced": coalesced,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+        "error": job.error,
+        "result": _serialize_result(job.result) if job.result else None,
+    }
 
 
 def _serialize_result(result: ServiceResult) -> dict:
@@ -85,6 +159,9 @@ def _serialize_result(result: ServiceResult) -> dict:
         },
         "metrics": asdict(result.analysis),
         "pdf_path": f"/api/reports/{file_name}",
+        "timings": result.timings,
+        "summary_stats": asdict(result.summary_stats) if result.summary_stats else None,
+        "trace": result.trace,
     }
 
 
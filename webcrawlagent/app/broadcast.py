@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True)
+class BroadcastEvent:
+    id: int
+    data: dict[str, Any]
+
+
+class Broadcaster:
+    """Fans one job's events out to any number of subscribers.
+
+    Events get increasing ids and are kept in a ring of the last ``history`` entries.
+    Subscribers hold only a cursor into that ring, so a slow client costs no memory of
+    its own. A client that falls more than ``history`` events behind skips ahead and
+    receives a ``lagged`` event instead. Waiting subscribers block on an ``asyncio.Event``
+    that is swapped on every publish, so idle streams never wake up.
+    """
+
+    def __init__(self, history: int = 256):
+        self._events: deque[BroadcastEvent] = deque(maxlen=history)
+        self._last_id = 0
+        self._changed = asyncio.Event()
+        self.closed = False
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    def publish(self, data: dict[str, Any]) -> int:
+        if self.closed:
+            raise RuntimeError("broadcaster is closed")
+        self._last_id += 1
+        self._events.append(BroadcastEvent(self._last_id, data))
+        self._wake()
+        return self._last_id
+
+    def close(self) -> None:
+        """Mark the stream finished; subscribers drain what is buffered and stop."""
+        self.closed = True
+        self._wake()
+
+    async def subscribe(self, last_event_id: int = 0) -> AsyncIterator[BroadcastEvent]:
+        """Yield events after ``last_event_id`` (a ``Last-Event-ID``) until closed."""
+        cursor = last_event_id if 0 <= last_event_id <= self._last_id else 0
+        while True:
+            changed = self._changed
+            if cursor < self._last_id:
+                oldest = self._events[0].id
+                if cursor + 1 < oldest:
+                    yield BroadcastEvent(
+                        oldest - 1, {"type": "lagged", "missed": oldest - 1 - cursor}
+                    )
+                    cursor = oldest - 1
+                batch = list(itertools.islice(self._events, cursor - oldest + 1, None))
+                for event in batch:
+                    yield event
+                    cursor = event.id
+                continue
+            if self.closed:
+                return
+            await changed.wait()
+
+    def _wake(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from functools import lru_cache
 
+from webcrawlagent.app.jobs import JobManager
 from webcrawlagent.app.service import CrawlAgentService
 from webcrawlagent.config import get_settings
 
@@ -12,6 +13,18 @@ def get_service() -> CrawlAgentService:
     return CrawlAgentService(settings)
 
 
+@lru_cache(maxsize=1)
+def get_job_manager() -> JobManager:
+    return JobManager(get_service(), get_settings())
+
+
+async def startup_service() -> None:
+    service = get_service()
+    await service.start()
+    await get_job_manager().start()
+
+
 async def shutdown_service() -> None:
+    await get_job_manager().stop()
     service = get_service()
     await service.shutdown()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from webcrawlagent.app.broadcast import Broadcaster
+from webcrawlagent.app.service import CrawlAgentService, ServiceResult
+from webcrawlagent.config import Settings
+from webcrawlagent.crawler.urls import canonicalize_url
+from webcrawlagent.metrics import JOBS, observe_span
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATES = frozenset({"succeeded", "failed"})
+
+
+class QueueFullError(RuntimeError):
+    """Raised when the admission queue cannot take another job."""
+
+
+@dataclass(slots=True, eq=False)
+class Job:
+    """One analysis of ``url``; shared by every request that asked for it while in flight."""
+
+    id: str
+    url: str
+    status: str = "queued"
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+    result: ServiceResult | None = None
+    error: str | None = None
+    events: Broadcaster = field(default_factory=Broadcaster)
+    _done: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    async def progress(self, message: str) -> None:
+        self.events.publish({"type": "status", "message": message})
+
+    async def partial(self, summary: dict[str, Any]) -> None:
+        self.events.publish({"type": "partial", "summary": summary})
+
+    async def wait(self) -> ServiceResult:
+        await self._done.wait()
+        if self.result is None:
+            raise RuntimeError(self.error or "job failed")
+        return self.result
+
+    def finish(self, result: ServiceResult | None = None, error: str | None = None) -> None:
+        self.result = result
+        self.error = error
+        self.status = "succeeded" if result is not None else "failed"
+        self.finished_at = time.time()
+        self.events.close()
+        self._done.set()
+
+
+class JobManager:
+    """Runs analyses on a bounded worker pool behind a bounded admission queue.
+
+    Submitting a URL that is already queued or running joins the existing job instead of
+    starting another crawl and LLM call. Finished jobs stay queryable until
+    ``JOB_RETENTION`` newer ones have completed.
+    """
+
+    def __init__(self, service: CrawlAgentService, settings: Settings):
+        self.service = service
+        self.workers = settings.job_workers
+        self.retention = settings.job_retention
+        self.event_history = settings.job_event_history
+        self._queue: asyncio.Queue[Job] = asyncio.Queue(maxsize=settings.job_queue_size)
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._in_flight: dict[str, Job] = {}
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def queued(self) -> int:
+        return self._queue.qsize()
+
+    async def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        for job in list(self._in_flight.values()):
+            self._complete(job, error="service shutting down")
+
+    def submit(self, url: str) -> tuple[Job, bool]:
+        """Queue ``url``; returns ``(job, created)``. Raises ``QueueFullError`` under load."""
+        key = canonicalize_url(url)
+        job = self._in_flight.get(key)
+        if job is not None:
+            return job, False
+        job = Job(id=uuid.uuid4().hex, url=url, events=Broadcaster(self.event_history))
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise QueueFullError(
+                f"{self._queue.maxsize} jobs already waiting; retry later"
+            ) from None
+        self._in_flight[key] = job
+        self._jobs[job.id] = job
+        return job, True
+
+    def get(self, job_id: str) -> Job | None:
+        return self._jobs.get(job_id)
+
+    async def _work(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        job.status = "running"
+        job.started_at = time.time()
+        observe_span("job.queue_wait", (job.started_at - job.created_at) * 1000)
+        try:
+            result = await self.service.run(job.url, job.progress, job.partial)
+        except asyncio.CancelledError:
+            self._complete(job, error="cancelled")
+            raise
+        except Exception as exc:  # pragma: no cover - network/LLM errors
+            logger.exception("Job %s for %s failed", job.id, job.url)
+            self._complete(job, error=str(exc))
+        else:
+            self._complete(job, result=result)
+
+    def _complete(
+        self, job: Job, result: ServiceResult | None = None, error: str | None = None
+    ) -> None:
+        if job.finished:
+            return
+        self._in_flight.pop(canonicalize_url(job.url), None)
+        job.finish(result, error)
+        JOBS.inc(status=job.status)
+        finished = [key for key, item in self._jobs.items() if item.finished]
+        for key in finished[: max(0, len(finished) - self.retention)]:
+            del self._jobs[key]
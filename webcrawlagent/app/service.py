@@ -1,19 +1,27 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Coroutine
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Any
 
 from webcrawlagent.config import Settings
-from webcrawlagent.crawler import BrowserSession, crawl_site
-from webcrawlagent.crawler.analyzer import AnalysisSummary, build_analysis
+from webcrawlagent.crawler import BrowserSession, CrawlStream
+from webcrawlagent.crawler.analyzer import AnalysisAccumulator, AnalysisSummary
+from webcrawlagent.crawler.cache import PageCache
 from webcrawlagent.crawler.extractor import CrawlResult
-from webcrawlagent.llm.exceptions import LLMContentError
+from webcrawlagent.crawler.fetcher import HttpFetcher
+from webcrawlagent.crawler.pool import BrowserPool
+from webcrawlagent.crawler.sitemeta import SiteMetaFetcher
+from webcrawlagent.llm.chunked import SummaryPipeline, SummaryStats, summarize
+from webcrawlagent.llm.exceptions import LLMContentError, LLMUnavailableError
 from webcrawlagent.llm.factory import create_llm_client
 from webcrawlagent.llm.summary import build_fallback_summary
+from webcrawlagent.metrics import LLM_TOKENS, mark_failed, span, trace_scope
 from webcrawlagent.report.builder import PdfReportBuilder
 from webcrawlagent.report.models import ReportPayload, SiteSummary
 
 ProgressHook = Callable[[str], Coroutine[None, None, None]]
+PartialSummaryHook = Callable[[dict[str, Any]], Coroutine[None, None, None]]
 
 
 @dataclass(slots=True)
@@ -22,7 +30,10 @@ class ServiceResult:
     crawl: CrawlResult
     analysis: AnalysisSummary
     summary: SiteSummary
-    pdf_path: str
+    pdf_path: str | None
+    summary_stats: SummaryStats | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+    trace: dict[str, Any] | None = None
 
 
 class CrawlAgentService:
@@ -30,34 +41,167 @@ class CrawlAgentService:
         self.settings = settings
         self.llm = create_llm_client(settings)
         self.report_builder = PdfReportBuilder(settings)
+        self.browser_pool = BrowserPool(settings) if settings.browser_pool_size else None
+        http_first = settings.fetch_strategy == "http-first"
+        self.http_fetcher = (
+            HttpFetcher(settings) if http_first or settings.crawl_cache_dir else None
+        )
+        self._http_tier = self.http_fetcher if http_first else None
+        self.page_cache = (
+            PageCache(settings, revalidator=self.http_fetcher) if settings.crawl_cache_dir else None
+        )
+        self.site_meta = (
+            SiteMetaFetcher(settings) if settings.respect_robots or settings.use_sitemaps else None
+        )
+        # Pages served over HTTP or from the cache need no browser, so one is only launched
+        # (or leased, which starts the pool) when the first page escalates to it.
+        self._lazy_browser = bool(self._http_tier or self.page_cache)
+
+    async def start(self) -> None:
+        if self.browser_pool and not self._lazy_browser:
+            await self.browser_pool.start()
+
+    async def run(
+        self,
+        url: str,
+        progress: ProgressHook | None = None,
+        partial: PartialSummaryHook | None = None,
+        *,
+        render_pdf: bool = True,
+    ) -> ServiceResult:
+        """Crawl, analyze, summarize and (unless ``render_pdf`` is off) render ``url``.
+
+        Pages are analyzed as they arrive and, with ``PIPELINE_ENABLED``, large crawls
+        start their map-stage LLM calls while the crawl is still running. ``progress``
+        receives status messages; ``partial`` receives the summary object while it is
+        still streaming from the LLM (when ``LLM_STREAMING`` is on). With
+        ``TRACE_ENABLED`` the result carries a per-stage ``trace`` of this run.
+        """
+        with trace_scope(self.settings.trace_enabled) as trace:
+            result = await self._run(url, progress, partial, render_pdf)
+        if trace:
+            result.trace = trace.export()
+        return result
 
-    async def run(self, url: str, progress: ProgressHook | None = None) -> ServiceResult:
+    async def _run(
+        self,
+        url: str,
+        progress: ProgressHook | None,
+        partial: PartialSummaryHook | None,
+        render_pdf: bool,
+    ) -> ServiceResult:
         async def emit(message: str):
             if progress:
                 await progress(message)
 
-        await emit("Launching headless browser")
-        async with BrowserSession(self.settings) as session:
-            crawl = await crawl_site(url, session, self.settings, progress)
+        timings: dict[str, float] = {}
+        site = None
+        if self.site_meta:
+            await emit("Reading robots.txt and sitemaps")
+            with span("site_meta") as stage:
+                site = await self.site_meta.get(url)
+            timings["site_meta_ms"] = stage.duration_ms
+        if not self._lazy_browser:
+            await emit(
+                "Acquiring browser from pool" if self.browser_pool else "Launching headless browser"
+            )
+        pipeline = (
+            SummaryPipeline(self.llm, self.settings) if self.settings.pipeline_enabled else None
+        )
+        try:
+            with span("crawl") as crawl_stage:
+                async with BrowserSession(
+                    self.settings, pool=self.browser_pool, lazy=self._lazy_browser
+                ) as session:
+                    stream = CrawlStream(
+                        url,
+                        session,
+                        self.settings,
+                        progress,
+                        http=self._http_tier,
+                        cache=self.page_cache,
+                        site=site,
+                    )
+                    accumulator = AnalysisAccumulator(stream.root_url)
+                    async for page in stream:
+                        accumulator.add(page)
+                        if pipeline:
+                            pipeline.add(page)
+        except BaseException:
+            if pipeline:
+                pipeline.cancel()
+            raise
+        crawl = stream.result
+        timings["crawl_ms"] = crawl_stage.duration_ms
         await emit("Crawl complete; building metadata")
-        analysis = build_analysis(crawl)
+        with span("analysis") as stage:
+            analysis = accumulator.finish(crawl)
+        timings["analysis_ms"] = stage.duration_ms
         await emit("Calling Gemini for summary")
-        try:
-            summary = await self.llm.summarize_site(crawl, analysis)
-        except LLMContentError as exc:
-            await emit("LLM blocked the content; using crawler-only summary")
-            summary = build_fallback_summary(crawl, analysis, reason=str(exc))
-        await emit("Generating PDF report")
-        payload = ReportPayload(url=url, summary=summary, metrics=analysis)
-        pdf_path = str(self.report_builder.build(payload))
-        await emit("Report saved")
+        summary_stats: SummaryStats | None = None
+        on_partial = partial if self.settings.llm_streaming else None
+        with span("summary") as stage:
+            try:
+                if pipeline:
+                    summary, summary_stats = await pipeline.finish(
+                        crawl, analysis, on_partial=on_partial
+                    )
+                else:
+                    summary, summary_stats = await summarize(
+                        self.llm, crawl, analysis, self.settings, on_partial=on_partial
+                    )
+            except LLMContentError as exc:
+                await emit("LLM blocked the content; using crawler-only summary")
+                summary = build_fallback_summary(crawl, analysis, reason=str(exc))
+                mark_failed(stage, exc)
+            except LLMUnavailableError as exc:
+                await emit("LLM provider unavailable; using crawler-only summary")
+                summary = build_fallback_summary(
+                    crawl, analysis, reason=str(exc), cause="unavailable"
+                )
+                mark_failed(stage, exc)
+        timings["summary_ms"] = stage.duration_ms
+        if summary_stats:
+            _count_tokens(summary_stats)
+        pdf_path = None
+        if render_pdf:
+            await emit("Generating PDF report")
+            payload = ReportPayload(url=url, summary=summary, metrics=analysis)
+            with span("report") as stage:
+                pdf_path = str(await self.report_builder.build_async(payload))
+            timings["report_ms"] = stage.duration_ms
+            if payload.render_ms is not None:
+                timings["report_render_ms"] = payload.render_ms
+                # Time spent waiting for a worker plus pickling/IPC overhead.
+                timings["report_wait_ms"] = round(
+                    max(0.0, timings["report_ms"] - payload.render_ms), 1
+                )
+            await emit("Report saved")
         return ServiceResult(
             url=url,
             crawl=crawl,
             analysis=analysis,
             summary=summary,
             pdf_path=pdf_path,
+            summary_stats=summary_stats,
+            timings=timings,
         )
 
     async def shutdown(self) -> None:
         await self.llm.aclose()
+        if self.http_fetcher:
+            await self.http_fetcher.aclose()
+        if self.page_cache:
+            self.page_cache.close()
+        if self.site_meta:
+            await self.site_meta.aclose()
+        if self.browser_pool:
+            await self.browser_pool.stop()
+        self.report_builder.close()
+
+
+def _count_tokens(stats: SummaryStats) -> None:
+    LLM_TOKENS.inc(stats.map_prompt_tokens, stage="map", kind="prompt")
+    LLM_TOKENS.inc(stats.map_output_tokens, stage="map", kind="output")
+    LLM_TOKENS.inc(stats.reduce_prompt_tokens, stage="reduce", kind="prompt")
+    LLM_TOKENS.inc(stats.reduce_output_tokens, stage="reduce", kind="output")
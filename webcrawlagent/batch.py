@@ -0,0 +1,199 @@
+"""Bulk analysis: many URLs through one shared ``CrawlAgentService``, written as JSONL.
+
+A fixed set of workers pulls URLs from a queue, so thousands of URLs never become
+thousands of tasks, and every worker shares the service's browser pool, HTTP tier and
+LLM client. Each result is written and flushed as soon as it finishes, which is what
+makes ``completed_urls`` (and therefore resuming a killed run) possible.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import sys
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+from webcrawlagent.app.service import CrawlAgentService, ServiceResult
+from webcrawlagent.crawler.urls import canonicalize_url
+
+ResultHook = Callable[[dict[str, Any]], None]
+
+
+@dataclass(slots=True)
+class BatchStats:
+    queued: int = 0
+    skipped: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    pages: int = 0
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+    wall_seconds: float = 0.0
+    latencies_ms: list[float] = field(default_factory=list, repr=False)
+
+    def summary(self) -> dict[str, Any]:
+        """Counts plus throughput and per-URL latency percentiles for the run."""
+        wall = self.wall_seconds or 1e-9
+        done = self.succeeded + self.failed
+        return {
+            "queued": self.queued,
+            "skipped": self.skipped,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "pages": self.pages,
+            "wall_seconds": round(self.wall_seconds, 1),
+            "urls_per_minute": round(done / wall * 60, 1),
+            "pages_per_second": round(self.pages / wall, 2),
+            "latency_p50_ms": _percentile(self.latencies_ms, 50),
+            "latency_p95_ms": _percentile(self.latencies_ms, 95),
+            "prompt_tokens": self.prompt_tokens,
+            "output_tokens": self.output_tokens,
+        }
+
+
+def read_urls(source: str) -> list[str]:
+    """URLs from ``source`` (``-`` for stdin), one per line; blanks and ``#`` lines skipped.
+
+    Duplicates (after canonicalization) keep their first occurrence.
+    """
+    if source == "-":
+        lines: Iterable[str] = sys.stdin
+    else:
+        lines = Path(source).read_text(encoding="utf-8").splitlines()
+    urls: list[str] = []
+    seen: set[str] = set()
+    for line in lines:
+        url = line.strip()
+        if not url or url.startswith("#"):
+            continue
+        key = url_key(url)
+        if key not in seen:
+            seen.add(key)
+            urls.append(url)
+    return urls
+
+
+def completed_urls(path: Path) -> set[str]:
+    """Keys of URLs that already have a successful record in the JSONL file at ``path``.
+
+    Unparseable lines (e.g. one cut short when a previous run was killed) are ignored,
+    so failed and interrupted URLs are retried.
+    """
+    done: set[str] = set()
+    if not path.exists():
+        return done
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and record.get("status") == "ok" and record.get("url"):
+                done.add(url_key(record["url"]))
+    return done
+
+
+def url_key(url: str) -> str:
+    try:
+        return canonicalize_url(url.strip())
+    except ValueError:
+        return url.strip()
+
+
+async def run_batch(
+    service: CrawlAgentService,
+    urls: list[str],
+    sink: TextIO,
+    *,
+    concurrency: int,
+    render_pdf: bool = True,
+    on_result: ResultHook | None = None,
+) -> BatchStats:
+    """Analyze ``urls`` with ``concurrency`` workers, writing one JSON line per URL."""
+    stats = BatchStats(queued=len(urls))
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for url in urls:
+        queue.put_nowait(url)
+
+    async def worker() -> None:
+        while True:
+            try:
+                url = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            started = time.perf_counter()
+            try:
+                result = await service.run(url, render_pdf=render_pdf)
+            except Exception as exc:  # one bad site must not stop the batch
+                record = _error_record(url, exc, _elapsed_ms(started))
+                stats.failed += 1
+            else:
+                record = _result_record(result, _elapsed_ms(started))
+                stats.succeeded += 1
+                stats.pages += len(result.crawl.pages)
+                if result.summary_stats:
+                    summary_stats = result.summary_stats
+                    stats.prompt_tokens += (
+                        summary_stats.map_prompt_tokens + summary_stats.reduce_prompt_tokens
+                    )
+                    stats.output_tokens += (
+                        summary_stats.map_output_tokens + summary_stats.reduce_output_tokens
+                    )
+            stats.latencies_ms.append(record["elapsed_ms"])
+            sink.write(json.dumps(record, ensure_ascii=False) + "\n")
+            sink.flush()
+            if on_result:
+                on_result(record)
+
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(urls)))))
+    finally:
+        stats.wall_seconds = time.perf_counter() - started
+    return stats
+
+
+def _result_record(result: ServiceResult, elapsed_ms: float) -> dict[str, Any]:
+    return {
+        "url": result.url,
+        "status": "ok",
+        "elapsed_ms": elapsed_ms,
+        "pages": len(result.crawl.pages),
+        "pdf_path": result.pdf_path,
+        "summary": {
+            "overview": result.summary.overview,
+            "sections": result.summary.sections,
+            "highlights": result.summary.highlights,
+            "recommendations": result.summary.recommendations,
+        },
+        "metrics": asdict(result.analysis),
+        "timings": result.timings,
+        "summary_stats": asdict(result.summary_stats) if result.summary_stats else None,
+        "finished_at": time.time(),
+    }
+
+
+def _error_record(url: str, exc: Exception, elapsed_ms: float) -> dict[str, Any]:
+    return {
+        "url": url,
+        "status": "error",
+        "elapsed_ms": elapsed_ms,
+        "error": f"{type(exc).__name__}: {exc}",
+        "finished_at": time.time(),
+    }
+
+
+def _percentile(values: list[float], pct: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(pct / 100 * len(ordered))) - 1]
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
@@ -2,29 +2,54 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import os
 import shutil
+import sys
 from pathlib import Path
+from typing import Any, TextIO
 
 from rich.console import Console
+from rich.markup import escape
 
 from webcrawlagent.app.service import CrawlAgentService
+from webcrawlagent.batch import completed_urls, read_urls, run_batch, url_key
 from webcrawlagent.config import get_settings
 
 console = Console()
+# Batch mode may stream JSONL on stdout, so its progress goes to stderr.
+status_console = Console(stderr=True)
 
 
 def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Run the web crawl agent once from the CLI")
-    parser.add_argument("--url", required=True, help="Website to crawl")
-    parser.add_argument("--out", help="Optional PDF destination path")
+    parser = argparse.ArgumentParser(description="Run the web crawl agent from the CLI")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--url", help="Website to crawl")
+    target.add_argument(
+        "--urls-file",
+        metavar="PATH",
+        help="Analyze every URL in PATH, one per line ('-' reads stdin)",
+    )
+    parser.add_argument(
+        "--out",
+        help="PDF destination for --url; JSONL results file for --urls-file (default stdout)",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="URLs analyzed at once with --urls-file"
+    )
+    parser.add_argument("--no-pdf", action="store_true", help="Skip PDF report generation")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip URLs that already succeeded in --out and append to it",
+    )
     return parser
 
 
-async def _async_main(url: str, out: str | None) -> int:
+async def _async_main(url: str, out: str | None, render_pdf: bool = True) -> int:
     settings = get_settings()
     service = CrawlAgentService(settings)
     try:
-        result = await service.run(url)
+        result = await service.run(url, render_pdf=render_pdf)
     finally:
         await service.shutdown()
 
@@ -32,20 +57,108 @@ async def _async_main(url: str, out: str | None) -> int:
     for section in result.summary.sections:
         console.print(f"  [cyan]-[/cyan] {section}")
 
-    if out:
+    if result.pdf_path and out:
         target = Path(out)
         target.parent.mkdir(parents=True, exist_ok=True)
         shutil.copy(result.pdf_path, target)
         console.print(f"Report copied to {target}")
-    else:
+    elif result.pdf_path:
         console.print(f"Report saved at {result.pdf_path}")
+    if result.trace:
+        console.print("[bold]Slowest stages:[/bold]")
+        for name, row in list(result.trace["stages"].items())[:8]:
+            console.print(f"  {name:<16} {row['total_ms']:>9.1f} ms  x{row['count']}")
     return 0
 
 
+async def _batch_main(args: argparse.Namespace) -> int:
+    urls = read_urls(args.urls_file)
+    skipped = 0
+    if args.resume:
+        done = completed_urls(Path(args.out))
+        pending = [url for url in urls if url_key(url) not in done]
+        skipped = len(urls) - len(pending)
+        urls = pending
+    status_console.print(
+        f"Analyzing {len(urls)} URL(s) with concurrency {args.concurrency}"
+        + (f"; {skipped} already done" if skipped else "")
+    )
+
+    service = CrawlAgentService(get_settings())
+    sink = _open_sink(args.out, append=args.resume)
+    finished = 0
+
+    def report(record: dict[str, Any]) -> None:
+        nonlocal finished
+        finished += 1
+        if record["status"] == "ok":
+            detail = f"[green]ok[/green] {record['pages']} page(s)"
+        else:
+            detail = f"[red]failed[/red] {escape(record['error'].splitlines()[0])}"
+        seconds = record["elapsed_ms"] / 1000
+        status_console.print(
+            f"({finished}/{len(urls)}) {escape(record['url'])} {detail} in {seconds:.1f}s",
+            highlight=False,
+        )
+
+    try:
+        await service.start()
+        stats = await run_batch(
+            service,
+            urls,
+            sink,
+            concurrency=args.concurrency,
+            render_pdf=not args.no_pdf,
+            on_result=report,
+        )
+    finally:
+        await service.shutdown()
+        if sink is not sys.stdout:
+            sink.close()
+
+    stats.skipped = skipped
+    summary = stats.summary()
+    status_console.print(
+        f"[bold]Done:[/bold] {summary['succeeded']} succeeded, {summary['failed']} failed,"
+        f" {summary['skipped']} skipped in {summary['wall_seconds']}s"
+    )
+    status_console.print(
+        f"  {summary['urls_per_minute']} URLs/min, {summary['pages_per_second']} pages/s,"
+        f" latency p50 {summary['latency_p50_ms']} ms / p95 {summary['latency_p95_ms']} ms,"
+        f" ~{summary['prompt_tokens']} prompt + {summary['output_tokens']} output tokens"
+    )
+    return 1 if stats.failed else 0
+
+
+def _open_sink(out: str | None, *, append: bool) -> TextIO:
+    if not out:
+        return sys.stdout
+    path = Path(out)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not append:
+        return path.open("w", encoding="utf-8")
+    truncated = False
+    if path.exists() and path.stat().st_size:
+        with path.open("rb") as handle:
+            handle.seek(-1, os.SEEK_END)
+            truncated = handle.read(1) != b"\n"
+    sink = path.open("a", encoding="utf-8")
+    if truncated:
+        # Terminate a line cut short by an interrupted run so new records start cleanly.
+        sink.write("\n")
+    return sink
+
+
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
-    asyncio.run(_async_main(args.url, args.out))
+    if args.urls_file is None:
+        raise SystemExit(asyncio.run(_async_main(args.url, args.out, not args.no_pdf)))
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.resume and not args.out:
+        parser.error("--resume needs --out pointing at the JSONL file to continue")
+    raise SystemExit(asyncio.run(_batch_main(args)))
 
 
 if __name__ == "__main__":
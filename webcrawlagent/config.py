@@ -12,14 +12,97 @@ class Settings(BaseSettings):
     llm_provider: Literal["gemini", "grok"] = Field(default="gemini", alias="LLM_PROVIDER")
     gemini_api_key: str | None = Field(default=None, alias="GEMINI_API_KEY")
     gemini_model: str = Field(default="gemini-2.5-flash", alias="GEMINI_MODEL")
+    gemini_base_url: str = Field(
+        default="https://generativelanguage.googleapis.com/v1beta", alias="GEMINI_BASE_URL"
+    )
     grok_api_key: str | None = Field(default=None, alias="GROK_API_KEY")
     grok_model: str = Field(default="grok-2-latest", alias="GROK_MODEL")
+    grok_base_url: str = Field(default="https://api.x.ai/v1", alias="GROK_BASE_URL")
+    llm_cache_enabled: bool = Field(default=True, alias="LLM_CACHE_ENABLED")
+    llm_cache_ttl: int = Field(default=86400, ge=0, alias="LLM_CACHE_TTL")
+    llm_cache_max_entries: int = Field(default=256, ge=1, alias="LLM_CACHE_MAX_ENTRIES")
+    llm_cache_dir: Path | None = Field(default=None, alias="LLM_CACHE_DIR")
+    llm_cache_max_mb: int = Field(default=64, ge=1, alias="LLM_CACHE_MAX_MB")
+    llm_max_connections: int = Field(default=20, ge=1, alias="LLM_MAX_CONNECTIONS")
+    llm_http2: bool = Field(default=True, alias="LLM_HTTP2")
+    llm_max_retries: int = Field(default=3, ge=0, alias="LLM_MAX_RETRIES")
+    llm_retry_base_delay: float = Field(default=0.5, ge=0.0, alias="LLM_RETRY_BASE_DELAY")
+    llm_retry_max_delay: float = Field(default=20.0, ge=0.0, alias="LLM_RETRY_MAX_DELAY")
+    llm_hedge_enabled: bool = Field(default=False, alias="LLM_HEDGE_ENABLED")
+    llm_hedge_min_samples: int = Field(default=20, ge=1, alias="LLM_HEDGE_MIN_SAMPLES")
+    llm_breaker_threshold: int = Field(default=5, ge=1, alias="LLM_BREAKER_THRESHOLD")
+    llm_breaker_reset: float = Field(default=30.0, ge=0.0, alias="LLM_BREAKER_RESET_SECONDS")
+    llm_streaming: bool = Field(default=True, alias="LLM_STREAMING")
+    tokenizer_chars_per_token: float | None = Field(
+        default=None, gt=0.0, alias="TOKENIZER_CHARS_PER_TOKEN"
+    )
+    summary_mode: Literal["single", "chunked", "auto"] = Field(
+        default="auto", alias="SUMMARY_MODE"
+    )
+    llm_map_concurrency: int = Field(default=4, ge=1, alias="LLM_MAP_CONCURRENCY")
+    llm_map_chunk_tokens: int = Field(default=3000, ge=500, alias="LLM_MAP_CHUNK_TOKENS")
+    pipeline_enabled: bool = Field(default=True, alias="PIPELINE_ENABLED")
     crawl_max_pages: int = Field(default=3, ge=1, alias="CRAWL_MAX_PAGES")
     crawl_max_tokens: int = Field(default=4000, ge=1000, alias="CRAWL_MAX_TOKENS")
     crawl_timeout: int = Field(default=45, ge=10, alias="CRAWL_TIMEOUT")
     crawl_delay: float = Field(default=1.0, ge=0.0, alias="CRAWL_DELAY_SECONDS")
+    crawl_concurrency: int = Field(default=1, ge=1, alias="CRAWL_CONCURRENCY")
+    crawl_host_concurrency: int = Field(default=2, ge=1, alias="CRAWL_HOST_CONCURRENCY")
+    crawl_burst: int = Field(default=1, ge=1, alias="CRAWL_BURST")
+    crawl_frontier: Literal["priority", "bfs"] = Field(default="priority", alias="CRAWL_FRONTIER")
+    crawl_frontier_size: int = Field(default=500, ge=10, alias="CRAWL_FRONTIER_SIZE")
+    respect_robots: bool = Field(default=True, alias="RESPECT_ROBOTS")
+    robots_max_crawl_delay: float = Field(default=10.0, ge=0.0, alias="ROBOTS_MAX_CRAWL_DELAY")
+    use_sitemaps: bool = Field(default=True, alias="USE_SITEMAPS")
+    sitemap_max_urls: int = Field(default=500, ge=0, alias="SITEMAP_MAX_URLS")
+    sitemap_max_files: int = Field(default=10, ge=1, alias="SITEMAP_MAX_FILES")
+    site_meta_ttl: int = Field(default=3600, ge=0, alias="SITE_META_TTL")
+    site_meta_cache_size: int = Field(default=256, ge=1, alias="SITE_META_CACHE_SIZE")
+    dedupe_enabled: bool = Field(default=True, alias="DEDUPE_ENABLED")
+    dedupe_similarity: float = Field(default=0.9, ge=0.5, le=1.0, alias="DEDUPE_SIMILARITY")
+    nav_wait_strategy: Literal["domcontentloaded", "load", "networkidle", "adaptive"] = Field(
+        default="networkidle", alias="NAV_WAIT_STRATEGY"
+    )
+    nav_stable_ms: int = Field(default=500, ge=50, alias="NAV_STABLE_MS")
+    nav_adaptive_max_ms: int = Field(default=10000, ge=100, alias="NAV_ADAPTIVE_MAX_MS")
+    nav_ready_selector: str | None = Field(default=None, alias="NAV_READY_SELECTOR")
+    crawl_user_agent: str = Field(
+        default="webcrawlagent/0.1 (+https://github.com/nerdylua/webCrawlAgent)",
+        alias="CRAWL_USER_AGENT",
+    )
+    fetch_strategy: Literal["browser", "http-first"] = Field(
+        default="browser", alias="FETCH_STRATEGY"
+    )
+    block_resource_types: str = Field(default="image,font,media", alias="BLOCK_RESOURCE_TYPES")
+    allow_resource_types: str = Field(default="", alias="ALLOW_RESOURCE_TYPES")
+    block_domains: str = Field(default="", alias="BLOCK_DOMAINS")
+    block_trackers: bool = Field(default=True, alias="BLOCK_TRACKERS")
+    http_min_words: int = Field(default=40, ge=0, alias="HTTP_MIN_WORDS")
+    html_parser: Literal["auto", "selectolax", "stream", "bs4"] = Field(
+        default="auto", alias="HTML_PARSER"
+    )
+    crawl_cache_dir: Path | None = Field(default=None, alias="CRAWL_CACHE_DIR")
+    crawl_cache_ttl: int = Field(default=3600, ge=0, alias="CRAWL_CACHE_TTL")
+    crawl_cache_max_mb: int = Field(default=256, ge=1, alias="CRAWL_CACHE_MAX_MB")
     playwright_headless: bool = Field(default=True, alias="PLAYWRIGHT_HEADLESS")
+    playwright_backend: Literal["async", "sync"] = Field(
+        default="async", alias="PLAYWRIGHT_BACKEND"
+    )
+    job_workers: int = Field(default=2, ge=1, alias="JOB_WORKERS")
+    job_queue_size: int = Field(default=16, ge=1, alias="JOB_QUEUE_SIZE")
+    job_retention: int = Field(default=100, ge=0, alias="JOB_RETENTION")
+    job_event_history: int = Field(default=256, ge=1, alias="JOB_EVENT_HISTORY")
+    browser_pool_size: int = Field(default=1, ge=0, alias="BROWSER_POOL_SIZE")
+    browser_pool_contexts: int = Field(default=4, ge=1, alias="BROWSER_POOL_CONTEXTS")
+    browser_recycle_pages: int = Field(default=200, ge=0, alias="BROWSER_RECYCLE_PAGES")
+    browser_max_memory_mb: int = Field(default=0, ge=0, alias="BROWSER_MAX_MEMORY_MB")
     report_output_dir: Path = Field(default=Path("reports"), alias="REPORT_OUTPUT_DIR")
+    report_executor: Literal["process", "thread", "inline"] = Field(
+        default="process", alias="REPORT_EXECUTOR"
+    )
+    report_workers: int = Field(default=2, ge=1, alias="REPORT_WORKERS")
+    metrics_enabled: bool = Field(default=True, alias="METRICS_ENABLED")
+    trace_enabled: bool = Field(default=False, alias="TRACE_ENABLED")
     log_level: Literal["info", "debug"] = Field(default="info", alias="LOG_LEVEL")
 
     model_config = {
@@ -1,10 +1,13 @@
-from .extractor import CrawlResult, PageSnapshot, crawl_site
+from .extractor import CrawlResult, CrawlStream, PageSnapshot, crawl_site
+from .pool import BrowserPool
 from .session import BrowserSession, browser_session
 
 __all__ = [
     "CrawlResult",
+    "CrawlStream",
     "PageSnapshot",
     "crawl_site",
+    "BrowserPool",
     "BrowserSession",
     "browser_session",
 ]
@@ -1,14 +1,32 @@
 from __future__ import annotations
 
+import re
 from collections import Counter
-from collections.abc import Iterable
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
-from webcrawlagent.crawler.extractor import CrawlResult, PageSnapshot
+if TYPE_CHECKING:
+    # Type-only: extractor imports the frontier, which reads CTA_KEYWORDS from here.
+    from webcrawlagent.crawler.extractor import CrawlResult, PageSnapshot
 
 CTA_KEYWORDS = {"contact", "buy", "get", "demo", "signup", "book", "start", "quote"}
+# One alternation for all keywords: a link is scanned once instead of once per keyword.
+_CTA_PATTERN = re.compile(
+    "|".join(re.escape(keyword) for keyword in sorted(CTA_KEYWORDS)), re.IGNORECASE
+)
+# Frequent words of four or more letters that say nothing about a site.
+STOPWORDS = frozenset(
+    {"about", "above", "after", "again", "against", "also", "because", "been", "before",
+     "being", "below", "between", "both", "cannot", "could", "does", "doing", "down",
+     "during", "each", "even", "every", "from", "further", "have", "having", "here", "hers",
+     "herself", "himself", "into", "itself", "just", "like", "many", "more", "most", "much",
+     "must", "myself", "once", "only", "other", "ours", "over", "same", "shall", "should",
+     "some", "such", "than", "that", "their", "theirs", "them", "then", "there", "these",
+     "they", "this", "those", "through", "under", "until", "upon", "very", "were", "what",
+     "when", "where", "which", "while", "whom", "will", "with", "within", "without", "would",
+     "your", "yours", "yourself", "click", "read"}
+)
 
 
 @dataclass(slots=True)
@@ -21,73 +39,94 @@ class AnalysisSummary:
     keywords: list[str]
     ctas: list[str]
     page_summaries: list[dict[str, Any]]
-
-
-def build_analysis(result: CrawlResult) -> AnalysisSummary:
-    page_summaries: list[dict[str, Any]] = []
-    all_headings: list[str] = []
-    internal_links = 0
-    external_links = 0
-    keyword_counter: Counter[str] = Counter()
-    ctas: set[str] = set()
-
-    root_netloc = urlparse(result.root_url).netloc
-
-    for page in result.pages:
-        all_headings.extend(page.headings)
-        page_internal, page_external = _link_split(page.links, root_netloc)
-        internal_links += len(page_internal)
-        external_links += len(page_external)
-
-        keyword_counter.update(_keywords(page.text))
-        ctas.update(_cta_candidates(page))
-
-        summary = {
+    fetch_tiers: dict[str, int] = field(default_factory=dict)
+    blocked_requests: int = 0
+    estimated_bytes_saved: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    duplicate_clusters: list[dict[str, Any]] = field(default_factory=list)
+
+
+class AnalysisAccumulator:
+    """Builds an ``AnalysisSummary`` one page at a time, e.g. while a crawl streams in.
+
+    Each page is visited once: its links are split internal/external using the netlocs
+    parsed at capture time and CTA-matched in the same loop, and its words come from the
+    counts taken while the page was tokenized, so the text is not scanned again. Stopwords
+    are dropped once from the vocabulary in ``finish``, which also lays out per-page
+    summaries and headings in the crawl's page order.
+    """
+
+    def __init__(self, root_url: str):
+        self.root_url = root_url
+        self._root_netloc = urlparse(root_url).netloc
+        self._internal_links = 0
+        self._external_links = 0
+        self._words: Counter[str] = Counter()
+        self._ctas: set[str] = set()
+        self._pages: dict[str, dict[str, Any]] = {}
+        self._headings: dict[str, list[str]] = {}
+
+    def add(self, page: PageSnapshot) -> None:
+        root_netloc = self._root_netloc
+        cta_search = _CTA_PATTERN.search
+        internal = 0
+        for link, netloc in zip(page.links, page.link_netlocs(), strict=True):
+            if netloc == root_netloc:
+                internal += 1
+            if cta_search(link):
+                self._ctas.add(link)
+        self._internal_links += internal
+        self._external_links += len(page.links) - internal
+        words = self._words
+        for word, count in page.word_frequencies().items():
+            if len(word) > 3 and word.isalpha():
+                words[word.lower()] += count
+        self._headings[page.url] = page.headings
+        self._pages[page.url] = {
             "url": page.url,
             "title": page.title or "Untitled page",
             "description": page.description,
             "headings": page.headings[:5],
             "word_count": page.word_count,
             "status": page.status,
+            "fetch_tier": page.fetch_tier,
+            "blocked_requests": page.blocked_requests,
+            "estimated_bytes_saved": page.estimated_bytes_saved,
+            "ready_state": page.ready_state,
+            "timings": page.timings,
         }
-        page_summaries.append(summary)
-
-    top_headings = all_headings[:10]
-    keywords = [word for word, _ in keyword_counter.most_common(12)]
-
-    return AnalysisSummary(
-        root_url=result.root_url,
-        total_pages=len(result.pages),
-        internal_links=internal_links,
-        external_links=external_links,
-        top_headings=top_headings,
-        keywords=keywords,
-        ctas=sorted(ctas),
-        page_summaries=page_summaries,
-    )
 
+    def finish(self, result: CrawlResult) -> AnalysisSummary:
+        urls = [page.url for page in result.pages if page.url in self._pages]
+        all_headings = [heading for url in urls for heading in self._headings[url]]
+        return AnalysisSummary(
+            root_url=result.root_url,
+            total_pages=len(result.pages),
+            internal_links=self._internal_links,
+            external_links=self._external_links,
+            top_headings=all_headings[:10],
+            keywords=[word for word, _ in _keywords(self._words).most_common(12)],
+            ctas=sorted(self._ctas),
+            page_summaries=[self._pages[url] for url in urls],
+            fetch_tiers=result.tier_counts,
+            blocked_requests=sum(page.blocked_requests for page in result.pages),
+            estimated_bytes_saved=sum(page.estimated_bytes_saved for page in result.pages),
+            cache_hits=result.cache_hits,
+            cache_misses=result.cache_misses,
+            duplicate_clusters=[
+                {"canonical": canonical, "duplicates": duplicates}
+                for canonical, duplicates in result.duplicates.items()
+            ],
+        )
 
-def _link_split(links: Iterable[str], root_netloc: str) -> tuple[list[str], list[str]]:
-    internal: list[str] = []
-    external: list[str] = []
-    for link in links:
-        netloc = urlparse(link).netloc
-        if netloc == root_netloc:
-            internal.append(link)
-        else:
-            external.append(link)
-    return internal, external
 
-
-def _keywords(text: str) -> Iterable[str]:
-    tokens = [token.lower() for token in text.split()]
-    return [token for token in tokens if token.isalpha() and len(token) > 3]
+def build_analysis(result: CrawlResult) -> AnalysisSummary:
+    accumulator = AnalysisAccumulator(result.root_url)
+    for page in result.pages:
+        accumulator.add(page)
+    return accumulator.finish(result)
 
 
-def _cta_candidates(page: PageSnapshot) -> Iterable[str]:
-    matches: set[str] = set()
-    for link in page.links:
-        lower = link.lower()
-        if any(keyword in lower for keyword in CTA_KEYWORDS):
-            matches.add(link)
-    return matches
+def _keywords(words: Counter[str]) -> Counter[str]:
+    return Counter({word: count for word, count in words.items() if word not in STOPWORDS})
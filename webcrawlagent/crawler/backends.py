@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Protocol, TypeVar
+
+from playwright.async_api import Browser as AsyncBrowser
+from playwright.async_api import BrowserContext as AsyncBrowserContext
+from playwright.async_api import Page as AsyncPlaywrightPage
+from playwright.async_api import Playwright as AsyncPlaywright
+from playwright.async_api import Route as AsyncRoute
+from playwright.async_api import async_playwright
+from playwright.sync_api import Browser, BrowserContext, Page, Playwright, Route, sync_playwright
+
+from webcrawlagent.config import Settings
+from webcrawlagent.crawler.blocking import ResourceBlocker
+
+_T = TypeVar("_T")
+
+
+class PlaywrightBackend(Protocol):
+    """Async surface shared by the native and thread-bridged Playwright drivers."""
+
+    name: str
+
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+    async def launch(self) -> Any: ...
+
+    async def close_browser(self, browser: Any) -> None: ...
+
+    async def is_connected(self, browser: Any) -> bool: ...
+
+    async def memory_mb(self, browser: Any) -> float | None: ...
+
+    async def new_context(self, browser: Any, blocker: ResourceBlocker | None = None) -> Any: ...
+
+    async def close_context(self, context: Any) -> None: ...
+
+    async def new_page(self, context: Any) -> Any: ...
+
+    def unwrap(self, page: Any) -> Any: ...
+
+
+class AsyncPlaywrightBackend:
+    """Drives ``playwright.async_api`` directly on the running event loop.
+
+    Every page is a native awaitable object, so many pages can navigate concurrently
+    without any thread hops.
+    """
+
+    name = "async"
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self._playwright: AsyncPlaywright | None = None
+
+    async def start(self) -> None:
+        self._playwright = await async_playwright().start()
+
+    async def stop(self) -> None:
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def launch(self) -> AsyncBrowser:
+        if not self._playwright:
+            raise RuntimeError("Playwright backend is not running")
+        return await self._playwright.chromium.launch(headless=self.settings.playwright_headless)
+
+    async def close_browser(self, browser: AsyncBrowser) -> None:
+        with contextlib.suppress(Exception):
+            await browser.close()
+
+    async def is_connected(self, browser: AsyncBrowser) -> bool:
+        return browser.is_connected()
+
+    async def memory_mb(self, browser: AsyncBrowser) -> float | None:
+        try:
+            cdp = await browser.new_browser_cdp_session()
+            try:
+                info = await cdp.send("SystemInfo.getProcessInfo")
+            finally:
+                await cdp.detach()
+        except Exception:
+            return None
+        return _rss_mb(process["id"] for process in info.get("processInfo", []))
+
+    async def new_context(
+        self, browser: AsyncBrowser, blocker: ResourceBlocker | None = None
+    ) -> AsyncBrowserContext:
+        context = await browser.new_context()
+        timeout_ms = self.settings.crawl_timeout * 1000
+        context.set_default_navigation_timeout(timeout_ms)
+        context.set_default_timeout(timeout_ms)
+        if blocker:
+
+            async def _route(route: AsyncRoute) -> None:
+                if blocker.check(route.request):
+                    await route.abort()
+                else:
+                    await route.continue_()
+
+            await context.route("**/*", _route)
+        return context
+
+    async def close_context(self, context: AsyncBrowserContext) -> None:
+        # The browser may already be gone if it crashed mid-crawl.
+        with contextlib.suppress(Exception):
+            await context.close()
+
+    async def new_page(self, context: AsyncBrowserContext) -> AsyncPlaywrightPage:
+        return await context.new_page()
+
+    def unwrap(self, page: AsyncPlaywrightPage) -> AsyncPlaywrightPage:
+        return page
+
+
+class SyncPlaywrightBackend:
+    """Drives the sync Playwright API from a single dedicated worker thread.
+
+    Sync Playwright objects are bound to the thread that created them, so every call
+    hops onto that thread and all pages are effectively serialized. Kept selectable
+    (``PLAYWRIGHT_BACKEND=sync``) for benchmarking against the native backend.
+    """
+
+    name = "sync"
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self._playwright: Playwright | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playwright")
+        try:
+            self._playwright = await self.run(sync_playwright().start)
+        except Exception:
+            self._shutdown_executor()
+            raise
+
+    async def stop(self) -> None:
+        if not self._executor:
+            return
+        try:
+            if self._playwright:
+                await self.run(self._playwright.stop)
+                self._playwright = None
+        finally:
+            self._shutdown_executor()
+
+    async def launch(self) -> Browser:
+        if not self._playwright:
+            raise RuntimeError("Playwright backend is not running")
+        return await self.run(
+            self._playwright.chromium.launch, headless=self.settings.playwright_headless
+        )
+
+    async def close_browser(self, browser: Browser) -> None:
+        await self.run(_suppressed, browser.close)
+
+    async def is_connected(self, browser: Browser) -> bool:
+        return await self.run(browser.is_connected)
+
+    async def memory_mb(self, browser: Browser) -> float | None:
+        return await self.run(_sync_memory_mb, browser)
+
+    async def new_context(
+        self, browser: Browser, blocker: ResourceBlocker | None = None
+    ) -> BrowserContext:
+        return await self.run(self._new_context, browser, blocker)
+
+    async def close_context(self, context: BrowserContext) -> None:
+        # The browser may already be gone if it crashed mid-crawl.
+        await self.run(_suppressed, context.close)
+
+    async def new_page(self, context: BrowserContext) -> AsyncPage:
+        page = await self.run(context.new_page)
+        return AsyncPage(self, page)
+
+    def unwrap(self, page: AsyncPage) -> Page:
+        return page._page
+
+    async def run(self, func: Callable[..., _T], /, *args, **kwargs) -> _T:
+        if not self._executor or not self._loop:
+            raise RuntimeError("Playwright backend is not running")
+        call = partial(func, *args, **kwargs)
+        return await self._loop.run_in_executor(self._executor, call)
+
+    def _new_context(self, browser: Browser, blocker: ResourceBlocker | None) -> BrowserContext:
+        context = browser.new_context()
+        timeout_ms = self.settings.crawl_timeout * 1000
+        context.set_default_navigation_timeout(timeout_ms)
+        context.set_default_timeout(timeout_ms)
+        if blocker:
+
+            def _route(route: Route) -> None:
+                if blocker.check(route.request):
+                    route.abort()
+                else:
+                    route.continue_()
+
+            context.route("**/*", _route)
+        return context
+
+    def _shutdown_executor(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self._loop = None
+
+
+class AsyncPage:
+    """Async wrapper over a sync Playwright page bound to a single thread."""
+
+    def __init__(self, backend: SyncPlaywrightBackend, page: Page):
+        self._backend = backend
+        self._page = page
+
+    def __getattr__(self, name):
+        attr = getattr(self._page, name)
+        if callable(attr):
+            async def _method(*args, **kwargs):
+                return await self._backend.run(attr, *args, **kwargs)
+
+            return _method
+        return attr
+
+
+def create_backend(settings: Settings) -> PlaywrightBackend:
+    if settings.playwright_backend == "sync":
+        return SyncPlaywrightBackend(settings)
+    return AsyncPlaywrightBackend(settings)
+
+
+def _suppressed(func: Callable[[], Any]) -> None:
+    with contextlib.suppress(Exception):
+        func()
+
+
+def _sync_memory_mb(browser: Browser) -> float | None:
+    try:
+        cdp = browser.new_browser_cdp_session()
+        try:
+            info = cdp.send("SystemInfo.getProcessInfo")
+        finally:
+            cdp.detach()
+    except Exception:
+        return None
+    return _rss_mb(process["id"] for process in info.get("processInfo", []))
+
+
+def _rss_mb(pids: Iterable[int]) -> float | None:
+    """Sum the resident memory of ``pids`` as reported by ``/proc``.
+
+    Process ids come from the DevTools ``SystemInfo`` domain, so this only reports on
+    Linux; elsewhere it returns ``None`` and memory-based recycling is skipped.
+    """
+    page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+    total = 0
+    found = False
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/statm", encoding="ascii") as handle:
+                total += int(handle.read().split()[1]) * page_size
+                found = True
+        except (OSError, ValueError, IndexError):
+            continue
+    return total / (1024 * 1024) if found else None
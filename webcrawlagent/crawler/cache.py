@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import Counter
+from dataclasses import dataclass, field, fields
+
+from webcrawlagent.config import Settings
+from webcrawlagent.crawler.extractor import PageSnapshot
+from webcrawlagent.crawler.fetcher import HttpFetcher, HttpPage
+from webcrawlagent.crawler.urls import normalize_url
+from webcrawlagent.diskcache import SqliteLRUCache
+from webcrawlagent.tokenizer import index_words, tokenizer_for
+
+# Rebuilt on load: they are large, and the token offsets depend on the tokenizer
+# calibration in effect when the page is read, not when it was stored.
+DERIVED_FIELDS = frozenset({"token_index", "char_index", "netlocs", "word_counts"})
+# Entries written by older versions may carry renamed or derived fields; those are dropped.
+_STORED_FIELDS = frozenset(item.name for item in fields(PageSnapshot)) - DERIVED_FIELDS
+
+
+@dataclass(slots=True)
+class CachedPage:
+    snapshot: PageSnapshot
+    validators: dict[str, str] = field(default_factory=dict)
+    stored_at: float = 0.0
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.stored_at < ttl
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if etag := self.validators.get("etag"):
+            headers["If-None-Match"] = etag
+        if last_modified := self.validators.get("last-modified"):
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+
+class PageCache:
+    """Persistent ``PageSnapshot`` cache keyed by normalized URL.
+
+    Entries younger than ``CRAWL_CACHE_TTL`` are reused as-is; older ones carry their
+    ``ETag``/``Last-Modified`` validators so the crawler can revalidate them with a
+    conditional GET instead of re-rendering the page.
+    """
+
+    def __init__(self, settings: Settings, revalidator: HttpFetcher | None = None):
+        self.ttl = settings.crawl_cache_ttl
+        self.revalidator = revalidator
+        self._tokenizer = tokenizer_for(settings)
+        directory = settings.crawl_cache_dir
+        self._store = SqliteLRUCache(
+            directory / "pages.sqlite3", settings.crawl_cache_max_mb * 1024 * 1024
+        )
+
+    async def get(self, url: str) -> CachedPage | None:
+        return await asyncio.to_thread(self._load, url)
+
+    async def put(self, snapshot: PageSnapshot, validators: dict[str, str]) -> None:
+        stored = {
+            item.name: getattr(snapshot, item.name)
+            for item in fields(PageSnapshot)
+            if item.name not in DERIVED_FIELDS
+        }
+        payload = json.dumps(
+            {"snapshot": stored, "validators": validators}, ensure_ascii=False
+        ).encode("utf-8")
+        await asyncio.to_thread(self._store.set, _key(snapshot.url), payload)
+
+    async def revalidate(self, url: str, cached: CachedPage) -> HttpPage | None:
+        """Conditional GET for a stale entry; ``not_modified`` means it can be reused."""
+        headers = cached.conditional_headers()
+        if not self.revalidator or not headers:
+            return None
+        return await self.revalidator.fetch(url, headers=headers)
+
+    async def refresh(self, url: str) -> None:
+        await asyncio.to_thread(self._store.refresh, _key(url))
+
+    def close(self) -> None:
+        self._store.close()
+
+    def _load(self, url: str) -> CachedPage | None:
+        row = self._store.get(_key(url))
+        if row is None:
+            return None
+        value, stored_at = row
+        data = json.loads(value)
+        stored = {name: item for name, item in data["snapshot"].items() if name in _STORED_FIELDS}
+        snapshot = PageSnapshot(**stored)
+        snapshot.word_counts = Counter()
+        snapshot.token_index, snapshot.char_index = index_words(
+            snapshot.text, self._tokenizer, snapshot.word_counts
+        )
+        snapshot.token_estimate = snapshot.token_index[-1] if snapshot.token_index else 0
+        # ``netlocs`` is rebuilt lazily by ``PageSnapshot.link_netlocs``.
+        return CachedPage(
+            snapshot=snapshot,
+            validators=data.get("validators", {}),
+            stored_at=stored_at,
+        )
+
+
+def _key(url: str) -> str:
+    return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
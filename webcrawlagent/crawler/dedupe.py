@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import hashlib
+import heapq
+
+FINGERPRINT_BITS = 64
+SHINGLE_WORDS = 3
+# Only the numerically smallest shingle hashes are kept. The sample is consistent
+# across pages (the same shingle always hashes the same), so fingerprints stay
+# comparable while long pages cost a bounded amount of work.
+MAX_FEATURES = 1024
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash over lower-cased word 3-shingles; ``0`` for empty text."""
+    words = text.lower().split()
+    if not words:
+        return 0
+    span = min(SHINGLE_WORDS, len(words))
+    shingles = {" ".join(words[i : i + span]) for i in range(len(words) - span + 1)}
+    features = heapq.nsmallest(MAX_FEATURES, map(_hash64, shingles))
+    weights = [0] * FINGERPRINT_BITS
+    for feature in features:
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += 1 if feature >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def similarity(left: int, right: int) -> float:
+    """Share of matching fingerprint bits, from ``0.0`` to ``1.0``."""
+    return 1 - (left ^ right).bit_count() / FINGERPRINT_BITS
+
+
+class DuplicateIndex:
+    """Groups pages whose fingerprints are at least ``threshold`` similar.
+
+    The first page seen becomes the cluster's canonical page; later matches are
+    recorded against it.
+    """
+
+    def __init__(self, threshold: float):
+        self.max_distance = int((1 - threshold) * FINGERPRINT_BITS)
+        self.clusters: dict[str, list[str]] = {}
+        self._canonical: list[tuple[int, str]] = []
+
+    def add(self, url: str, fingerprint: int) -> str | None:
+        """Register ``url``; returns the canonical URL it duplicates, if any."""
+        if fingerprint:
+            for known, canonical in self._canonical:
+                if (known ^ fingerprint).bit_count() <= self.max_distance:
+                    self.clusters.setdefault(canonical, []).append(url)
+                    return canonical
+        self._canonical.append((fingerprint, url))
+        return None
+
+
+def _hash64(shingle: str) -> int:
+    digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
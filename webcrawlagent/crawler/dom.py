@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+# Everything crawl_site needs from a rendered page, gathered in one evaluate round trip.
+# ``a.href`` is already resolved against the document base URL by the browser.
+EXTRACT_SCRIPT = """
+() => {
+  const clean = (value) => (value || "").replace(/\\s+/g, " ").trim();
+  const meta = document.querySelector('meta[name="description" i]');
+  const titleTag = document.querySelector("title");
+  const anchors = Array.from(document.querySelectorAll("a[href]"))
+    .filter((a) => typeof a.href === "string");
+  return {
+    title: clean(titleTag ? titleTag.textContent : ""),
+    description: clean(meta ? meta.getAttribute("content") : ""),
+    headings: Array.from(document.querySelectorAll("h1, h2, h3"), (el) => clean(el.textContent))
+      .filter(Boolean),
+    links: anchors.map((a) => a.href),
+    anchors: anchors.map((a) => clean(a.textContent || a.getAttribute("aria-label") || a.title)),
+    text: document.body ? document.body.innerText : "",
+  };
+}
+"""
+
+
+@dataclass(slots=True)
+class PageContent:
+    """Raw fields pulled out of a page, before normalization into a ``PageSnapshot``."""
+
+    title: str
+    description: str
+    headings: list[str]
+    links: list[str]
+    text: str
+    # Anchor text for each entry of ``links`` (same length, ``""`` when there is none).
+    anchors: list[str] = field(default_factory=list)
+
+
+async def extract_in_page(page: Any) -> PageContent:
+    data = await page.evaluate(EXTRACT_SCRIPT)
+    return PageContent(
+        title=data.get("title") or "",
+        description=data.get("description") or "",
+        headings=list(data.get("headings") or []),
+        links=list(data.get("links") or []),
+        text=data.get("text") or "",
+        anchors=list(data.get("anchors") or []),
+    )
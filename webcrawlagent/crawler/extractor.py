@@ -1,21 +1,37 @@
 from __future__ import annotations
 
 import asyncio
-from collections import deque
-from collections.abc import Callable, Coroutine, Iterable
-from dataclasses import dataclass, field
-from urllib.parse import urljoin, urlparse
-
-from bs4 import BeautifulSoup
+from bisect import bisect_right
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Coroutine
+from dataclasses import dataclass, field, replace
+from itertools import zip_longest
+from typing import TYPE_CHECKING
+from urllib.parse import urljoin, urlparse, urlsplit
 
 from webcrawlagent.config import Settings
+from webcrawlagent.crawler.dedupe import DuplicateIndex, simhash
+from webcrawlagent.crawler.dom import PageContent, extract_in_page
+from webcrawlagent.crawler.fetcher import (
+    HttpFetcher,
+    HttpPage,
+    needs_js_rendering,
+    response_validators,
+)
+from webcrawlagent.crawler.frontier import SCORERS, Frontier, Scorer
+from webcrawlagent.crawler.navigation import navigate
+from webcrawlagent.crawler.parsers import get_parser
 from webcrawlagent.crawler.session import BrowserSession
+from webcrawlagent.crawler.throttle import HostThrottle
+from webcrawlagent.crawler.urls import canonicalize_url
+from webcrawlagent.metrics import BLOCKED_REQUESTS, CACHE_LOOKUPS, PAGE_BYTES, PAGES, span
+from webcrawlagent.tokenizer import Tokenizer, get_tokenizer, index_words, tokenizer_for
 
-ProgressHook = Callable[[str], Coroutine[None, None, None]]
-
+if TYPE_CHECKING:
+    from webcrawlagent.crawler.cache import PageCache
+    from webcrawlagent.crawler.sitemeta import SiteMeta
 
-def _approx_tokens(text: str) -> int:
-    return max(1, int(len(text.split()) * 1.2))
+ProgressHook = Callable[[str], Coroutine[None, None, None]]
 
 
 def _clean_text(text: str) -> str:
@@ -34,24 +50,61 @@ class PageSnapshot:
     word_count: int
     token_estimate: int
     status: str = "ok"
+    fetch_tier: str = "browser"
+    blocked_requests: int = 0
+    estimated_bytes_saved: int = 0
+    ready_state: str = ""
+    timings: dict[str, float] = field(default_factory=dict)
+    fingerprint: int = 0
+    # Internal link -> anchor text it was discovered with.
+    anchors: dict[str, str] = field(default_factory=dict)
+    # Cumulative token count and end character offset per word, see ``index_words``.
+    token_index: list[int] = field(default_factory=list, repr=False)
+    char_index: list[int] = field(default_factory=list, repr=False)
+    # Host of each entry in ``links``, parsed once when the page is captured.
+    netlocs: list[str] = field(default_factory=list, repr=False)
+    # Occurrences of each word of ``text`` (case kept), counted by ``index_words``.
+    word_counts: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def link_netlocs(self) -> list[str]:
+        if len(self.netlocs) != len(self.links):
+            self.netlocs = [urlsplit(link).netloc for link in self.links]
+        return self.netlocs
+
+    def word_frequencies(self) -> dict[str, int]:
+        if not self.word_counts and self.text:
+            self.word_counts = Counter(self.text.split(" "))
+        return self.word_counts
 
     def trimmed_text(self, max_tokens: int) -> str:
         if self.token_estimate <= max_tokens:
             return self.text
-        words = self.text.split()
-        allowed = int(max_tokens / max(self.token_estimate, 1) * len(words))
-        return " ".join(words[:max(allowed, 1)]) + "..."
+        if not self.token_index:
+            self.token_index, self.char_index = index_words(self.text, get_tokenizer())
+        words = max(bisect_right(self.token_index, max_tokens), 1)
+        return self.text[: self.char_index[words - 1]] + "..."
 
 
 @dataclass(slots=True)
 class CrawlResult:
     root_url: str
     pages: list[PageSnapshot] = field(default_factory=list)
+    cache_hits: int = 0
+    cache_misses: int = 0
+    # Canonical URL -> near-duplicate URLs that were dropped from ``pages``.
+    duplicates: dict[str, list[str]] = field(default_factory=dict)
+    # URLs skipped because robots.txt disallows them.
+    disallowed: list[str] = field(default_factory=list)
 
     @property
     def total_tokens(self) -> int:
         return sum(page.token_estimate for page in self.pages)
 
+    @property
+    def tier_counts(self) -> dict[str, int]:
+        """How many pages each fetch tier (``http`` / ``browser``) served."""
+        return dict(Counter(page.fetch_tier for page in self.pages))
+
     def aggregate_text(self, max_tokens: int) -> list[str]:
         remaining = max_tokens
         chunks: list[str] = []
@@ -69,91 +122,326 @@ async def crawl_site(
     session: BrowserSession,
     settings: Settings,
     progress: ProgressHook | None = None,
+    *,
+    http: HttpFetcher | None = None,
+    cache: PageCache | None = None,
+    scorer: Scorer | None = None,
+    site: SiteMeta | None = None,
 ) -> CrawlResult:
-    root = url.rstrip("/")
-    parsed_root = urlparse(root)
-    queue: deque[str] = deque([root])
-    seen: set[str] = set()
-    pages: list[PageSnapshot] = []
-
-    async def emit(message: str) -> None:
-        if progress:
-            await progress(message)
-
-    while queue and len(pages) < settings.crawl_max_pages:
-        current = queue.popleft()
-        if current in seen:
-            continue
-        seen.add(current)
-        await emit(f"Visiting {current}")
-        page = await session.new_page()
+    """Crawl ``url`` to completion and return every page; see ``CrawlStream``."""
+    stream = CrawlStream(
+        url, session, settings, progress, http=http, cache=cache, scorer=scorer, site=site
+    )
+    async for _ in stream:
+        pass
+    return stream.result
+
+
+class CrawlStream:
+    """Crawl ``url`` in frontier order, yielding each ``PageSnapshot`` as it lands.
+
+    The next URL is always the best-scored pending one (``CRAWL_FRONTIER`` selects the
+    scorer unless ``scorer`` is given); links are deduplicated by their canonical form so
+    each page is visited once, but fetched as linked. ``site`` (from ``SiteMetaFetcher``)
+    seeds the frontier with sitemap entries and enforces robots.txt ``Disallow`` rules and
+    ``Crawl-delay``.
+
+    Up to ``CRAWL_CONCURRENCY`` pages are in flight; pages are yielded in completion
+    order, while ``result.pages`` (available once iteration ends) keeps dispatch order, so
+    ``CRAWL_CONCURRENCY=1`` reproduces the strictly serial crawl. Politeness is enforced
+    per host by ``HostThrottle``. When ``http`` is given, each page is first fetched over
+    plain HTTP and only escalated to the browser if it looks client-rendered. With a
+    ``cache``, fresh entries are reused and stale ones are revalidated before anything is
+    fetched. Near-duplicates of an already crawled page (``DEDUPE_SIMILARITY``) still
+    count towards ``CRAWL_MAX_PAGES`` but are neither yielded nor followed.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        session: BrowserSession,
+        settings: Settings,
+        progress: ProgressHook | None = None,
+        *,
+        http: HttpFetcher | None = None,
+        cache: PageCache | None = None,
+        scorer: Scorer | None = None,
+        site: SiteMeta | None = None,
+    ):
+        self.root_url = url.rstrip("/")
+        self.session = session
+        self.settings = settings
+        self.progress = progress
+        self.http = http
+        self.cache = cache
+        self.scorer = scorer or SCORERS[settings.crawl_frontier]
+        self.site = site
+        self._result: CrawlResult | None = None
+
+    @property
+    def result(self) -> CrawlResult:
+        if self._result is None:
+            raise RuntimeError("the crawl has not finished yet")
+        return self._result
+
+    def __aiter__(self) -> AsyncIterator[PageSnapshot]:
+        return self._pages()
+
+    async def _pages(self) -> AsyncIterator[PageSnapshot]:
+        settings = self.settings
+        site = self.site
+        root_netloc = urlparse(canonicalize_url(self.root_url)).netloc
+        frontier = Frontier(settings.crawl_frontier_size, self.scorer)
+        frontier.push(self.root_url, depth=0)
+        disallowed: list[str] = []
+        visited: dict[int, PageSnapshot] = {}
+        in_flight: dict[asyncio.Task[PageSnapshot | None], tuple[int, int]] = {}
+        dispatched = 0
+        dedupe = DuplicateIndex(settings.dedupe_similarity) if settings.dedupe_enabled else None
+        dropped = 0
+        throttle = HostThrottle(
+            settings.crawl_host_concurrency, settings.crawl_delay, settings.crawl_burst
+        )
+
+        async def emit(message: str) -> None:
+            if self.progress:
+                await self.progress(message)
+
+        if site:
+            _apply_site_meta(site, frontier, throttle, root_netloc, settings)
+        crawl = _CrawlContext(
+            self.session, settings, throttle, emit, self.http, self.cache, tokenizer_for(settings)
+        )
+
         try:
-            response = await page.goto(current, wait_until="networkidle")
-            status = str(response.status) if response else "unknown"
-            html = await page.content()
-            text = await page.inner_text("body")
-        except Exception as exc:  # pragma: no cover - network instability
-            await emit(f"Failed to load {current}: {exc}")
-            await page.close()
-            continue
+            while frontier or in_flight:
+                while (
+                    frontier
+                    and len(in_flight) < settings.crawl_concurrency
+                    and len(visited) + dropped + len(in_flight) < settings.crawl_max_pages
+                ):
+                    candidate = frontier.pop()
+                    if candidate is None:
+                        break
+                    if site and not site.allows(candidate.url):
+                        disallowed.append(candidate.url)
+                        await emit(f"Skipping {candidate.url} (disallowed by robots.txt)")
+                        continue
+                    task = asyncio.create_task(_visit(candidate.url, crawl))
+                    in_flight[task] = (dispatched, candidate.depth)
+                    dispatched += 1
+                if not in_flight:
+                    break
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=in_flight.__getitem__):
+                    order, depth = in_flight.pop(task)
+                    page_snapshot = task.result()
+                    if page_snapshot is None:
+                        continue
+                    if dedupe and _is_duplicate(page_snapshot, dedupe):
+                        dropped += 1
+                        await emit(f"Skipping near-duplicate {page_snapshot.url}")
+                        continue
+                    visited[order] = page_snapshot
+                    for link in _internal_links(page_snapshot, root_netloc):
+                        frontier.push(
+                            link, depth=depth + 1, anchor=page_snapshot.anchors.get(link, "")
+                        )
+                    yield page_snapshot
         finally:
+            for task in in_flight:
+                task.cancel()
+
+        pages = [visited[order] for order in sorted(visited)]
+        result = CrawlResult(root_url=self.root_url, pages=pages, disallowed=disallowed)
+        if dedupe:
+            result.duplicates = dedupe.clusters
+        if self.cache:
+            result.cache_hits = sum(page.fetch_tier == "cache" for page in pages)
+            result.cache_misses = len(pages) - result.cache_hits
+        self._result = result
+
+
+@dataclass(slots=True)
+class _CrawlContext:
+    session: BrowserSession
+    settings: Settings
+    throttle: HostThrottle
+    emit: ProgressHook
+    http: HttpFetcher | None
+    cache: PageCache | None
+    tokenizer: Tokenizer
+
+
+async def _visit(url: str, crawl: _CrawlContext) -> PageSnapshot | None:
+    # Fresh hits make no request, so they skip the per-host throttle entirely.
+    cached = await crawl.cache.get(url) if crawl.cache else None
+    if cached and cached.is_fresh(crawl.cache.ttl):
+        CACHE_LOOKUPS.inc(cache="page", result="hit")
+        await crawl.emit(f"Visiting {url} (cached)")
+        return _count_page(replace(cached.snapshot, fetch_tier="cache", timings={}))
+    async with crawl.throttle.slot(url):
+        await crawl.emit(f"Visiting {url}")
+        http_page: HttpPage | None = None
+        if cached:
+            http_page = await crawl.cache.revalidate(url, cached)
+            if http_page and http_page.not_modified:
+                CACHE_LOOKUPS.inc(cache="page", result="revalidated")
+                await crawl.cache.refresh(url)
+                return _count_page(replace(cached.snapshot, fetch_tier="cache", timings={}))
+        if crawl.cache:
+            CACHE_LOOKUPS.inc(cache="page", result="miss")
+        fetched = await _fetch(url, crawl, http_page)
+    if fetched is None:
+        return None
+    snapshot, validators = fetched
+    if crawl.cache:
+        await crawl.cache.put(snapshot, validators)
+    return _count_page(snapshot)
+
+
+def _count_page(snapshot: PageSnapshot) -> PageSnapshot:
+    PAGES.inc(tier=snapshot.fetch_tier)
+    PAGE_BYTES.inc(len(snapshot.text.encode("utf-8")), tier=snapshot.fetch_tier)
+    if snapshot.blocked_requests:
+        BLOCKED_REQUESTS.inc(snapshot.blocked_requests)
+    return snapshot
+
+
+async def _fetch(
+    url: str, crawl: _CrawlContext, http_page: HttpPage | None
+) -> tuple[PageSnapshot, dict[str, str]] | None:
+    settings = crawl.settings
+    # A cache revalidation that returned a new body is used even in browser-only mode,
+    # so the page is only downloaded again when it really needs JavaScript.
+    if crawl.http or http_page:
+        with span("page.http", url=url) as fetch:
+            if http_page is None:
+                http_page = await crawl.http.fetch(url)
+        http_ms = fetch.duration_ms
+        if http_page:
+            with span("page.parse", url=url):
+                parser = get_parser(settings.html_parser)
+                content = parser.parse(http_page.html, http_page.final_url)
+            if not needs_js_rendering(
+                http_page.html, content.text, min_words=settings.http_min_words
+            ):
+                snapshot = _build_snapshot(
+                    url, str(http_page.status), content, crawl.tokenizer, fetch_tier="http"
+                )
+                snapshot.timings["http_ms"] = http_ms
+                return snapshot, http_page.validators
+        await crawl.emit(f"Escalating {url} to the browser")
+    page = await crawl.session.new_page()
+    try:
+        with span("page.navigate", url=url):
+            response, timings, ready_state = await navigate(page, url, settings)
+        status = str(response.status) if response else "unknown"
+        validators = response_validators(response.headers) if response else {}
+        with span("page.extract", url=url) as extract:
+            content = await extract_in_page(page)
+        timings["extract_ms"] = extract.duration_ms
+    except Exception as exc:  # pragma: no cover - network instability
+        await crawl.emit(f"Failed to load {url}: {exc}")
+        return None
+    finally:
+        try:
             await page.close()
+        finally:
+            # Popped after close so no late subrequest can re-create the entry.
+            blocked = crawl.session.block_stats(page)
+    snapshot = _build_snapshot(url, status, content, crawl.tokenizer)
+    snapshot.blocked_requests = blocked.blocked_requests
+    snapshot.estimated_bytes_saved = blocked.estimated_bytes_saved
+    snapshot.ready_state = ready_state
+    snapshot.timings.update(timings)
+    return snapshot, validators
 
-        soup = BeautifulSoup(html, "html.parser")
-        title = _clean_text(soup.title.string) if soup.title and soup.title.string else ""
-        description_tag = soup.find("meta", attrs={"name": "description"})
-        if description_tag and description_tag.get("content"):
-            description = _clean_text(description_tag["content"])
-        else:
-            description = ""
-        headings = [
-            _clean_text(h.get_text(" ", strip=True)) for h in soup.find_all(["h1", "h2", "h3"])
-        ]
-        headings = [h for h in headings if h]
-        links = [_normalize_link(a.get("href"), current) for a in soup.find_all("a", href=True)]
-        links = [link for link in links if link]
-        cleaned_text = _clean_text(text)
-        token_estimate = _approx_tokens(cleaned_text)
-        page_snapshot = PageSnapshot(
-            url=current,
-            title=title,
-            description=description,
-            headings=headings[:30],
-            links=links,
-            text=cleaned_text,
-            word_count=len(cleaned_text.split()),
-            token_estimate=token_estimate,
-            status=status,
-        )
-        pages.append(page_snapshot)
 
-        internal_links = _internal_links(links, parsed_root.netloc)
-        for link in internal_links:
-            if link not in seen and len(queue) < settings.crawl_max_pages * 3:
-                queue.append(link)
+def _build_snapshot(
+    url: str,
+    status: str,
+    content: PageContent,
+    tokenizer: Tokenizer,
+    *,
+    fetch_tier: str = "browser",
+) -> PageSnapshot:
+    headings = [heading for heading in map(_clean_text, content.headings) if heading]
+    links: list[str] = []
+    netlocs: list[str] = []
+    anchors: dict[str, str] = {}
+    for href, anchor in zip_longest(content.links, content.anchors[: len(content.links)]):
+        normalized = _normalize_link(href, url)
+        if not normalized:
+            continue
+        link, netloc = normalized
+        links.append(link)
+        netlocs.append(netloc)
+        if anchor and link not in anchors:
+            anchors[link] = _clean_text(anchor)[:120]
+    cleaned_text = _clean_text(content.text)
+    word_counts: Counter[str] = Counter()
+    token_index, char_index = index_words(cleaned_text, tokenizer, word_counts)
+    return PageSnapshot(
+        url=url,
+        title=_clean_text(content.title),
+        description=_clean_text(content.description),
+        headings=headings[:30],
+        links=links,
+        text=cleaned_text,
+        word_count=len(char_index),
+        token_estimate=token_index[-1] if token_index else 0,
+        status=status,
+        fetch_tier=fetch_tier,
+        fingerprint=simhash(cleaned_text),
+        anchors=anchors,
+        token_index=token_index,
+        char_index=char_index,
+        netlocs=netlocs,
+        word_counts=word_counts,
+    )
+
+
+def _apply_site_meta(
+    site: SiteMeta,
+    frontier: Frontier,
+    throttle: HostThrottle,
+    root_netloc: str,
+    settings: Settings,
+) -> None:
+    if site.crawl_delay:
+        delay = min(site.crawl_delay, settings.robots_max_crawl_delay)
+        throttle.set_delay(root_netloc, max(delay, settings.crawl_delay))
+    for entry in site.sitemap:
+        if urlparse(entry.url).netloc.lower() == root_netloc:
+            frontier.push(
+                entry.url, depth=1, sitemap_priority=entry.priority, lastmod=entry.lastmod
+            )
 
-        if settings.crawl_delay:
-            await asyncio.sleep(settings.crawl_delay)
 
-    return CrawlResult(root_url=root, pages=pages)
+def _is_duplicate(page: PageSnapshot, dedupe: DuplicateIndex) -> bool:
+    if not page.fingerprint:
+        page.fingerprint = simhash(page.text)
+    return dedupe.add(page.url, page.fingerprint) is not None
 
 
-def _normalize_link(href: str | None, base_url: str) -> str | None:
+def _normalize_link(href: str | None, base_url: str) -> tuple[str, str] | None:
+    """Absolute, fragment-free ``href`` and its netloc, or ``None`` for non-HTTP links."""
     if not href:
         return None
     if href.startswith("javascript:"):
         return None
     absolute = urljoin(base_url, href)
-    parsed = urlparse(absolute)
+    parsed = urlsplit(absolute)
     if parsed.scheme not in {"http", "https"}:
         return None
-    return absolute.split("#")[0]
+    return absolute.split("#")[0], parsed.netloc
 
 
-def _internal_links(links: Iterable[str], netloc: str) -> list[str]:
-    internal: list[str] = []
-    for link in links:
-        parsed = urlparse(link)
-        if parsed.netloc == netloc:
-            internal.append(link)
-    return internal
+def _internal_links(page: PageSnapshot, netloc: str) -> list[str]:
+    return [
+        link
+        for link, link_netloc in zip(page.links, page.link_netlocs(), strict=True)
+        if link_netloc == netloc
+    ]
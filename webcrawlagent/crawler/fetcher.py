@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+import httpx
+
+from webcrawlagent.config import Settings
+
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+# Empty mount points left behind by client-rendered frameworks (React, Vue, Nuxt, Angular...).
+_EMPTY_APP_ROOT = re.compile(
+    r"<(div|main|app-root)[^>]*\bid=[\"']?(root|app|__next|__nuxt|svelte|main-app)\b[^>]*>\s*</\1>"
+    r"|<app-root[^>]*>\s*</app-root>",
+    re.IGNORECASE,
+)
+_NOSCRIPT_WALL = re.compile(
+    r"<noscript[^>]*>[^<]*(enable|requires?|turn on|need)[^<]{0,40}javascript",
+    re.IGNORECASE,
+)
+
+
+@dataclass(slots=True)
+class HttpPage:
+    url: str
+    final_url: str
+    status: int
+    html: str
+    validators: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+
+class HttpFetcher:
+    """Pooled ``httpx`` client backing the HTTP-first fetch tier.
+
+    One client (and its keep-alive connection pool) is shared by every crawl, so
+    server-rendered pages can be fetched without paying for a browser navigation.
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self._client = httpx.AsyncClient(
+            timeout=settings.crawl_timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            headers={"User-Agent": settings.crawl_user_agent},
+        )
+
+    async def fetch(self, url: str, headers: dict[str, str] | None = None) -> HttpPage | None:
+        """GET ``url``; returns ``None`` when the browser tier should handle it instead.
+
+        ``headers`` may carry conditional validators, in which case a ``304`` comes back
+        as an ``HttpPage`` with ``not_modified`` set and an empty body.
+        """
+        try:
+            response = await self._client.get(url, headers=headers)
+        except httpx.HTTPError:
+            return None
+        if response.status_code == 304:
+            return HttpPage(url=url, final_url=str(response.url), status=304, html="")
+        content_type = response.headers.get("content-type", "").lower()
+        if response.status_code >= 400 or not content_type.startswith(HTML_CONTENT_TYPES):
+            return None
+        return HttpPage(
+            url=url,
+            final_url=str(response.url),
+            status=response.status_code,
+            html=response.text,
+            validators=response_validators(response.headers),
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+def response_validators(headers: Mapping[str, str]) -> dict[str, str]:
+    """Pick the cache validators (``ETag``/``Last-Modified``) out of response headers."""
+    validators: dict[str, str] = {}
+    for name in ("etag", "last-modified"):
+        value = headers.get(name)
+        if value:
+            validators[name] = value
+    return validators
+
+
+def needs_js_rendering(html: str, text: str, *, min_words: int) -> bool:
+    """Heuristic: does a raw HTML response look like it needs a browser to render?"""
+    if len(text.split()) < min_words:
+        return True
+    if _NOSCRIPT_WALL.search(html):
+        return True
+    return bool(_EMPTY_APP_ROOT.search(html))
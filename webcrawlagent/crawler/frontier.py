@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date
+from urllib.parse import urlsplit
+
+from webcrawlagent.crawler.analyzer import CTA_KEYWORDS
+from webcrawlagent.crawler.urls import canonicalize_url
+
+# Pages that usually carry the substance of a site in a briefing.
+VALUABLE_TERMS = frozenset(
+    {"pricing", "price", "plans", "product", "products", "features", "solutions",
+     "platform", "customers", "case-studies", "enterprise", "about", "services"}
+)
+# Pages that rarely say anything about what the site offers.
+LOW_VALUE_TERMS = frozenset(
+    {"privacy", "terms", "cookie", "cookies", "legal", "gdpr", "imprint", "disclaimer",
+     "login", "signin", "sign-in", "logout", "password", "cart", "checkout", "feed", "rss",
+     "tag", "tags", "author", "archive", "wp-json", "cdn-cgi"}
+)
+ASSET_EXTENSIONS = frozenset(
+    {".pdf", ".jpg", ".jpeg", ".png", ".gif", ".svg", ".webp", ".ico", ".css", ".js", ".json",
+     ".xml", ".zip", ".gz", ".mp3", ".mp4", ".webm", ".woff", ".woff2", ".ttf", ".exe", ".dmg"}
+)
+_TERM_SPLIT = re.compile(r"[^a-z0-9]+")
+_PAGINATION = re.compile(r"/page/\d+|[?&](page|p|offset|start)=\d+", re.IGNORECASE)
+
+
+@dataclass(slots=True)
+class Candidate:
+    # As first discovered; the canonical form is only the frontier's dedup key.
+    url: str
+    depth: int
+    anchor: str = ""
+    inlinks: int = 1
+    score: float = 0.0
+    # Hints from the site's sitemap, when the URL was listed there.
+    sitemap_priority: float | None = None
+    lastmod: str | None = None
+
+
+Scorer = Callable[[Candidate], float]
+
+
+def breadth_first_score(candidate: Candidate) -> float:
+    """Plain BFS: shallower first, discovery order within a depth."""
+    return -float(candidate.depth)
+
+
+def priority_score(candidate: Candidate) -> float:
+    """Heuristic value of visiting ``candidate``; higher is better.
+
+    Combines depth, inlink count, the anchor text and URL path (valuable sections and
+    ``CTA_KEYWORDS`` up, legal/auth/pagination pages down), sitemap priority and
+    recency, and skips asset-like URLs.
+    """
+    if candidate.depth == 0:
+        return math.inf  # the start URL always goes first
+    parts = urlsplit(candidate.url)
+    path = parts.path.lower()
+    if any(path.endswith(extension) for extension in ASSET_EXTENSIONS):
+        return -100.0
+    terms = set(_TERM_SPLIT.split(path)) | set(_TERM_SPLIT.split(candidate.anchor.lower()))
+    terms.discard("")
+    score = -1.5 * candidate.depth + math.log2(1 + candidate.inlinks)
+    if terms & VALUABLE_TERMS:
+        score += 3.0
+    if terms & CTA_KEYWORDS:
+        score += 1.5
+    if terms & LOW_VALUE_TERMS:
+        score -= 4.0
+    if _PAGINATION.search(candidate.url):
+        score -= 2.0
+    score -= 0.5 * (path.count("/") > 3) + 0.5 * bool(parts.query)
+    if candidate.sitemap_priority is not None:
+        score += 2.0 * candidate.sitemap_priority
+    if _recently_modified(candidate.lastmod):
+        score += 0.5
+    return score
+
+
+def _recently_modified(lastmod: str | None, days: int = 180) -> bool:
+    if not lastmod:
+        return False
+    try:
+        modified = date.fromisoformat(lastmod[:10])
+    except ValueError:
+        return False
+    return (date.today() - modified).days <= days
+
+
+SCORERS: dict[str, Scorer] = {
+    "priority": priority_score,
+    "bfs": breadth_first_score,
+}
+
+
+class Frontier:
+    """Max-heap of URLs still to visit, ordered by ``scorer``.
+
+    URLs are deduplicated by ``canonicalize_url``, but a ``Candidate`` keeps the URL as
+    first pushed, since that is what the site actually serves. A URL is yielded at most
+    once. Rediscovering a pending URL bumps its inlink count
+    and re-scores it lazily (stale heap entries are skipped on pop). When more than
+    ``max_size`` URLs are pending, the lower-scored half is dropped.
+    """
+
+    def __init__(self, max_size: int, scorer: Scorer = priority_score):
+        self.max_size = max_size
+        self.scorer = scorer
+        self._heap: list[tuple[float, int, str]] = []
+        self._pending: dict[str, Candidate] = {}
+        self._seen: set[str] = set()
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def push(
+        self,
+        url: str,
+        *,
+        depth: int,
+        anchor: str = "",
+        sitemap_priority: float | None = None,
+        lastmod: str | None = None,
+    ) -> None:
+        key = canonicalize_url(url)
+        if key in self._seen:
+            return
+        candidate = self._pending.get(key)
+        if candidate is None:
+            candidate = self._pending[key] = Candidate(
+                url=url,
+                depth=depth,
+                anchor=anchor,
+                sitemap_priority=sitemap_priority,
+                lastmod=lastmod,
+            )
+            previous = None
+        else:
+            previous = candidate.score
+            candidate.inlinks += 1
+            candidate.depth = min(candidate.depth, depth)
+            candidate.anchor = candidate.anchor or anchor
+        candidate.score = self.scorer(candidate)
+        if candidate.score != previous:
+            heapq.heappush(self._heap, (-candidate.score, next(self._counter), key))
+        if len(self._pending) > self.max_size:
+            self._prune()
+
+    def pop(self) -> Candidate | None:
+        while self._heap:
+            negative_score, _, key = heapq.heappop(self._heap)
+            candidate = self._pending.get(key)
+            if candidate is None or candidate.score != -negative_score:
+                continue
+            del self._pending[key]
+            self._seen.add(key)
+            return candidate
+        return None
+
+    def _prune(self) -> None:
+        current = [entry for entry in self._heap if self._is_current(entry)]
+        self._heap = heapq.nsmallest(self.max_size // 2, current)
+        heapq.heapify(self._heap)
+        self._pending = {key: self._pending[key] for _, _, key in self._heap}
+
+    def _is_current(self, entry: tuple[float, int, str]) -> bool:
+        candidate = self._pending.get(entry[2])
+        return candidate is not None and candidate.score == -entry[0]
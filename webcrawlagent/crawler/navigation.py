@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from webcrawlagent.config import Settings
+
+# Resolves once body text has stopped changing for ``stableMs``, the ready selector
+# shows up, or ``maxMs`` elapses - whichever comes first. Runs in a single evaluate call.
+READINESS_SCRIPT = """
+({ stableMs, selector, maxMs }) => new Promise((resolve) => {
+  const started = performance.now();
+  let lastLength = -1;
+  let stableSince = started;
+  const check = () => {
+    const now = performance.now();
+    if (selector && document.querySelector(selector)) return finish("selector");
+    const length = document.body ? document.body.innerText.length : 0;
+    if (length !== lastLength) {
+      lastLength = length;
+      stableSince = now;
+    } else if (length > 0 && now - stableSince >= stableMs) {
+      return finish("stable");
+    }
+    if (now - started >= maxMs) return finish("timeout");
+  };
+  const timer = setInterval(check, 50);
+  const finish = (reason) => {
+    clearInterval(timer);
+    resolve(reason);
+  };
+  check();
+})
+"""
+
+
+async def navigate(page: Any, url: str, settings: Settings) -> tuple[Any, dict[str, float], str]:
+    """Load ``url`` using ``NAV_WAIT_STRATEGY`` and report how long each phase took.
+
+    Returns the navigation response, per-phase timings in milliseconds and the reason
+    the page was considered ready (the Playwright load state, or for ``adaptive`` one
+    of ``stable``/``selector``/``timeout``).
+    """
+    strategy = settings.nav_wait_strategy
+    wait_until = "domcontentloaded" if strategy == "adaptive" else strategy
+    started = time.perf_counter()
+    response = await page.goto(url, wait_until=wait_until)
+    navigated = time.perf_counter()
+    timings = {"navigation_ms": round((navigated - started) * 1000, 1)}
+    if strategy != "adaptive":
+        return response, timings, strategy
+
+    reason = await page.evaluate(
+        READINESS_SCRIPT,
+        {
+            "stableMs": settings.nav_stable_ms,
+            "selector": settings.nav_ready_selector,
+            "maxMs": settings.nav_adaptive_max_ms,
+        },
+    )
+    timings["ready_ms"] = round((time.perf_counter() - navigated) * 1000, 1)
+    return response, timings, reason
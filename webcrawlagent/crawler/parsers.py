@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from html.parser import HTMLParser as _StdlibHTMLParser
+from typing import Protocol
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, Comment
+
+from webcrawlagent.crawler.dom import PageContent
+
+try:  # pragma: no cover - optional dependency
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional dependency
+    LexborHTMLParser = None
+
+HEADING_TAGS = frozenset({"h1", "h2", "h3"})
+INVISIBLE_TAGS = frozenset({"script", "style", "noscript", "template", "head", "title", "meta"})
+_SKIPPED_TAGS = frozenset({"script", "style", "noscript", "template"})
+_DESCRIPTION = re.compile(r"^description$", re.IGNORECASE)
+
+
+class HtmlParser(Protocol):
+    """Turns raw HTML into ``PageContent`` (title, description, headings, links, text, anchors)."""
+
+    name: str
+
+    def parse(self, html: str, base_url: str) -> PageContent: ...
+
+
+class SoupParser:
+    """Reference backend: BeautifulSoup over the pure-Python ``html.parser``."""
+
+    name = "bs4"
+
+    def parse(self, html: str, base_url: str) -> PageContent:
+        soup = BeautifulSoup(html, "html.parser")
+        title = soup.title.string if soup.title and soup.title.string else ""
+        description_tag = soup.find("meta", attrs={"name": _DESCRIPTION})
+        description = (description_tag.get("content") or "") if description_tag else ""
+        headings = [h.get_text(" ", strip=True) for h in soup.find_all(["h1", "h2", "h3"])]
+        anchor_tags = soup.find_all("a", href=True)
+        links = [urljoin(base_url, a.get("href")) for a in anchor_tags]
+        anchors = [a.get_text(" ", strip=True) for a in anchor_tags]
+        body = soup.body or soup
+        text = " ".join(
+            chunk
+            for chunk in body.find_all(string=True)
+            if not isinstance(chunk, Comment)
+            and chunk.parent
+            and chunk.parent.name not in INVISIBLE_TAGS
+        )
+        return PageContent(
+            title=title,
+            description=description,
+            headings=headings,
+            links=links,
+            text=text,
+            anchors=anchors,
+        )
+
+
+class StreamingParser:
+    """Single-pass, tree-free backend built on the stdlib tokenizer.
+
+    Title, description, headings, links and visible text are collected from one stream
+    of tokenizer callbacks, so no DOM is ever materialized.
+    """
+
+    name = "stream"
+
+    def parse(self, html: str, base_url: str) -> PageContent:
+        handler = _StreamHandler(base_url)
+        handler.feed(html)
+        handler.close()
+        return handler.content()
+
+
+class SelectolaxParser:
+    """Fast backend on selectolax's Lexbor engine (``pip install webcrawlagent[fast]``)."""
+
+    name = "selectolax"
+
+    def __init__(self) -> None:
+        if LexborHTMLParser is None:
+            raise RuntimeError("HTML_PARSER=selectolax requires the 'selectolax' package")
+
+    def parse(self, html: str, base_url: str) -> PageContent:
+        tree = LexborHTMLParser(html)
+        title_node = tree.css_first("title")
+        meta = tree.css_first('meta[name="description" i]')
+        headings = [node.text(separator=" ", strip=True) for node in tree.css("h1, h2, h3")]
+        anchor_nodes = tree.css("a[href]")
+        links = [urljoin(base_url, node.attributes.get("href") or "") for node in anchor_nodes]
+        anchors = [node.text(separator=" ", strip=True) for node in anchor_nodes]
+        tree.strip_tags(list(_SKIPPED_TAGS))
+        body = tree.body
+        return PageContent(
+            title=title_node.text() if title_node else "",
+            description=(meta.attributes.get("content") or "") if meta else "",
+            headings=headings,
+            links=links,
+            text=body.text(separator=" ") if body else "",
+            anchors=anchors,
+        )
+
+
+class _StreamHandler(_StdlibHTMLParser):
+    def __init__(self, base_url: str):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.title_parts: list[str] = []
+        self.description = ""
+        self.headings: list[str] = []
+        self.links: list[str] = []
+        self.anchors: list[str] = []
+        self.text_parts: list[str] = []
+        self._title_state = 0  # 0 = not seen, 1 = inside <title>, 2 = done
+        self._heading: list[str] | None = None
+        self._anchor: list[str] | None = None
+        self._skip_depth = 0
+        self._in_head = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag == "a":
+            href = next((value for key, value in attrs if key == "href"), None)
+            if href is not None:
+                self._close_anchor()
+                self.links.append(urljoin(self.base_url, href))
+                self._anchor = []
+        elif tag in HEADING_TAGS:
+            self._heading = []
+        elif tag == "meta":
+            if not self.description:
+                values = dict(attrs)
+                if (values.get("name") or "").lower() == "description":
+                    self.description = values.get("content") or ""
+        elif tag == "title":
+            if self._title_state == 0:
+                self._title_state = 1
+        elif tag == "head":
+            self._in_head = True
+        elif tag == "body":
+            self._in_head = False
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == "a":
+            self._close_anchor()
+        elif tag in HEADING_TAGS:
+            if self._heading is not None:
+                self.headings.append(" ".join(part for part in self._heading if part))
+                self._heading = None
+        elif tag == "title":
+            if self._title_state == 1:
+                self._title_state = 2
+        elif tag == "head":
+            self._in_head = False
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        if self._title_state == 1:
+            self.title_parts.append(data)
+            return
+        if self._heading is not None:
+            self._heading.append(data.strip())
+        if self._anchor is not None:
+            self._anchor.append(data.strip())
+        if not self._in_head:
+            self.text_parts.append(data)
+
+    def content(self) -> PageContent:
+        self._close_anchor()
+        return PageContent(
+            title="".join(self.title_parts),
+            description=self.description,
+            headings=self.headings,
+            links=self.links,
+            text=" ".join(self.text_parts),
+            anchors=self.anchors,
+        )
+
+    def _close_anchor(self) -> None:
+        if self._anchor is not None:
+            self.anchors.append(" ".join(part for part in self._anchor if part))
+            self._anchor = None
+
+
+PARSERS: dict[str, type[HtmlParser]] = {
+    SoupParser.name: SoupParser,
+    StreamingParser.name: StreamingParser,
+    SelectolaxParser.name: SelectolaxParser,
+}
+
+
+@lru_cache(maxsize=8)
+def get_parser(name: str = "auto") -> HtmlParser:
+    """Return the parser for ``HTML_PARSER``; ``auto`` prefers selectolax when installed."""
+    if name == "auto":
+        name = SelectolaxParser.name if LexborHTMLParser is not None else StreamingParser.name
+    try:
+        return PARSERS[name]()
+    except KeyError:
+        raise ValueError(f"Unsupported HTML_PARSER: {name}") from None
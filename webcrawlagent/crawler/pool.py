@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from webcrawlagent.config import Settings
+from webcrawlagent.crawler.backends import PlaywrightBackend, create_backend
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, eq=False)
+class PooledBrowser:
+    """A pooled Chromium instance plus the bookkeeping used to recycle it."""
+
+    browser: Any
+    slot: int
+    active: int = 0
+    pages_served: int = 0
+    retiring: bool = False
+    # Set while the browser is being relaunched outside the pool's condition.
+    replacing: bool = False
+
+
+class BrowserPool:
+    """Process-wide pool of long-lived Chromium instances shared by crawl jobs.
+
+    Browsers are launched once and handed out as leases; each job opens its own
+    isolated ``BrowserContext`` on the leased browser. Browsers are recycled after
+    ``BROWSER_RECYCLE_PAGES`` pages or once their processes exceed
+    ``BROWSER_MAX_MEMORY_MB``, and crashed browsers are relaunched on demand.
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self.size = settings.browser_pool_size
+        self.max_contexts = settings.browser_pool_contexts
+        self.backend: PlaywrightBackend = create_backend(settings)
+        self._browsers: list[PooledBrowser] = []
+        self._condition = asyncio.Condition()
+        self._lifecycle_lock = asyncio.Lock()
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    async def start(self) -> None:
+        async with self._lifecycle_lock:
+            if self._running:
+                return
+            await self.backend.start()
+            try:
+                for slot in range(self.size):
+                    browser = await self.backend.launch()
+                    self._browsers.append(PooledBrowser(browser=browser, slot=slot))
+            except Exception:
+                await self._close_all()
+                raise
+            self._running = True
+
+    async def stop(self) -> None:
+        async with self._lifecycle_lock:
+            if not self._running:
+                return
+            self._running = False
+            await self._close_all()
+
+    async def acquire(self) -> PooledBrowser:
+        """Lease a healthy browser, starting the pool lazily if needed."""
+        if not self._running:
+            await self.start()
+        while True:
+            async with self._condition:
+                entry, stale = await self._pick()
+                if entry:
+                    entry.active += 1
+                    return entry
+                if stale is None:
+                    await self._condition.wait()
+                    continue
+            await self._replace(stale)
+
+    async def release(self, entry: PooledBrowser, *, pages: int = 0) -> None:
+        async with self._condition:
+            entry.active -= 1
+            entry.pages_served += pages
+            if self._running and not entry.retiring:
+                entry.retiring = await self._should_recycle(entry)
+            replace = self._running and entry.retiring and not entry.active and not entry.replacing
+            if replace:
+                entry.replacing = True
+            self._condition.notify_all()
+        if replace:
+            try:
+                await self._replace(entry)
+            except Exception as exc:
+                # The entry stays retiring; the next acquire retries the relaunch.
+                logger.warning("Relaunching pooled browser %d failed: %s", entry.slot, exc)
+
+    async def _pick(self) -> tuple[PooledBrowser | None, PooledBrowser | None]:
+        """Least busy healthy browser or, when there is none, an idle retired one.
+
+        The retired entry comes back marked ``replacing``; the caller relaunches it.
+        """
+        candidates: list[PooledBrowser] = []
+        stale: PooledBrowser | None = None
+        for entry in self._browsers:
+            if entry.replacing:
+                continue
+            if not await self.backend.is_connected(entry.browser):
+                entry.retiring = True
+            if entry.retiring:
+                if not entry.active and stale is None:
+                    stale = entry
+                continue
+            if entry.active < self.max_contexts:
+                candidates.append(entry)
+        best = min(candidates, key=lambda entry: entry.active, default=None)
+        if best is None and stale is not None:
+            stale.replacing = True
+            return None, stale
+        return best, None
+
+    async def _should_recycle(self, entry: PooledBrowser) -> bool:
+        recycle_pages = self.settings.browser_recycle_pages
+        if recycle_pages and entry.pages_served >= recycle_pages:
+            return True
+        if not await self.backend.is_connected(entry.browser):
+            return True
+        ceiling = self.settings.browser_max_memory_mb
+        if ceiling:
+            rss_mb = await self.backend.memory_mb(entry.browser)
+            if rss_mb is not None and rss_mb > ceiling:
+                return True
+        return False
+
+    async def _replace(self, entry: PooledBrowser) -> None:
+        """Relaunch ``entry``; waiters are woken whether or not the launch succeeds.
+
+        Runs outside the condition so leases on other browsers never wait on Chromium.
+        """
+        browser = None
+        try:
+            await self.backend.close_browser(entry.browser)
+            browser = await self.backend.launch()
+        finally:
+            async with self._condition:
+                entry.replacing = False
+                if browser is not None:
+                    entry.browser = browser
+                    entry.pages_served = 0
+                    entry.retiring = False
+                self._condition.notify_all()
+        if not self._running:
+            # The pool was stopped mid-launch; _close_all only saw the old browser.
+            with contextlib.suppress(Exception):
+                await self.backend.close_browser(browser)
+
+    async def _close_all(self) -> None:
+        try:
+            for entry in self._browsers:
+                await self.backend.close_browser(entry.browser)
+            self._browsers.clear()
+        finally:
+            await self.backend.stop()
@@ -1,111 +1,160 @@
 from __future__ import annotations
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from functools import partial
-from typing import Callable, TypeVar
-
-from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
+from typing import TYPE_CHECKING, Any
 
 from webcrawlagent.config import Settings
+from webcrawlagent.crawler.backends import AsyncPage, PlaywrightBackend, create_backend
+from webcrawlagent.crawler.blocking import BlockStats, ResourceBlocker, ResourcePolicy
+from webcrawlagent.metrics import span
+
+if TYPE_CHECKING:
+    from webcrawlagent.crawler.pool import BrowserPool, PooledBrowser
 
-_T = TypeVar("_T")
+__all__ = ["AsyncPage", "BrowserSession", "browser_session"]
 
 
 class BrowserSession:
-    """Manages a Playwright browser/context lifecycle."""
+    """Manages a Playwright browser/context lifecycle.
+
+    When a ``BrowserPool`` is supplied the session only owns an isolated context on a
+    leased browser; otherwise it launches (and tears down) a private browser using the
+    backend selected by ``PLAYWRIGHT_BACKEND``.
+
+    A ``lazy`` session defers the launch (or lease) to the first ``new_page`` call, so a
+    crawl served entirely over HTTP or from the page cache never starts a browser.
+    """
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, pool: BrowserPool | None = None, *, lazy: bool = False):
         self.settings = settings
-        self._playwright: Playwright | None = None
-        self._browser: Browser | None = None
-        self._context: BrowserContext | None = None
-        self._executor: ThreadPoolExecutor | None = None
-        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pool = pool
+        self._lazy = lazy
+        self._started = False
+        self._start_lock = asyncio.Lock()
+        self._backend: PlaywrightBackend = pool.backend if pool else create_backend(settings)
+        self._lease: PooledBrowser | None = None
+        self._pages_opened = 0
+        self._browser: Any = None
+        self._context: Any = None
+        self._policy = ResourcePolicy.from_settings(settings)
+        self._blocker: ResourceBlocker | None = None
+
+    @property
+    def backend(self) -> PlaywrightBackend:
+        return self._backend
+
+    @property
+    def started(self) -> bool:
+        return self._started
 
     async def __aenter__(self) -> BrowserSession:
-        self._loop = asyncio.get_running_loop()
-        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playwright")
-        try:
-            await self._run(self._start)
-        except Exception:
-            self._shutdown_executor()
-            raise
+        if not self._lazy:
+            await self._start()
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:  # pragma: no cover - cleanup safety
-        if self._executor:
-            try:
-                await self._run(self._stop)
-            finally:
-                self._shutdown_executor()
+        if not self._started:
+            return
+        self._started = False
+        if self._pool:
+            await self._return_context()
         else:
-            self._cleanup_sync()
+            await self._stop()
 
-    async def new_page(self) -> "AsyncPage":
+    async def new_page(self) -> Any:
         if not self._context:
-            raise RuntimeError("BrowserSession is not running")
-        page = await self._run(self._context.new_page)
-        return AsyncPage(self, page)
-
-    async def _run(self, func: Callable[..., _T], /, *args, **kwargs) -> _T:
-        if not self._executor or not self._loop:
-            raise RuntimeError("BrowserSession is not running")
-        call = partial(func, *args, **kwargs)
-        return await self._loop.run_in_executor(self._executor, call)
-
-    def _start(self) -> None:
-        self._playwright = sync_playwright().start()
-        self._browser = self._playwright.chromium.launch(
-            headless=self.settings.playwright_headless
-        )
-        self._context = self._browser.new_context()
-        timeout_ms = self.settings.crawl_timeout * 1000
-        self._context.set_default_navigation_timeout(timeout_ms)
-        self._context.set_default_timeout(timeout_ms)
-
-    def _stop(self) -> None:
-        self._cleanup_sync()
-
-    def _cleanup_sync(self) -> None:
-        if self._context:
-            self._context.close()
-            self._context = None
-        if self._browser:
-            self._browser.close()
-            self._browser = None
-        if self._playwright:
-            self._playwright.stop()
-            self._playwright = None
-
-    def _shutdown_executor(self) -> None:
-        if self._executor:
-            self._executor.shutdown(wait=True, cancel_futures=True)
-            self._executor = None
-        self._loop = None
-
-
-class AsyncPage:
-    """Async wrapper over a sync Playwright page bound to a single thread."""
-
-    def __init__(self, session: BrowserSession, page: Page):
-        self._session = session
-        self._page = page
-
-    def __getattr__(self, name):
-        attr = getattr(self._page, name)
-        if callable(attr):
-            async def _method(*args, **kwargs):
-                return await self._session._run(attr, *args, **kwargs)
-
-            return _method
-        return attr
+            if not self._lazy or self._started:
+                raise RuntimeError("BrowserSession is not running")
+            async with self._start_lock:
+                if not self._started:
+                    await self._start()
+        context = self._context
+        browser = self._lease.browser if self._lease else None
+        try:
+            page = await self._backend.new_page(context)
+        except Exception:
+            if browser is None or await self._backend.is_connected(browser):
+                raise
+            # The pooled browser crashed underneath us: swap in a fresh one and retry once.
+            # Concurrent page tasks hit this together; only the first one swaps. Pool
+            # entries are reused, so the failed context (not the lease) identifies it.
+            async with self._start_lock:
+                if self._context is context:
+                    await self._return_context()
+                    await self._lease_context()
+            if not self._context:
+                raise
+            page = await self._backend.new_page(self._context)
+        self._pages_opened += 1
+        return page
+
+    def block_stats(self, page: Any) -> BlockStats:
+        """Blocked-request counters for ``page`` (consumed; call once per page)."""
+        if not self._blocker:
+            return BlockStats()
+        return self._blocker.pop(self._backend.unwrap(page))
+
+    async def _start(self) -> None:
+        with span("browser.start", pooled=bool(self._pool)):
+            if self._pool:
+                await self._lease_context()
+            else:
+                await self._backend.start()
+                try:
+                    self._browser = await self._backend.launch()
+                    self._context = await self._backend.new_context(
+                        self._browser, self._new_blocker()
+                    )
+                except Exception:
+                    await self._stop()
+                    raise
+        self._started = True
+
+    def _new_blocker(self) -> ResourceBlocker | None:
+        self._blocker = ResourceBlocker(self._policy) if self._policy.active else None
+        return self._blocker
+
+    async def _lease_context(self) -> None:
+        self._lease = await self._pool.acquire()
+        try:
+            self._context = await self._backend.new_context(
+                self._lease.browser, self._new_blocker()
+            )
+        except Exception:
+            await self._pool.release(self._lease)
+            self._lease = None
+            raise
+
+    async def _return_context(self) -> None:
+        if not self._lease:
+            return
+        lease, self._lease = self._lease, None
+        context, self._context = self._context, None
+        pages, self._pages_opened = self._pages_opened, 0
+        try:
+            if context:
+                await self._backend.close_context(context)
+        finally:
+            await self._pool.release(lease, pages=pages)
+
+    async def _stop(self) -> None:
+        try:
+            if self._context:
+                await self._backend.close_context(self._context)
+                self._context = None
+            if self._browser:
+                await self._backend.close_browser(self._browser)
+                self._browser = None
+        finally:
+            await self._backend.stop()
 
 
 @asynccontextmanager
-async def browser_session(settings: Settings):
-    session = BrowserSession(settings)
+async def browser_session(
+    settings: Settings, pool: BrowserPool | None = None, *, lazy: bool = False
+):
+    session = BrowserSession(settings, pool=pool, lazy=lazy)
     await session.__aenter__()
     try:
         yield session
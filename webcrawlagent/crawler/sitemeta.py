@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import zlib
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+from xml.etree.ElementTree import ParseError, XMLPullParser
+
+import httpx
+
+from webcrawlagent.config import Settings
+
+logger = logging.getLogger(__name__)
+
+_GZIP_MAGIC = b"\x1f\x8b"
+# The sitemap protocol caps a single file at 50 MB uncompressed.
+MAX_SITEMAP_BYTES = 50 * 1024 * 1024
+
+
+@dataclass(slots=True)
+class SitemapEntry:
+    url: str
+    lastmod: str | None = None
+    priority: float | None = None
+
+
+@dataclass(slots=True)
+class SiteMeta:
+    """Parsed ``robots.txt`` rules and sitemap entries for one origin."""
+
+    origin: str
+    user_agent: str
+    robots: RobotFileParser | None = None
+    crawl_delay: float | None = None
+    sitemap: list[SitemapEntry] = field(default_factory=list)
+
+    def allows(self, url: str) -> bool:
+        return self.robots is None or self.robots.can_fetch(self.user_agent, url)
+
+
+class SiteMetaFetcher:
+    """Fetches and caches ``robots.txt`` and sitemaps per origin before a crawl.
+
+    Results are kept in memory for ``SITE_META_TTL`` seconds, for at most
+    ``SITE_META_CACHE_SIZE`` origins (least recently used first out), and concurrent jobs
+    for the same origin share one fetch. Sitemaps (and sitemap indexes) are parsed while they
+    download, gzipped or not, so large files never sit in memory whole.
+    """
+
+    def __init__(self, settings: Settings):
+        self.settings = settings
+        self._client = httpx.AsyncClient(
+            timeout=settings.crawl_timeout,
+            follow_redirects=True,
+            headers={"User-Agent": settings.crawl_user_agent},
+        )
+        self._cache: OrderedDict[str, tuple[SiteMeta, float]] = OrderedDict()
+        # Only origins with a fetch in progress (or queued behind one) have a lock; the
+        # count of jobs holding or awaiting it decides when it can go.
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._lock_users: dict[str, int] = {}
+
+    async def get(self, url: str) -> SiteMeta:
+        origin = _origin(url)
+        if meta := self._cached(origin):
+            return meta
+        lock = self._locks.setdefault(origin, asyncio.Lock())
+        self._lock_users[origin] = self._lock_users.get(origin, 0) + 1
+        try:
+            async with lock:
+                # Jobs that queued behind the fetch find its result here.
+                if meta := self._cached(origin):
+                    return meta
+                meta = await self._load(origin)
+                self._remember(origin, meta)
+                return meta
+        finally:
+            self._lock_users[origin] -= 1
+            if not self._lock_users[origin]:
+                del self._lock_users[origin]
+                del self._locks[origin]
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    def _cached(self, origin: str) -> SiteMeta | None:
+        entry = self._cache.get(origin)
+        if entry is None:
+            return None
+        meta, stored_at = entry
+        if time.monotonic() - stored_at >= self.settings.site_meta_ttl:
+            del self._cache[origin]
+            return None
+        self._cache.move_to_end(origin)
+        return meta
+
+    def _remember(self, origin: str, meta: SiteMeta) -> None:
+        now = time.monotonic()
+        ttl = self.settings.site_meta_ttl
+        expired = [key for key, (_, stored_at) in self._cache.items() if now - stored_at >= ttl]
+        for key in expired:
+            del self._cache[key]
+        self._cache[origin] = (meta, now)
+        self._cache.move_to_end(origin)
+        while len(self._cache) > self.settings.site_meta_cache_size:
+            self._cache.popitem(last=False)
+
+    async def _load(self, origin: str) -> SiteMeta:
+        user_agent = self.settings.crawl_user_agent
+        meta = SiteMeta(origin=origin, user_agent=user_agent)
+        robots = await self._fetch_robots(origin)
+        if self.settings.respect_robots:
+            meta.robots = robots
+            delay = robots.crawl_delay(user_agent)
+            rate = robots.request_rate(user_agent)
+            if delay is not None:
+                meta.crawl_delay = float(delay)
+            elif rate is not None and rate.requests:
+                meta.crawl_delay = rate.seconds / rate.requests
+        if self.settings.use_sitemaps:
+            locations = robots.site_maps() or [f"{origin}/sitemap.xml"]
+            meta.sitemap = await self._read_sitemaps(locations)
+        return meta
+
+    async def _fetch_robots(self, origin: str) -> RobotFileParser:
+        parser = RobotFileParser(f"{origin}/robots.txt")
+        try:
+            response = await self._client.get(parser.url)
+        except httpx.HTTPError as exc:
+            logger.info("robots.txt unavailable for %s: %s", origin, exc)
+            parser.allow_all = True
+        else:
+            # Same policy as RobotFileParser.read(): auth errors forbid, other errors allow.
+            if response.status_code in (401, 403):
+                parser.disallow_all = True
+            elif response.status_code >= 400:
+                parser.allow_all = True
+            else:
+                parser.parse(response.text.splitlines())
+        parser.modified()
+        return parser
+
+    async def _read_sitemaps(self, locations: list[str]) -> list[SitemapEntry]:
+        limit = self.settings.sitemap_max_urls
+        pending = deque(locations)
+        visited: set[str] = set()
+        entries: list[SitemapEntry] = []
+        while pending and len(entries) < limit and len(visited) < self.settings.sitemap_max_files:
+            location = pending.popleft()
+            if location in visited:
+                continue
+            visited.add(location)
+            try:
+                async with aclosing(self._stream_sitemap(location)) as items:
+                    async for kind, item in items:
+                        if kind == "sitemap":
+                            pending.append(item.url)
+                        elif len(entries) < limit:
+                            entries.append(item)
+                        else:
+                            break
+            except (httpx.HTTPError, ParseError, zlib.error, ValueError) as exc:
+                logger.info("Skipping sitemap %s: %s", location, exc)
+        return entries
+
+    async def _stream_sitemap(self, location: str) -> AsyncIterator[tuple[str, SitemapEntry]]:
+        parser = _SitemapParser()
+        inflater: Any = None
+        received = 0
+        async with self._client.stream("GET", location) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                if received == 0 and chunk.startswith(_GZIP_MAGIC):
+                    inflater = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                data = inflater.decompress(chunk) if inflater else chunk
+                received += len(data)
+                if received > MAX_SITEMAP_BYTES:
+                    raise ValueError("sitemap exceeds 50 MB uncompressed")
+                for item in parser.feed(data):
+                    yield item
+        tail = parser.feed(inflater.flush()) if inflater else []
+        for item in [*tail, *parser.close()]:
+            yield item
+
+
+class _SitemapParser:
+    """Incremental ``<urlset>``/``<sitemapindex>`` parser with bounded memory.
+
+    Each finished ``<url>``/``<sitemap>`` is detached from the document root as soon as
+    it is read; clearing the element alone would still leave one empty node per entry.
+    """
+
+    def __init__(self) -> None:
+        self._parser = XMLPullParser(events=("start", "end"))
+        self._root: Any = None
+
+    def feed(self, data: bytes) -> list[tuple[str, SitemapEntry]]:
+        self._parser.feed(data)
+        return self._drain()
+
+    def close(self) -> list[tuple[str, SitemapEntry]]:
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self) -> list[tuple[str, SitemapEntry]]:
+        items: list[tuple[str, SitemapEntry]] = []
+        for event, element in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = element
+                continue
+            tag = _local(element.tag)
+            if tag not in ("url", "sitemap"):
+                continue
+            fields = {_local(child.tag): (child.text or "").strip() for child in element}
+            element.clear()
+            if element is not self._root:
+                self._root.clear()
+            if not fields.get("loc"):
+                continue
+            entry = SitemapEntry(
+                url=fields["loc"],
+                lastmod=fields.get("lastmod") or None,
+                priority=_priority(fields.get("priority")),
+            )
+            items.append((tag, entry))
+        return items
+
+
+def _local(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _priority(value: str | None) -> float | None:
+    try:
+        return min(max(float(value), 0.0), 1.0) if value else None
+    except ValueError:
+        return None
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` tokens per second with up to ``burst`` banked."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class HostThrottle:
+    """Caps in-flight requests per host and spaces them out with a token bucket.
+
+    ``delay`` is the average interval between requests to one host (the old
+    ``CRAWL_DELAY_SECONDS`` sleep); ``0`` disables rate limiting entirely. ``set_delay``
+    overrides it for a single host, e.g. with a robots.txt ``Crawl-delay``.
+    """
+
+    def __init__(self, max_concurrency: int, delay: float, burst: int = 1):
+        self.max_concurrency = max_concurrency
+        self.delay = delay
+        self.burst = burst
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def set_delay(self, host: str, delay: float) -> None:
+        """Space requests to ``host`` exactly ``delay`` seconds apart (no bursting)."""
+        self._buckets[host] = _bucket_for(delay, 1)
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        host = urlparse(url).netloc
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self.max_concurrency)
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = _bucket_for(self.delay, self.burst)
+        async with semaphore:
+            await bucket.acquire()
+            yield
+
+
+def _bucket_for(delay: float, burst: int) -> TokenBucket:
+    return TokenBucket(1 / delay if delay > 0 else 0.0, burst)
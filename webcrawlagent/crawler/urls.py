@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+# Query parameters that only carry campaign/click attribution, never page identity.
+TRACKING_PARAMS = frozenset(
+    {
+        "fbclid",
+        "gclid",
+        "dclid",
+        "msclkid",
+        "yclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "_ga",
+        "_gl",
+        "_hsenc",
+        "_hsmi",
+        "ref_src",
+    }
+)
+TRACKING_PREFIXES = ("utm_", "pk_", "hsa_")
+
+
+def normalize_url(url: str) -> str:
+    """Stable form of ``url`` for cache keys and dedup.
+
+    Lowercases scheme and host, drops default ports and fragments, and strips a trailing
+    slash from non-root paths.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    port = parts.port
+    netloc = host if port is None or _DEFAULT_PORTS.get(scheme) == port else f"{host}:{port}"
+    path = parts.path or "/"
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/") or "/"
+    return urlunsplit((scheme, netloc, path, parts.query, ""))
+
+
+def canonicalize_url(url: str) -> str:
+    """``normalize_url`` plus query cleanup, so equivalent links dedupe in the frontier.
+
+    Tracking parameters (``utm_*``, ``gclid``, ``fbclid``...) are dropped and the rest
+    are sorted by name, keeping blank values.
+    """
+    normalized = normalize_url(url)
+    parts = urlsplit(normalized)
+    if not parts.query:
+        return normalized
+    params = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit(parts._replace(query=urlencode(params)))
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any
+
+from webcrawlagent.config import Settings
+from webcrawlagent.crawler.analyzer import AnalysisSummary
+from webcrawlagent.crawler.extractor import CrawlResult
+from webcrawlagent.diskcache import SqliteLRUCache
+from webcrawlagent.llm.streaming import PartialHook
+from webcrawlagent.llm.summary import JsonGenerator, summarize_crawl
+from webcrawlagent.metrics import CACHE_LOOKUPS
+from webcrawlagent.report.models import SiteSummary
+
+
+def cache_key(model_name: str, schema: dict[str, Any], prompt: str) -> str:
+    """Hash of everything that determines the model output: model, schema and prompt."""
+    digest = hashlib.sha256()
+    digest.update(model_name.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(json.dumps(schema, sort_keys=True).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(prompt.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class _MemoryTier:
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, stored_at = entry
+        if time.time() - stored_at >= self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, stored_at: float | None = None) -> None:
+        self._entries[key] = (value, stored_at or time.time())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class CachedLLMClient:
+    """Serves byte-identical prompts from an in-memory and optional on-disk cache.
+
+    Wraps any client from ``create_llm_client``; a hit returns the stored JSON without a
+    network call. Entries expire after ``LLM_CACHE_TTL`` seconds and both tiers evict
+    least-recently-used entries first.
+    """
+
+    def __init__(self, inner: JsonGenerator, settings: Settings):
+        self.inner = inner
+        self.settings = settings
+        self.ttl = settings.llm_cache_ttl
+        self.hits = 0
+        self.misses = 0
+        self._memory = _MemoryTier(settings.llm_cache_max_entries, self.ttl)
+        self._disk = (
+            SqliteLRUCache(
+                settings.llm_cache_dir / "llm.sqlite3", settings.llm_cache_max_mb * 1024 * 1024
+            )
+            if settings.llm_cache_dir
+            else None
+        )
+
+    @property
+    def model_name(self) -> str:
+        return self.inner.model_name
+
+    async def summarize_site(self, crawl: CrawlResult, analysis: AnalysisSummary) -> SiteSummary:
+        return await summarize_crawl(self, crawl, analysis, self.settings.crawl_max_tokens)
+
+    async def generate_json(
+        self,
+        prompt: str,
+        schema: dict[str, Any],
+        *,
+        schema_name: str = "website_report",
+        on_partial: PartialHook | None = None,
+    ) -> dict[str, Any]:
+        key = cache_key(self.model_name, schema, prompt)
+        cached = await self._lookup(key)
+        if cached is not None:
+            self.hits += 1
+            CACHE_LOOKUPS.inc(cache="llm", result="hit")
+            return json.loads(cached)
+        self.misses += 1
+        CACHE_LOOKUPS.inc(cache="llm", result="miss")
+        payload = await self.inner.generate_json(
+            prompt, schema, schema_name=schema_name, on_partial=on_partial
+        )
+        value = json.dumps(payload, ensure_ascii=False)
+        self._memory.set(key, value)
+        if self._disk:
+            await asyncio.to_thread(self._disk.set, key, value.encode("utf-8"))
+        return payload
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+        if self._disk:
+            self._disk.close()
+
+    async def _lookup(self, key: str) -> str | None:
+        value = self._memory.get(key)
+        if value is not None or not self._disk:
+            return value
+        row = await asyncio.to_thread(self._disk.get, key)
+        if row is None:
+            return None
+        raw, stored_at = row
+        if time.time() - stored_at >= self.ttl:
+            return None
+        value = raw.decode("utf-8")
+        self._memory.set(key, value, stored_at)
+        return value
@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from webcrawlagent.config import Settings
+from webcrawlagent.crawler.analyzer import AnalysisSummary
+from webcrawlagent.crawler.extractor import CrawlResult, PageSnapshot
+from webcrawlagent.llm.exceptions import LLMContentError, LLMUnavailableError
+from webcrawlagent.llm.streaming import PartialHook
+from webcrawlagent.llm.summary import (
+    SUMMARY_SCHEMA,
+    JsonGenerator,
+    build_summary_metadata,
+    build_summary_prompt,
+)
+from webcrawlagent.report.models import SiteSummary
+from webcrawlagent.tokenizer import Tokenizer, tokenizer_for
+
+PAGE_NOTES_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "key_points": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["summary", "key_points"],
+}
+
+
+@dataclass(slots=True)
+class SummaryStats:
+    """Latency (ms) and approximate token counts for each summarization stage."""
+
+    mode: str
+    map_calls: int = 0
+    map_failures: int = 0
+    map_ms: float = 0.0
+    reduce_ms: float = 0.0
+    map_prompt_tokens: int = 0
+    map_output_tokens: int = 0
+    reduce_prompt_tokens: int = 0
+    reduce_output_tokens: int = 0
+    pages_covered: int = 0
+    # Map-stage time left once the last page arrived; well below ``map_ms`` when pipelined.
+    map_tail_ms: float = 0.0
+
+
+async def summarize(
+    client: JsonGenerator,
+    crawl: CrawlResult,
+    analysis: AnalysisSummary,
+    settings: Settings,
+    *,
+    on_partial: PartialHook | None = None,
+) -> tuple[SiteSummary, SummaryStats]:
+    """Summarize ``crawl`` in one prompt, or map-reduce it when it exceeds the budget.
+
+    ``SUMMARY_MODE=auto`` switches to chunked mode only when the crawl holds more text
+    than ``CRAWL_MAX_TOKENS``; ``single`` and ``chunked`` force either path. Only the
+    final (single or reduce) call is streamed to ``on_partial``.
+    """
+    pipeline = SummaryPipeline(client, settings)
+    for page in crawl.pages:
+        pipeline.add(page)
+    return await pipeline.finish(crawl, analysis, on_partial=on_partial)
+
+
+class SummaryPipeline:
+    """``summarize`` fed one page at a time, so map calls overlap the crawl.
+
+    Consecutive pages are packed into chunks of at most ``LLM_MAP_CHUNK_TOKENS``; a page
+    that alone exceeds it gets a chunk of its own and is trimmed in the prompt. Once
+    map-reduce is certain (``SUMMARY_MODE=chunked``, or ``auto`` after the pages seen so far exceed
+    ``CRAWL_MAX_TOKENS``) each full chunk's map call starts right away. ``finish`` maps
+    the last chunk and runs the reduce, or the single-prompt summary for small crawls.
+    """
+
+    def __init__(self, client: JsonGenerator, settings: Settings):
+        self.client = client
+        self.settings = settings
+        self.budget = settings.llm_map_chunk_tokens
+        self.stats = SummaryStats(mode="chunked")
+        self._tokenizer = tokenizer_for(settings)
+        self._count = self._tokenizer.count
+        self._semaphore = asyncio.Semaphore(settings.llm_map_concurrency)
+        self._mode = settings.summary_mode
+        self._tokens = 0
+        self._buffered: list[PageSnapshot] = []
+        self._chunk: list[PageSnapshot] = []
+        self._chunk_tokens = 0
+        self._tasks: list[asyncio.Task[dict[str, Any]]] = []
+        self._map_started = 0.0
+
+    def add(self, page: PageSnapshot) -> None:
+        self._tokens += page.token_estimate
+        if self._mode == "auto":
+            self._buffered.append(page)
+            if self._tokens > self.settings.crawl_max_tokens:
+                self._mode = "chunked"
+                buffered, self._buffered = self._buffered, []
+                for item in buffered:
+                    self._pack(item)
+        elif self._mode == "chunked":
+            self._pack(page)
+
+    async def finish(
+        self,
+        crawl: CrawlResult,
+        analysis: AnalysisSummary,
+        *,
+        on_partial: PartialHook | None = None,
+    ) -> tuple[SiteSummary, SummaryStats]:
+        if self._mode != "chunked" or not crawl.pages:
+            return await _single(self.client, crawl, analysis, self.settings, on_partial)
+        stats = self.stats
+        finishing = time.perf_counter()
+        if self._chunk:
+            self._dispatch()
+        try:
+            notes = await asyncio.gather(*self._tasks)
+        except BaseException:
+            self.cancel()
+            raise
+        stats.map_ms = _elapsed_ms(self._map_started)
+        stats.map_tail_ms = _elapsed_ms(finishing)
+        stats.map_calls = len(self._tasks)
+        stats.pages_covered = len(crawl.pages)
+
+        notes = fit_notes(list(notes), self.settings.crawl_max_tokens, self._tokenizer)
+        prompt = build_reduce_prompt(analysis, notes)
+        started = time.perf_counter()
+        payload = await self.client.generate_json(prompt, SUMMARY_SCHEMA, on_partial=on_partial)
+        stats.reduce_ms = _elapsed_ms(started)
+        stats.reduce_prompt_tokens = self._count(prompt)
+        stats.reduce_output_tokens = self._count(json.dumps(payload))
+        return SiteSummary.from_llm_payload(payload), stats
+
+    def cancel(self) -> None:
+        """Abandon in-flight map calls, e.g. when the crawl feeding them failed."""
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()  # mark retrieved; the caller is already failing
+
+    def _pack(self, page: PageSnapshot) -> None:
+        if self._chunk and self._chunk_tokens + page.token_estimate > self.budget:
+            self._dispatch()
+        self._chunk.append(page)
+        self._chunk_tokens += page.token_estimate
+
+    def _dispatch(self) -> None:
+        if not self._tasks:
+            self._map_started = time.perf_counter()
+        chunk, self._chunk, self._chunk_tokens = self._chunk, [], 0
+        self._tasks.append(asyncio.create_task(self._take_notes(chunk)))
+
+    async def _take_notes(self, pages: list[PageSnapshot]) -> dict[str, Any]:
+        stats = self.stats
+        prompt = build_page_notes_prompt(pages, self.budget)
+        stats.map_prompt_tokens += self._count(prompt)
+        async with self._semaphore:
+            try:
+                payload = await self.client.generate_json(
+                    prompt, PAGE_NOTES_SCHEMA, schema_name="page_notes"
+                )
+            except (LLMContentError, LLMUnavailableError):
+                # One chunk's failure must not sink the others; the reduce sees outlines.
+                stats.map_failures += 1
+                payload = _fallback_notes(pages)
+        stats.map_output_tokens += self._count(json.dumps(payload))
+        return {"pages": [page.url for page in pages], **payload}
+
+
+async def _single(
+    client: JsonGenerator,
+    crawl: CrawlResult,
+    analysis: AnalysisSummary,
+    settings: Settings,
+    on_partial: PartialHook | None,
+) -> tuple[SiteSummary, SummaryStats]:
+    stats = SummaryStats(mode="single")
+    count = tokenizer_for(settings).count
+    prompt = build_summary_prompt(crawl, analysis, settings.crawl_max_tokens)
+    started = time.perf_counter()
+    payload = await client.generate_json(prompt, SUMMARY_SCHEMA, on_partial=on_partial)
+    stats.reduce_ms = _elapsed_ms(started)
+    stats.reduce_prompt_tokens = count(prompt)
+    stats.reduce_output_tokens = count(json.dumps(payload))
+    stats.pages_covered = len(crawl.aggregate_text(settings.crawl_max_tokens))
+    return SiteSummary.from_llm_payload(payload), stats
+
+
+def build_page_notes_prompt(pages: list[PageSnapshot], budget: int) -> str:
+    allowance = max(budget // len(pages), 1)
+    content = "\n\n".join(
+        f"URL: {page.url}\nTitle: {page.title or 'Untitled page'}\n"
+        f"{page.trimmed_text(allowance)}"
+        for page in pages
+    )
+    return (
+        "You are an analyst taking notes on part of a website for a later briefing. "
+        "Summarize what these pages cover and list the concrete facts worth keeping "
+        "(products, features, audiences, pricing, metrics, calls to action).\n"
+        "Return **only** JSON with the following shape:\n"
+        "{\n"
+        '  "summary": <2-3 sentences>,\n'
+        '  "key_points": [short factual bullets]\n'
+        "}\n"
+        "Content: \n"
+        f"{content}"
+    )
+
+
+def fit_notes(
+    notes: list[dict[str, Any]], budget: int, tokenizer: Tokenizer
+) -> list[dict[str, Any]]:
+    """Trim trailing ``key_points`` so the notes together stay within ``budget`` tokens.
+
+    Like the map prompts, each note gets an equal share of the budget; its summary and
+    page list are always kept.
+    """
+    if not notes:
+        return notes
+    allowance = max(budget // len(notes), 1)
+    fitted: list[dict[str, Any]] = []
+    for note in notes:
+        points: list[str] = note.get("key_points", [])
+        used = tokenizer.count(json.dumps({**note, "key_points": []}, ensure_ascii=False))
+        kept = 0
+        for point in points:
+            used += tokenizer.count(json.dumps(point, ensure_ascii=False))
+            if used > allowance:
+                break
+            kept += 1
+        fitted.append(note if kept == len(points) else {**note, "key_points": points[:kept]})
+    return fitted
+
+
+def build_reduce_prompt(analysis: AnalysisSummary, notes: list[dict[str, Any]]) -> str:
+    return (
+        "You are an analyst generating a concise website briefing. "
+        "Combine the per-section notes below with the structured metadata into one "
+        "actionable summary of the whole site.\n"
+        "Return **only** JSON with the following shape:\n"
+        "{\n"
+        '  "overview": <2-3 sentence synopsis>,\n'
+        '  "sections": [list of key sections and their purpose],\n'
+        '  "highlights": [bullet-level product/features/metrics insights],\n'
+        '  "recommendations": [next actions or opportunities]\n'
+        "}\n"
+        f"Metadata: {build_summary_metadata(analysis)}\n"
+        f"Section notes: {json.dumps(notes, ensure_ascii=False)}"
+    )
+
+
+def _fallback_notes(pages: list[PageSnapshot]) -> dict[str, Any]:
+    return {
+        "summary": " / ".join(page.description or page.title or page.url for page in pages),
+        "key_points": [heading for page in pages for heading in page.headings[:3]],
+    }
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
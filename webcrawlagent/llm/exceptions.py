@@ -8,3 +8,6 @@ class LLMContentError(RuntimeError):
         super().__init__(message)
         self.payload = payload or {}
 
+
+class LLMUnavailableError(RuntimeError):
+    """Raised when the provider keeps failing or its circuit breaker is open."""
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
 from webcrawlagent.config import Settings
+from webcrawlagent.llm.cache import CachedLLMClient
 from webcrawlagent.llm.gemini_client import GeminiClient
 from webcrawlagent.llm.grok_client import GrokClient
 
 
 def create_llm_client(settings: Settings):
+    client = _create_provider_client(settings)
+    if settings.llm_cache_enabled:
+        return CachedLLMClient(client, settings)
+    return client
+
+
+def _create_provider_client(settings: Settings):
     provider = settings.llm_provider.lower()
     if provider == "gemini":
         if not settings.gemini_api_key:
@@ -1,19 +1,19 @@
 from __future__ import annotations
 
 import json
+from collections.abc import AsyncIterator
 from typing import Any
 
-import httpx
-
 from webcrawlagent.config import Settings
 from webcrawlagent.crawler.analyzer import AnalysisSummary
 from webcrawlagent.crawler.extractor import CrawlResult
 from webcrawlagent.llm.exceptions import LLMContentError
-from webcrawlagent.llm.summary import SUMMARY_SCHEMA, build_summary_prompt
+from webcrawlagent.llm.streaming import PartialHook, collect_stream, sse_events
+from webcrawlagent.llm.summary import summarize_crawl
+from webcrawlagent.llm.transport import LLMTransport
+from webcrawlagent.metrics import span
 from webcrawlagent.report.models import SiteSummary
 
-GEMINI_BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
-
 
 class GeminiContentError(LLMContentError):
     """Raised when the Gemini API responds without usable text."""
@@ -24,42 +24,78 @@ class GeminiClient:
 
     def __init__(self, settings: Settings):
         self.settings = settings
-        self._client = httpx.AsyncClient(timeout=50)
+        self._transport = LLMTransport(settings, name="Gemini", timeout=50)
+
+    @property
+    def model_name(self) -> str:
+        return f"gemini:{self.settings.gemini_model}"
 
     async def summarize_site(self, crawl: CrawlResult, analysis: AnalysisSummary) -> SiteSummary:
+        return await summarize_crawl(self, crawl, analysis, self.settings.crawl_max_tokens)
+
+    async def generate_json(
+        self,
+        prompt: str,
+        schema: dict[str, Any],
+        *,
+        schema_name: str = "website_report",
+        on_partial: PartialHook | None = None,
+    ) -> dict[str, Any]:
         if not self.settings.gemini_api_key:
             raise RuntimeError("GEMINI_API_KEY is not configured")
-        prompt = build_summary_prompt(crawl, analysis, self.settings.crawl_max_tokens)
-        url = f"{GEMINI_BASE_URL}/models/{self.settings.gemini_model}:generateContent"
-        response = await self._client.post(
-            url,
+        if on_partial is not None:
+            text = await collect_stream(self._stream_text(prompt, schema), on_partial)
+            if not text.strip():
+                raise GeminiContentError("Gemini stream returned no text")
+            with span("llm.parse", provider="Gemini"):
+                return _parse_summary_text(text)
+        response = await self._transport.post(
+            self._url("generateContent"),
             params={"key": self.settings.gemini_api_key},
-            json={
-                "contents": [
-                    {
-                        "role": "user",
-                        "parts": [
-                            {"text": prompt},
-                        ],
-                    }
-                ],
-                "generationConfig": {
-                    "temperature": 0.3,
-                    "topP": 0.95,
-                    "maxOutputTokens": 1024,
-                    "responseMimeType": "application/json",
-                    "responseSchema": SUMMARY_SCHEMA,
-                },
-            },
+            json=_request_body(prompt, schema),
         )
-        response.raise_for_status()
-        payload = response.json()
-        text = _extract_text(payload)
-        parsed = _parse_summary_text(text)
-        return SiteSummary.from_llm_payload(parsed)
+        with span("llm.parse", provider="Gemini"):
+            return _parse_summary_text(_extract_text(response.json()))
 
     async def aclose(self) -> None:
-        await self._client.aclose()
+        await self._transport.aclose()
+
+    def _url(self, method: str) -> str:
+        base_url = self.settings.gemini_base_url.rstrip("/")
+        return f"{base_url}/models/{self.settings.gemini_model}:{method}"
+
+    async def _stream_text(self, prompt: str, schema: dict[str, Any]) -> AsyncIterator[str]:
+        lines = self._transport.stream_lines(
+            self._url("streamGenerateContent"),
+            params={"key": self.settings.gemini_api_key, "alt": "sse"},
+            json=_request_body(prompt, schema),
+        )
+        async for data in sse_events(lines):
+            for candidate in json.loads(data).get("candidates") or []:
+                for part in candidate.get("content", {}).get("parts") or []:
+                    if text := part.get("text"):
+                        yield text
+
+
+def _request_body(prompt: str, schema: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "contents": [
+            {
+                "role": "user",
+                "parts": [
+                    {"text": prompt},
+                ],
+            }
+        ],
+        "generationConfig": {
+            "temperature": 0.3,
+            "topP": 0.95,
+            "maxOutputTokens": 1024,
+            "responseMimeType": "application/json",
+            "responseSchema": schema,
+        },
+    }
+
 
 def _extract_text(payload: dict[str, Any]) -> str:
     candidates = payload.get("candidates") or []
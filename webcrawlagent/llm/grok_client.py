@@ -1,19 +1,19 @@
 from __future__ import annotations
 
 import json
+from collections.abc import AsyncIterator
 from typing import Any
 
-import httpx
-
 from webcrawlagent.config import Settings
 from webcrawlagent.crawler.analyzer import AnalysisSummary
 from webcrawlagent.crawler.extractor import CrawlResult
 from webcrawlagent.llm.exceptions import LLMContentError
-from webcrawlagent.llm.summary import SUMMARY_SCHEMA, build_summary_prompt
+from webcrawlagent.llm.streaming import PartialHook, collect_stream, sse_events
+from webcrawlagent.llm.summary import summarize_crawl
+from webcrawlagent.llm.transport import LLMTransport
+from webcrawlagent.metrics import span
 from webcrawlagent.report.models import SiteSummary
 
-GROK_BASE_URL = "https://api.x.ai/v1"
-
 
 class GrokContentError(LLMContentError):
     """Raised when Grok responds without usable JSON."""
@@ -26,48 +26,81 @@ class GrokClient:
         self.settings = settings
         if not settings.grok_api_key:
             raise RuntimeError("GROK_API_KEY is not configured")
-        self._client = httpx.AsyncClient(
+        self._transport = LLMTransport(
+            settings,
+            name="Grok",
             timeout=60,
             headers={"Authorization": f"Bearer {settings.grok_api_key}"},
         )
 
+    @property
+    def model_name(self) -> str:
+        return f"grok:{self.settings.grok_model}"
+
     async def summarize_site(self, crawl: CrawlResult, analysis: AnalysisSummary) -> SiteSummary:
-        prompt = build_summary_prompt(crawl, analysis, self.settings.crawl_max_tokens)
-        response = await self._client.post(
-            f"{GROK_BASE_URL}/chat/completions",
-            json={
-                "model": self.settings.grok_model,
-                "temperature": 0.2,
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": (
-                            "You are Grok, an investigator who converts crawl data into concise, "
-                            "actionable website summaries. Respond strictly with JSON."
-                        ),
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                "response_format": {
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "website_report",
-                        "schema": SUMMARY_SCHEMA,
-                    },
-                },
-            },
-        )
-        response.raise_for_status()
-        payload = response.json()
-        text = _extract_text(payload)
-        try:
-            parsed = json.loads(text)
-        except json.JSONDecodeError as exc:  # pragma: no cover - depends on remote output
-            raise GrokContentError(f"Grok returned invalid JSON: {text}") from exc
-        return SiteSummary.from_llm_payload(parsed)
+        return await summarize_crawl(self, crawl, analysis, self.settings.crawl_max_tokens)
+
+    async def generate_json(
+        self,
+        prompt: str,
+        schema: dict[str, Any],
+        *,
+        schema_name: str = "website_report",
+        on_partial: PartialHook | None = None,
+    ) -> dict[str, Any]:
+        body = self._request_body(prompt, schema, schema_name)
+        if on_partial is not None:
+            text = await collect_stream(self._stream_text(body), on_partial)
+            if not text.strip():
+                raise GrokContentError("Grok stream returned no text")
+        else:
+            response = await self._transport.post(self._url, json=body)
+            payload = response.json()
+            text = _extract_text(payload)
+        with span("llm.parse", provider="Grok"):
+            try:
+                return json.loads(text)
+            except json.JSONDecodeError as exc:  # pragma: no cover - depends on remote output
+                raise GrokContentError(f"Grok returned invalid JSON: {text}") from exc
 
     async def aclose(self) -> None:
-        await self._client.aclose()
+        await self._transport.aclose()
+
+    @property
+    def _url(self) -> str:
+        return f"{self.settings.grok_base_url.rstrip('/')}/chat/completions"
+
+    def _request_body(
+        self, prompt: str, schema: dict[str, Any], schema_name: str
+    ) -> dict[str, Any]:
+        return {
+            "model": self.settings.grok_model,
+            "temperature": 0.2,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": (
+                        "You are Grok, an investigator who converts crawl data into concise, "
+                        "actionable website summaries. Respond strictly with JSON."
+                    ),
+                },
+                {"role": "user", "content": prompt},
+            ],
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {
+                    "name": schema_name,
+                    "schema": schema,
+                },
+            },
+        }
+
+    async def _stream_text(self, body: dict[str, Any]) -> AsyncIterator[str]:
+        lines = self._transport.stream_lines(self._url, json={**body, "stream": True})
+        async for data in sse_events(lines):
+            for choice in json.loads(data).get("choices") or []:
+                if content := (choice.get("delta") or {}).get("content"):
+                    yield content
 
 
 def _extract_text(payload: dict[str, Any]) -> str:
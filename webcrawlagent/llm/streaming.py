@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from typing import Any
+
+PartialHook = Callable[[dict[str, Any]], Awaitable[None]]
+
+_CLOSERS = {"{": "}", "[": "]"}
+_PARTIAL_UNICODE = re.compile(r"\\u[0-9a-fA-F]{0,3}$")
+
+
+class IncrementalJsonParser:
+    """Turns a growing JSON document into best-effort snapshots of what has arrived.
+
+    ``feed`` scans only the new characters and remembers the last position where the
+    document could be cut and closed (after a complete value, before a comma, right
+    after an opening bracket). ``snapshot`` closes the document from there, so partial
+    objects and arrays parse; a string value that is still streaming is included
+    as-is. Leading text before the first bracket (e.g. a Markdown fence) is skipped.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[str] = []
+        self._buffer = ""
+        self._stack: list[str] = []
+        self._expect_key: list[bool] = []
+        self._in_string = False
+        self._string_is_key = False
+        self._escape = False
+        self._started = False
+        self._safe: tuple[int, str] | None = None
+        self.done = False
+
+    @property
+    def text(self) -> str:
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> None:
+        self._chunks.append(chunk)
+        if self.done:
+            return
+        if not self._started:
+            start = _first_bracket(chunk)
+            if start == -1:
+                return
+            self._started = True
+            chunk = chunk[start:]
+        base = len(self._buffer)
+        self._buffer += chunk
+        for offset, char in enumerate(chunk):
+            index = base + offset
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if not self._string_is_key:
+                        self._mark_safe(index + 1)
+                continue
+            self._scan_structural(char, index)
+            if self.done:
+                self._buffer = self._buffer[: index + 1]
+                return
+
+    def snapshot(self) -> Any | None:
+        """Parse what has arrived so far, or ``None`` if nothing is usable yet."""
+        if not self._started:
+            return None
+        if self.done:
+            candidate = self._buffer
+        elif self._in_string and not self._string_is_key:
+            candidate = _trim_escape(self._buffer, self._escape) + '"' + self._closers()
+        elif self._safe is not None:
+            index, closers = self._safe
+            candidate = self._buffer[:index] + closers
+        else:
+            return None
+        try:
+            return json.loads(candidate)
+        except json.JSONDecodeError:
+            return None
+
+    def _scan_structural(self, char: str, index: int) -> None:
+        if char in _CLOSERS:
+            self._stack.append(char)
+            self._expect_key.append(char == "{")
+            self._mark_safe(index + 1)
+        elif char in "}]":
+            if self._stack:
+                self._stack.pop()
+                self._expect_key.pop()
+            if not self._stack:
+                self.done = True
+                return
+            self._mark_safe(index + 1)
+        elif char == '"':
+            self._in_string = True
+            self._string_is_key = bool(self._expect_key and self._expect_key[-1])
+        elif char == ":":
+            if self._expect_key:
+                self._expect_key[-1] = False
+        elif char == ",":
+            self._mark_safe(index)
+            if self._stack and self._stack[-1] == "{":
+                self._expect_key[-1] = True
+
+    def _mark_safe(self, index: int) -> None:
+        self._safe = (index, self._closers())
+
+    def _closers(self) -> str:
+        return "".join(_CLOSERS[opener] for opener in reversed(self._stack))
+
+
+async def collect_stream(deltas: AsyncIterable[str], on_partial: PartialHook) -> str:
+    """Drain ``deltas``, reporting each changed partial object; returns the full text."""
+    parser = IncrementalJsonParser()
+    last: dict[str, Any] | None = None
+    async for delta in deltas:
+        parser.feed(delta)
+        snapshot = parser.snapshot()
+        if isinstance(snapshot, dict) and snapshot and snapshot != last:
+            last = snapshot
+            await on_partial(snapshot)
+    return parser.text
+
+
+async def sse_events(lines: AsyncIterable[str]) -> AsyncIterator[str]:
+    """Yield the ``data:`` payload of each server-sent event, stopping at ``[DONE]``."""
+    data: list[str] = []
+    async for line in lines:
+        if line.startswith("data:"):
+            data.append(line[5:].lstrip())
+            continue
+        if line.strip() or not data:
+            continue
+        payload = "\n".join(data)
+        data = []
+        if payload == "[DONE]":
+            return
+        yield payload
+    if data and (payload := "\n".join(data)) != "[DONE]":
+        yield payload
+
+
+def _first_bracket(text: str) -> int:
+    positions = [pos for pos in (text.find("{"), text.find("[")) if pos != -1]
+    return min(positions, default=-1)
+
+
+def _trim_escape(text: str, dangling: bool) -> str:
+    # Drop a dangling backslash or a half-received \uXXXX escape at the very end.
+    if dangling:
+        return text[:-1]
+    match = _PARTIAL_UNICODE.search(text)
+    if match:
+        head = text[: match.start()]
+        if (len(head) - len(head.rstrip("\\"))) % 2 == 0:
+            return head
+    return text
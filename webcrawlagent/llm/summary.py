@@ -2,14 +2,31 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any
+from typing import Any, Literal, Protocol
 
 from webcrawlagent.crawler.analyzer import AnalysisSummary
 from webcrawlagent.crawler.extractor import CrawlResult
+from webcrawlagent.llm.streaming import PartialHook
 from webcrawlagent.report.models import SiteSummary
 
 logger = logging.getLogger(__name__)
 
+# Why the LLM produced no summary -> what the fallback report recommends instead.
+FALLBACK_RECOMMENDATIONS: dict[str, list[str]] = {
+    "blocked": [
+        "Review the crawler output manually because the LLM blocked the content.",
+        "Retry with sanitized text or a different site if you need an AI-authored summary.",
+    ],
+    "unavailable": [
+        "Review the crawler output manually because the LLM provider was unavailable.",
+        "Retry later for an AI-authored summary once the provider is reachable again.",
+    ],
+}
+
+# Page-summary keys that describe content; crawl telemetry (timings, fetch tier, cache
+# state) is left out so an unchanged site always yields a byte-identical prompt.
+PROMPT_PAGE_FIELDS = ("url", "title", "description", "headings", "word_count", "status")
+
 SUMMARY_SCHEMA: dict[str, Any] = {
     "type": "object",
     "properties": {
@@ -22,20 +39,40 @@ SUMMARY_SCHEMA: dict[str, Any] = {
 }
 
 
+class JsonGenerator(Protocol):
+    """Anything that can turn a prompt into JSON matching ``schema`` (clients, caches).
+
+    With ``on_partial`` the response is streamed and each partial object is reported
+    as it grows.
+    """
+
+    @property
+    def model_name(self) -> str: ...
+
+    async def generate_json(
+        self,
+        prompt: str,
+        schema: dict[str, Any],
+        *,
+        schema_name: str = "website_report",
+        on_partial: PartialHook | None = None,
+    ) -> dict[str, Any]: ...
+
+
+async def summarize_crawl(
+    client: JsonGenerator, crawl: CrawlResult, analysis: AnalysisSummary, max_tokens: int
+) -> SiteSummary:
+    prompt = build_summary_prompt(crawl, analysis, max_tokens)
+    payload = await client.generate_json(prompt, SUMMARY_SCHEMA)
+    return SiteSummary.from_llm_payload(payload)
+
+
 def build_summary_prompt(
     crawl: CrawlResult, analysis: AnalysisSummary, max_tokens: int
 ) -> str:
     content_chunks = crawl.aggregate_text(max_tokens)
     context = "\n\n".join(content_chunks)
-    summary_metadata = json.dumps(
-        {
-            "root_url": analysis.root_url,
-            "pages": analysis.page_summaries,
-            "keywords": analysis.keywords,
-            "cta_links": analysis.ctas,
-        },
-        ensure_ascii=False,
-    )
+    summary_metadata = build_summary_metadata(analysis)
     instructions = (
         "You are an analyst generating a concise website briefing. "
         "Blend the structured metadata with the raw text to produce actionable insight."
@@ -55,10 +92,32 @@ def build_summary_prompt(
     )
 
 
+def build_summary_metadata(analysis: AnalysisSummary) -> str:
+    return json.dumps(
+        {
+            "root_url": analysis.root_url,
+            "pages": [
+                {key: page.get(key) for key in PROMPT_PAGE_FIELDS}
+                for page in analysis.page_summaries
+            ],
+            "keywords": analysis.keywords,
+            "cta_links": analysis.ctas,
+        },
+        ensure_ascii=False,
+    )
+
+
 def build_fallback_summary(
-    crawl: CrawlResult, analysis: AnalysisSummary, *, reason: str
+    crawl: CrawlResult,
+    analysis: AnalysisSummary,
+    *,
+    reason: str,
+    cause: Literal["blocked", "unavailable"] = "blocked",
 ) -> SiteSummary:
-    """Construct a deterministic summary when an LLM output is unavailable."""
+    """Construct a deterministic summary when an LLM output is unavailable.
+
+    ``cause`` says whether the provider refused the content or could not be reached.
+    """
     sections: list[str] = []
     for page in analysis.page_summaries[:3]:
         snippet = (
@@ -81,10 +140,7 @@ def build_fallback_summary(
     if analysis.ctas:
         highlights.append("Detected CTAs: " + ", ".join(analysis.ctas[:5]))
 
-    recommendations = [
-        "Review the crawler output manually because the LLM blocked the content.",
-        "Retry with sanitized text or a different site if you need an AI-authored summary.",
-    ]
+    recommendations = list(FALLBACK_RECOMMENDATIONS[cause])
 
     overview = (
         f"Crawled {analysis.total_pages} page(s) from {analysis.root_url}. "
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import random
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+
+from webcrawlagent.config import Settings
+from webcrawlagent.llm.exceptions import LLMUnavailableError
+from webcrawlagent.metrics import LLM_RETRIES, span
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS = frozenset({408, 409, 425, 429, 500, 502, 503, 504})
+
+
+class CircuitBreaker:
+    """Closed -> open after ``threshold`` consecutive failures; one probe after ``reset_after``."""
+
+    def __init__(self, threshold: int, reset_after: float):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_after:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half-open" and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probing = False
+        if self._opened_at is not None or self.failures >= self.threshold:
+            self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """End a half-open probe without a verdict (cancelled, or rejected as a bad request)."""
+        self._probing = False
+
+
+class LatencyTracker:
+    """Rolling window of successful request latencies (seconds)."""
+
+    def __init__(self, window: int = 200):
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, pct: float, *, min_samples: int = 1) -> float | None:
+        if len(self._samples) < min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(int(len(ordered) * pct / 100), len(ordered) - 1)
+        return ordered[index]
+
+
+class LLMTransport:
+    """Shared HTTP layer for the LLM clients.
+
+    Wraps one pooled ``httpx.AsyncClient`` (HTTP/2 when ``h2`` is installed) with
+    jittered exponential retries that honor ``Retry-After``, optional hedging once a
+    request outlives the observed p95 latency, and a circuit breaker that fails fast
+    with ``LLMUnavailableError`` while the provider is unhealthy.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        name: str,
+        timeout: float,
+        headers: dict[str, str] | None = None,
+        client: httpx.AsyncClient | None = None,
+    ):
+        self.settings = settings
+        self.name = name
+        self.breaker = CircuitBreaker(settings.llm_breaker_threshold, settings.llm_breaker_reset)
+        self.latency = LatencyTracker()
+        self.hedged_requests = 0
+        self._client = client or httpx.AsyncClient(
+            timeout=timeout,
+            headers=headers,
+            http2=settings.llm_http2 and _http2_available(),
+            limits=httpx.Limits(
+                max_connections=settings.llm_max_connections,
+                max_keepalive_connections=settings.llm_max_connections,
+            ),
+        )
+
+    async def post(
+        self, url: str, *, json: dict[str, Any], params: dict[str, str] | None = None
+    ) -> httpx.Response:
+        """POST with retries; non-retryable 4xx responses raise ``httpx.HTTPStatusError``."""
+        with span("llm.request", provider=self.name):
+            return await self._request(url, json=json, params=params, stream=False)
+
+    async def stream_lines(
+        self, url: str, *, json: dict[str, Any], params: dict[str, str] | None = None
+    ) -> AsyncIterator[str]:
+        """POST and yield the response body line by line as it arrives.
+
+        Retries cover establishing the response only; once lines have been yielded a
+        dropped connection surfaces as ``LLMUnavailableError``. Streams are never hedged.
+        The ``llm.request`` span covers the whole stream.
+        """
+        with span("llm.request", provider=self.name, stream=True):
+            response = await self._request(url, json=json, params=params, stream=True)
+            try:
+                async for line in response.aiter_lines():
+                    yield line
+            except httpx.TransportError as exc:
+                self.breaker.record_failure()
+                raise LLMUnavailableError(f"{self.name} stream interrupted: {exc}") from exc
+            finally:
+                await response.aclose()
+
+    async def _request(
+        self, url: str, *, json: dict[str, Any], params: dict[str, str] | None, stream: bool
+    ) -> httpx.Response:
+        probe = self.breaker.state != "closed"
+        if not self.breaker.allow():
+            raise LLMUnavailableError(f"{self.name} circuit breaker is open")
+        try:
+            return await self._attempts(url, json=json, params=params, stream=stream)
+        finally:
+            # A probe that neither succeeded nor failed (4xx, cancellation) must not leave
+            # the breaker waiting for a verdict forever.
+            if probe:
+                self.breaker.release()
+
+    async def _attempts(
+        self, url: str, *, json: dict[str, Any], params: dict[str, str] | None, stream: bool
+    ) -> httpx.Response:
+        attempts = self.settings.llm_max_retries + 1
+        reason = "no attempt made"
+        for attempt in range(attempts):
+            retry_after: float | None = None
+            try:
+                if stream:
+                    request = self._client.build_request("POST", url, json=json, params=params)
+                    response = await self._client.send(request, stream=True)
+                else:
+                    response = await self._send(url, json=json, params=params)
+            except httpx.TransportError as exc:
+                reason = f"{type(exc).__name__}: {exc}"
+            else:
+                if response.is_success:
+                    self.breaker.record_success()
+                    return response
+                if stream:
+                    await response.aread()
+                    await response.aclose()
+                if response.status_code not in RETRYABLE_STATUS:
+                    response.raise_for_status()
+                reason = f"HTTP {response.status_code}"
+                retry_after = _retry_after(response)
+            if attempt + 1 < attempts:
+                LLM_RETRIES.inc(provider=self.name)
+                delay = self._backoff(attempt) if retry_after is None else retry_after
+                delay = min(delay, self.settings.llm_retry_max_delay)
+                logger.info("%s request failed (%s); retrying in %.2fs", self.name, reason, delay)
+                await asyncio.sleep(delay)
+        self.breaker.record_failure()
+        raise LLMUnavailableError(f"{self.name} unavailable after {attempts} attempt(s): {reason}")
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _send(
+        self, url: str, *, json: dict[str, Any], params: dict[str, str] | None
+    ) -> httpx.Response:
+        started = time.perf_counter()
+        threshold = (
+            self.latency.percentile(95, min_samples=self.settings.llm_hedge_min_samples)
+            if self.settings.llm_hedge_enabled
+            else None
+        )
+        if threshold is None:
+            response = await self._client.post(url, json=json, params=params)
+        else:
+            response = await self._hedged(url, json=json, params=params, after=threshold)
+        if response.is_success:
+            self.latency.record(time.perf_counter() - started)
+        return response
+
+    async def _hedged(
+        self, url: str, *, json: dict[str, Any], params: dict[str, str] | None, after: float
+    ) -> httpx.Response:
+        primary = asyncio.create_task(self._client.post(url, json=json, params=params))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=after)
+            if done:
+                return primary.result()
+            self.hedged_requests += 1
+            tasks.add(asyncio.create_task(self._client.post(url, json=json, params=params)))
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and task.result().is_success:
+                        return task.result()
+            # Neither copy succeeded; surface the primary's outcome to the retry loop.
+            return primary.result()
+        finally:
+            # Also runs when the caller is cancelled mid-race: no copy may outlive it.
+            losers = [task for task in tasks if not task.done()]
+            for task in losers:
+                task.cancel()
+            if losers:
+                await asyncio.gather(*losers, return_exceptions=True)
+
+    def _backoff(self, attempt: int) -> float:
+        settings = self.settings
+        ceiling = min(settings.llm_retry_max_delay, settings.llm_retry_base_delay * 2**attempt)
+        return random.uniform(0, ceiling)
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(moment.timestamp() - time.time(), 0.0)
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
@@ -3,11 +3,13 @@ from __future__ import annotations
 from pathlib import Path
 
 from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 
 from webcrawlagent.app.api import router as agent_router
-from webcrawlagent.app.dependencies import shutdown_service
+from webcrawlagent.app.dependencies import shutdown_service, startup_service
+from webcrawlagent.config import get_settings
+from webcrawlagent.metrics import CONTENT_TYPE, REGISTRY
 
 
 def create_app() -> FastAPI:
@@ -22,6 +24,16 @@ def create_app() -> FastAPI:
         async def index():
             return HTMLResponse((static_dir / "index.html").read_text(encoding="utf-8"))
 
+    if get_settings().metrics_enabled:
+
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics():
+            return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+    @app.on_event("startup")
+    async def _startup():
+        await startup_service()
+
     @app.on_event("shutdown")
     async def _shutdown():
         await shutdown_service()
@@ -0,0 +1,277 @@
+"""In-process counters, histograms and timing spans, rendered in Prometheus text format.
+
+Metrics are process-global and cheap to update from any thread. ``span()`` times a block
+into ``webcrawl_stage_seconds``, counts exceptions in ``webcrawl_failures_total`` and,
+inside ``trace_scope(True)``, also appends the span to the current job's ``Trace``. The
+trace lives in a context variable, so tasks spawned by a job (page visits, map-stage LLM
+calls) report into it while concurrent jobs stay separate.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...]):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        if labels.keys() != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: tuple[str, ...], **extra: str) -> str:
+        pairs = [*zip(self.labelnames, key, strict=True), *extra.items()]
+        if not pairs:
+            return ""
+        return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: dict[tuple[str, ...], float] = {} if labelnames else {(): 0.0}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> list[str]:
+        lines = super().render()
+        with self._lock:
+            values = sorted(self._values.items())
+        lines.extend(f"{self.name}{self._labels(key)} {_number(value)}" for key, value in values)
+        return lines
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: one count per bucket plus +Inf, then sum.
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._series.setdefault(key, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[index] += 1
+            total[0] += value
+
+    def count(self, **labels: Any) -> int:
+        series = self._series.get(self._key(labels))
+        return sum(series[0]) if series else 0
+
+    def render(self) -> list[str]:
+        lines = super().render()
+        with self._lock:
+            series = sorted((key, (list(c), t[0])) for key, (c, t) in self._series.items())
+        for key, (counts, total) in series:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts, strict=True):
+                cumulative += count
+                labels = self._labels(key, le=_number(bound))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            lines.append(f"{self.name}_sum{self._labels(key)} {_number(total)}")
+            lines.append(f"{self.name}_count{self._labels(key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def counter(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        metric = Counter(name, help, labelnames)
+        self._register(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, help, labelnames, buckets)
+        self._register(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: _Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+
+REGISTRY = Registry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "webcrawl_stage_seconds", "Time spent in each pipeline stage", ("stage",)
+)
+FAILURES = REGISTRY.counter(
+    "webcrawl_failures_total", "Exceptions raised inside a stage, by type", ("stage", "error")
+)
+PAGES = REGISTRY.counter("webcrawl_pages_total", "Pages captured, by fetch tier", ("tier",))
+PAGE_BYTES = REGISTRY.counter(
+    "webcrawl_page_bytes_total", "UTF-8 bytes of extracted page text, by fetch tier", ("tier",)
+)
+BLOCKED_REQUESTS = REGISTRY.counter(
+    "webcrawl_blocked_requests_total", "Browser subrequests dropped by the resource blocker"
+)
+CACHE_LOOKUPS = REGISTRY.counter(
+    "webcrawl_cache_lookups_total", "Page and LLM cache lookups, by outcome", ("cache", "result")
+)
+LLM_RETRIES = REGISTRY.counter(
+    "webcrawl_llm_retries_total", "LLM requests retried after a failure", ("provider",)
+)
+LLM_TOKENS = REGISTRY.counter(
+    "webcrawl_llm_tokens_total", "Estimated LLM tokens, by summary stage", ("stage", "kind")
+)
+JOBS = REGISTRY.counter("webcrawl_jobs_total", "API jobs finished, by status", ("status",))
+
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    start_ms: float
+    duration_ms: float = 0.0
+    error: str | None = None
+    attrs: dict[str, Any] = field(default_factory=dict)
+
+
+class Trace:
+    """Spans recorded for one analysis, with start offsets relative to the trace."""
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter()
+        self.spans: list[Span] = []
+
+    def export(self) -> dict[str, Any]:
+        """Spans in start order plus per-stage totals, slowest stage first."""
+        spans = sorted(self.spans, key=lambda span: span.start_ms)
+        stages: dict[str, dict[str, float]] = {}
+        for span in spans:
+            row = stages.setdefault(span.name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            row["count"] += 1
+            row["total_ms"] = round(row["total_ms"] + span.duration_ms, 1)
+            row["max_ms"] = max(row["max_ms"], span.duration_ms)
+        return {
+            "stages": dict(sorted(stages.items(), key=lambda item: -item[1]["total_ms"])),
+            "spans": [
+                {
+                    "name": span.name,
+                    "start_ms": span.start_ms,
+                    "duration_ms": span.duration_ms,
+                    **({"error": span.error} if span.error else {}),
+                    **span.attrs,
+                }
+                for span in spans
+            ],
+        }
+
+
+_current_trace: ContextVar[Trace | None] = ContextVar("webcrawl_trace", default=None)
+
+
+@contextmanager
+def trace_scope(enabled: bool) -> Iterator[Trace | None]:
+    """Collect spans from this context (and tasks it spawns) into a new ``Trace``."""
+    if not enabled:
+        yield None
+        return
+    trace = Trace()
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Span]:
+    """Time the block as stage ``name``; ``duration_ms`` is set on the span when it exits."""
+    trace = _current_trace.get()
+    started = time.perf_counter()
+    record = Span(name, _offset_ms(trace, started), attrs=attrs)
+    try:
+        yield record
+    except Exception as exc:
+        mark_failed(record, exc)
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        record.duration_ms = round(elapsed * 1000, 1)
+        STAGE_SECONDS.observe(elapsed, stage=name)
+        if trace is not None:
+            trace.spans.append(record)
+
+
+def mark_failed(record: Span, exc: BaseException) -> None:
+    """Flag a span whose exception was handled inside it, e.g. by a fallback."""
+    record.error = type(exc).__name__
+    FAILURES.inc(stage=record.name, error=record.error)
+
+
+def observe_span(name: str, duration_ms: float, **attrs: Any) -> None:
+    """Record a stage timed elsewhere (e.g. in a worker process) as ending now."""
+    STAGE_SECONDS.observe(duration_ms / 1000, stage=name)
+    trace = _current_trace.get()
+    if trace is not None:
+        start_ms = max(0.0, _offset_ms(trace, time.perf_counter()) - duration_ms)
+        trace.spans.append(Span(name, round(start_ms, 1), round(duration_ms, 1), attrs=attrs))
+
+
+def _offset_ms(trace: Trace | None, moment: float) -> float:
+    return round((moment - trace.origin) * 1000, 1) if trace else 0.0
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
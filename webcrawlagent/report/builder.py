@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import multiprocessing
+import time
 from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from uuid import uuid4
 
@@ -8,8 +14,11 @@ from fpdf import FPDF
 from fpdf.enums import XPos, YPos
 
 from webcrawlagent.config import Settings
+from webcrawlagent.metrics import observe_span, span
 from webcrawlagent.report.models import ReportPayload
 
+logger = logging.getLogger(__name__)
+
 TITLE = "Summary Report"
 LEFT_MARGIN = 20
 RIGHT_MARGIN = 20
@@ -19,91 +28,156 @@ LINE_HEIGHT = 6
 
 
 class PdfReportBuilder:
+    """Renders ``ReportPayload``s to PDF files under ``REPORT_OUTPUT_DIR``.
+
+    ``build_async`` runs the FPDF layout on the ``REPORT_EXECUTOR`` pool (``process``,
+    ``thread`` or ``inline``) so rendering never blocks the event loop.
+    """
+
     def __init__(self, settings: Settings):
         self.settings = settings
         self.output_dir = self.settings.ensure_report_dir()
+        self._executor: Executor | None = None
 
     def build(self, payload: ReportPayload) -> Path:
-        pdf = FPDF()
-        pdf.set_auto_page_break(auto=True, margin=TOP_MARGIN)
-        pdf.set_margins(LEFT_MARGIN, TOP_MARGIN, RIGHT_MARGIN)
-        pdf.add_page()
-
-        self._write_header(pdf, payload)
-        self._section(pdf, "Overview", [payload.summary.overview], emphasize=True)
-        self._section(pdf, "Key Sections", payload.summary.sections)
-        self._section(pdf, "Highlights", payload.summary.highlights)
-        self._section(pdf, "Recommendations", payload.summary.recommendations)
-
-        metrics_lines = [
-            f"Pages crawled: {payload.metrics.total_pages}",
-            f"Internal links: {payload.metrics.internal_links}",
-            f"External links: {payload.metrics.external_links}",
-            f"Top keywords: {', '.join(payload.metrics.keywords[:8]) or 'n/a'}",
-            f"CTA links detected: {len(payload.metrics.ctas)}",
-        ]
-        self._section(pdf, "Crawl Metrics", metrics_lines)
-
-        file_name = (payload.summary.overview[:30] or payload.url or "summary").strip()
-        safe_name = "".join(ch if ch.isalnum() else "-" for ch in file_name).strip("-") or "summary"
-        output_path = self.output_dir / f"{safe_name}-{uuid4().hex[:8]}.pdf"
-        pdf.output(str(output_path))
+        with span("report.render"):
+            output_path = render_report(payload, self.output_dir)
         payload.pdf_path = str(output_path)
         return output_path
 
-    def _write_header(self, pdf: FPDF, payload: ReportPayload) -> None:
-        pdf.set_fill_color(32, 44, 60)
-        pdf.set_text_color(255, 255, 255)
-        pdf.set_font("helvetica", "B", 18)
-        pdf.cell(
-            0,
-            14,
-            TITLE,
-            new_x=XPos.LMARGIN,
-            new_y=YPos.NEXT,
-            align="C",
-            fill=True,
-        )
-        pdf.set_text_color(0, 0, 0)
-        pdf.ln(4)
-
-        pdf.set_font("helvetica", size=11)
-        pdf.cell(0, LINE_HEIGHT + 1, f"Source: {payload.url}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
-        generated = payload.generated_at.strftime("%Y-%m-%d %H:%M UTC")
-        pdf.cell(0, LINE_HEIGHT + 1, f"Generated: {generated}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
-        pdf.ln(4)
-
-    def _section(
-        self, pdf: FPDF, title: str, lines: Iterable[str], *, emphasize: bool = False
-    ) -> None:
-        pdf.set_fill_color(237, 240, 245)
-        pdf.set_font("helvetica", "B", 13)
-        pdf.cell(
-            0,
-            9,
-            title,
-            new_x=XPos.LMARGIN,
-            new_y=YPos.NEXT,
-            fill=True,
-        )
-        pdf.set_font("helvetica", "B" if emphasize else "", 11)
-        self._write_lines(pdf, lines, emphasize=emphasize)
-        pdf.ln(SECTION_SPACING)
-
-    def _write_lines(self, pdf: FPDF, lines: Iterable[str], *, emphasize: bool = False) -> None:
-        pdf.set_font("helvetica", "B" if emphasize else "", 11)
-        sanitized = [self._clean(line) for line in lines if self._clean(line)]
-        if not sanitized:
-            pdf.multi_cell(0, LINE_HEIGHT, "— (no data available)")
-            return
-
-        for line in sanitized:
-            prefix = "- " if not emphasize else ""
-            pdf.set_x(pdf.l_margin + (0 if emphasize else 2))
-            pdf.multi_cell(0, LINE_HEIGHT, f"{prefix}{line}", align="L")
-
-    @staticmethod
-    def _clean(text: str | None) -> str:
-        if not text:
-            return ""
-        return " ".join(text.split())
+    async def build_async(self, payload: ReportPayload) -> Path:
+        """Render off the event loop; sets ``payload.pdf_path`` and ``payload.render_ms``."""
+        executor = self._get_executor()
+        if executor is None:
+            path, render_ms = _render_timed(payload, self.output_dir)
+        else:
+            loop = asyncio.get_running_loop()
+            try:
+                path, render_ms = await loop.run_in_executor(
+                    executor, _render_timed, payload, self.output_dir
+                )
+            except BrokenProcessPool:
+                logger.warning("Report worker pool died; rendering this report in a thread")
+                # A concurrent render may already have replaced the broken pool.
+                if self._executor is executor:
+                    self._executor = None
+                    executor.shutdown(wait=False, cancel_futures=True)
+                path, render_ms = await asyncio.to_thread(_render_timed, payload, self.output_dir)
+        payload.pdf_path = str(path)
+        payload.render_ms = render_ms
+        observe_span("report.render", render_ms)
+        return path
+
+    def close(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor | None:
+        if self._executor is None:
+            workers = self.settings.report_workers
+            if self.settings.report_executor == "process":
+                # spawn: forking a process that runs browser threads is not safe.
+                context = multiprocessing.get_context("spawn")
+                self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+            elif self.settings.report_executor == "thread":
+                self._executor = ThreadPoolExecutor(
+                    max_workers=workers, thread_name_prefix="report"
+                )
+        return self._executor
+
+
+def render_report(payload: ReportPayload, output_dir: Path) -> Path:
+    """Lay out ``payload`` and write it to a new PDF in ``output_dir``.
+
+    Module-level and free of shared state so it can run in a worker process.
+    """
+    pdf = FPDF()
+    pdf.set_auto_page_break(auto=True, margin=TOP_MARGIN)
+    pdf.set_margins(LEFT_MARGIN, TOP_MARGIN, RIGHT_MARGIN)
+    pdf.add_page()
+
+    _write_header(pdf, payload)
+    _section(pdf, "Overview", [payload.summary.overview], emphasize=True)
+    _section(pdf, "Key Sections", payload.summary.sections)
+    _section(pdf, "Highlights", payload.summary.highlights)
+    _section(pdf, "Recommendations", payload.summary.recommendations)
+
+    metrics_lines = [
+        f"Pages crawled: {payload.metrics.total_pages}",
+        f"Internal links: {payload.metrics.internal_links}",
+        f"External links: {payload.metrics.external_links}",
+        f"Top keywords: {', '.join(payload.metrics.keywords[:8]) or 'n/a'}",
+        f"CTA links detected: {len(payload.metrics.ctas)}",
+    ]
+    _section(pdf, "Crawl Metrics", metrics_lines)
+
+    file_name = (payload.summary.overview[:30] or payload.url or "summary").strip()
+    safe_name = "".join(ch if ch.isalnum() else "-" for ch in file_name).strip("-") or "summary"
+    output_path = output_dir / f"{safe_name}-{uuid4().hex[:8]}.pdf"
+    pdf.output(str(output_path))
+    return output_path
+
+
+def _render_timed(payload: ReportPayload, output_dir: Path) -> tuple[Path, float]:
+    started = time.perf_counter()
+    path = render_report(payload, output_dir)
+    return path, round((time.perf_counter() - started) * 1000, 1)
+
+
+def _write_header(pdf: FPDF, payload: ReportPayload) -> None:
+    pdf.set_fill_color(32, 44, 60)
+    pdf.set_text_color(255, 255, 255)
+    pdf.set_font("helvetica", "B", 18)
+    pdf.cell(
+        0,
+        14,
+        TITLE,
+        new_x=XPos.LMARGIN,
+        new_y=YPos.NEXT,
+        align="C",
+        fill=True,
+    )
+    pdf.set_text_color(0, 0, 0)
+    pdf.ln(4)
+
+    pdf.set_font("helvetica", size=11)
+    pdf.cell(0, LINE_HEIGHT + 1, f"Source: {payload.url}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    generated = payload.generated_at.strftime("%Y-%m-%d %H:%M UTC")
+    pdf.cell(0, LINE_HEIGHT + 1, f"Generated: {generated}", new_x=XPos.LMARGIN, new_y=YPos.NEXT)
+    pdf.ln(4)
+
+
+def _section(pdf: FPDF, title: str, lines: Iterable[str], *, emphasize: bool = False) -> None:
+    pdf.set_fill_color(237, 240, 245)
+    pdf.set_font("helvetica", "B", 13)
+    pdf.cell(
+        0,
+        9,
+        title,
+        new_x=XPos.LMARGIN,
+        new_y=YPos.NEXT,
+        fill=True,
+    )
+    pdf.set_font("helvetica", "B" if emphasize else "", 11)
+    _write_lines(pdf, lines, emphasize=emphasize)
+    pdf.ln(SECTION_SPACING)
+
+
+def _write_lines(pdf: FPDF, lines: Iterable[str], *, emphasize: bool = False) -> None:
+    pdf.set_font("helvetica", "B" if emphasize else "", 11)
+    sanitized = [_clean(line) for line in lines if _clean(line)]
+    if not sanitized:
+        pdf.multi_cell(0, LINE_HEIGHT, "— (no data available)")
+        return
+
+    for line in sanitized:
+        prefix = "- " if not emphasize else ""
+        pdf.set_x(pdf.l_margin + (0 if emphasize else 2))
+        pdf.multi_cell(0, LINE_HEIGHT, f"{prefix}{line}", align="L")
+
+
+def _clean(text: str | None) -> str:
+    if not text:
+        return ""
+    return " ".join(text.split())
@@ -30,3 +30,4 @@ class ReportPayload:
     metrics: AnalysisSummary
     generated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
     pdf_path: str | None = None
+    render_ms: float | None = None
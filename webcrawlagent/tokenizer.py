@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import math
+from collections import Counter
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Protocol
+
+from webcrawlagent.config import Settings
+
+# Average characters per token (including the separating space) for English prose.
+# Override with TOKENIZER_CHARS_PER_TOKEN after comparing against the provider's own
+# token counter on representative pages.
+PROVIDER_CHARS_PER_TOKEN = {"gemini": 4.0, "grok": 3.8}
+DEFAULT_CHARS_PER_TOKEN = 4.0
+
+
+class Tokenizer(Protocol):
+    name: str
+
+    def count(self, text: str) -> int: ...
+
+    def cumulative(self, words: Sequence[str]) -> list[int]:
+        """Token count of ``words[:i + 1]`` for every ``i``; non-decreasing."""
+        ...
+
+
+class ApproxTokenizer:
+    """Offline estimate: each word costs ``(len(word) + 1) / chars_per_token`` tokens, min 1.
+
+    Cumulative counts are rounded up so trimming to a budget never overshoots it.
+    """
+
+    def __init__(self, chars_per_token: float = DEFAULT_CHARS_PER_TOKEN, name: str = "approx"):
+        self.chars_per_token = chars_per_token
+        self.name = name
+
+    def count(self, text: str) -> int:
+        scale = self.chars_per_token
+        return math.ceil(sum(max(1.0, (len(word) + 1) / scale) for word in text.split()))
+
+    def cumulative(self, words: Sequence[str]) -> list[int]:
+        scale = self.chars_per_token
+        total = 0.0
+        counts: list[int] = []
+        for word in words:
+            total += max(1.0, (len(word) + 1) / scale)
+            counts.append(math.ceil(total))
+        return counts
+
+
+@lru_cache(maxsize=8)
+def get_tokenizer(provider: str = "", chars_per_token: float | None = None) -> Tokenizer:
+    """Approximate tokenizer calibrated for ``provider`` unless a ratio is given."""
+    ratio = chars_per_token or PROVIDER_CHARS_PER_TOKEN.get(provider, DEFAULT_CHARS_PER_TOKEN)
+    return ApproxTokenizer(ratio, name=f"approx:{provider or 'default'}:{ratio:g}")
+
+
+def tokenizer_for(settings: Settings) -> Tokenizer:
+    return get_tokenizer(settings.llm_provider.lower(), settings.tokenizer_chars_per_token)
+
+
+def index_words(
+    text: str, tokenizer: Tokenizer, counts: Counter[str] | None = None
+) -> tuple[list[int], list[int]]:
+    """Cumulative token counts and end character offsets for each word of ``text``.
+
+    ``text`` must already be whitespace-collapsed (single spaces), as produced by the
+    crawler, so that ``text[:char_ends[i]]`` is exactly the first ``i + 1`` words. When
+    ``counts`` is given it is updated with the words from the same split.
+    """
+    if not text:
+        return [], []
+    words = text.split(" ")
+    if counts is not None:
+        counts.update(words)
+    char_ends: list[int] = []
+    offset = -1
+    for word in words:
+        offset += len(word) + 1
+        char_ends.append(offset)
+    return tokenizer.cumulative(words), char_ends